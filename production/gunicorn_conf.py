@@ -1,8 +1,25 @@
 import multiprocessing
+import os
+from typing import Any
+
+# Postgres connections this app may hold: every request thread keeps one open (CONN_MAX_AGE)
+# and every background worker thread (BACKGROUND_WORKERS) opens one while it runs.
+# Keep it below max_connections minus what the bot, cron commands and admins need.
+DATABASE_CONNECTION_BUDGET = int(os.getenv("DATABASE_CONNECTION_BUDGET", "80"))
+BACKGROUND_WORKERS = int(os.getenv("BACKGROUND_WORKERS", "2"))
 
 bind = "127.0.0.1:8000"
-workers = multiprocessing.cpu_count() * 2 + 1
-worker_class = "sync"
+
+# Threaded workers: a request waiting on Sheets, Telegram or S3 blocks one thread instead of a whole process.
+# Django and DRF are synchronous, so gthread gives the concurrency without running them under an event loop.
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", "8"))
+workers = int(
+    os.getenv(
+        "GUNICORN_WORKERS",
+        str(max(1, min(multiprocessing.cpu_count() + 1, DATABASE_CONNECTION_BUDGET // (threads + BACKGROUND_WORKERS)))),
+    )
+)
 timeout = 30
 keepalive = 2
 
@@ -10,3 +27,14 @@ accesslog = "/root/Auto-transfers/gunicorn.access.log"
 errorlog = "/root/Auto-transfers/gunicorn.error.log"
 loglevel = "info"
 access_log_format = '%(h)s %(l)s %(u)s %(t)s "%(r)s" %(s)s %(b)s "%(f)s" "%(a)s" %(D)s'
+
+
+def on_starting(server: Any) -> None:  # noqa: ANN401
+    connections = workers * (threads + BACKGROUND_WORKERS)
+    if connections > DATABASE_CONNECTION_BUDGET:
+        msg = (
+            f"{workers} workers x ({threads} threads + {BACKGROUND_WORKERS} background workers) = {connections} "
+            f"database connections exceed DATABASE_CONNECTION_BUDGET={DATABASE_CONNECTION_BUDGET}"
+        )
+        raise RuntimeError(msg)
+    server.log.info("Database connections at full load: %s of %s", connections, DATABASE_CONNECTION_BUDGET)
@@ -0,0 +1,112 @@
+"""
+Load test profile for the bids endpoints.
+
+Runs ``--concurrency`` clients that request the given paths in a loop for ``--duration`` seconds and prints
+throughput and latency percentiles. Compare worker setups by running it against each, e.g.:
+
+    gunicorn project.wsgi:application --config production/gunicorn_conf.py --worker-class sync --threads 1
+    gunicorn project.wsgi:application --config production/gunicorn_conf.py
+    python production/load_test.py --phone +79990000000 --password secret --concurrency 64
+"""
+
+import argparse
+import json
+import statistics
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+from itertools import cycle
+
+DEFAULT_PATHS = ["/api/v1/autotrips/bids/", "/api/v1/autotrips/transporters/"]
+
+
+def obtain_token(base_url: str, phone: str, password: str) -> str:
+    request = urllib.request.Request(  # noqa: S310
+        f"{base_url}/api/v1/accounts/token/",
+        data=json.dumps({"phone": phone, "password": password}).encode(),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    with urllib.request.urlopen(request, timeout=30) as response:  # noqa: S310
+        return str(json.load(response)["access"])
+
+
+def run_client(  # noqa: PLR0913
+    base_url: str,
+    paths: list[str],
+    token: str,
+    deadline: float,
+    latencies: list[float],
+    statuses: Counter[str],
+    lock: threading.Lock,
+) -> None:
+    local_latencies = []
+    local_statuses: Counter[str] = Counter()
+
+    for path in cycle(paths):
+        if time.monotonic() >= deadline:
+            break
+        request = urllib.request.Request(f"{base_url}{path}", headers={"Authorization": f"Bearer {token}"})  # noqa: S310
+        started = time.perf_counter()
+        try:
+            with urllib.request.urlopen(request, timeout=60) as response:  # noqa: S310
+                response.read()
+                local_statuses[str(response.status)] += 1
+        except urllib.error.HTTPError as e:
+            local_statuses[str(e.code)] += 1
+        except OSError as e:
+            local_statuses[type(e).__name__] += 1
+        local_latencies.append(time.perf_counter() - started)
+
+    with lock:
+        latencies.extend(local_latencies)
+        statuses.update(local_statuses)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--phone", required=True, help="Phone of an admin account")
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=int, default=30, help="Seconds")
+    parser.add_argument("--path", action="append", dest="paths", help=f"Repeatable (default: {DEFAULT_PATHS})")
+    args = parser.parse_args()
+
+    base_url = args.base_url.rstrip("/")
+    paths = args.paths or DEFAULT_PATHS
+    token = obtain_token(base_url, args.phone, args.password)
+
+    latencies: list[float] = []
+    statuses: Counter[str] = Counter()
+    lock = threading.Lock()
+    deadline = time.monotonic() + args.duration
+    clients = [
+        threading.Thread(target=run_client, args=(base_url, paths, token, deadline, latencies, statuses, lock))
+        for _ in range(args.concurrency)
+    ]
+
+    started = time.monotonic()
+    for client in clients:
+        client.start()
+    for client in clients:
+        client.join()
+    elapsed = time.monotonic() - started
+
+    if not latencies:
+        print("No requests completed")  # noqa: T201
+        return
+
+    percentiles = statistics.quantiles(latencies, n=100)
+    print(f"Requests: {len(latencies)} in {elapsed:.1f} s, {len(latencies) / elapsed:.1f} req/s")  # noqa: T201
+    print(  # noqa: T201
+        f"Latency ms: p50 {percentiles[49] * 1000:.0f}, p95 {percentiles[94] * 1000:.0f}, "
+        f"p99 {percentiles[98] * 1000:.0f}, max {max(latencies) * 1000:.0f}"
+    )
+    print(f"Responses: {dict(statuses)}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@ from django.contrib.auth.admin import UserAdmin
 from django.contrib.auth.models import Group
 from django.utils.translation import gettext_lazy as _
 
+from .models.photo import PhotoBlob
 from .models.user import DocumentImage, User
 
 admin.site.unregister(Group)
@@ -96,3 +97,14 @@ class DocumentImageAdmin(admin.ModelAdmin):
 
 
 admin.site.register(DocumentImage, DocumentImageAdmin)
+
+
+class PhotoBlobAdmin(admin.ModelAdmin):
+    list_display = ("image", "size", "ref_count", "created")
+
+    search_fields = ("sha256", "image")
+
+    ordering = ("-created",)
+
+
+admin.site.register(PhotoBlob, PhotoBlobAdmin)
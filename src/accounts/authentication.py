@@ -0,0 +1,73 @@
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.translation import gettext_lazy as _
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+
+from accounts.models.user import User
+from accounts.services.claims import (
+    CLAIM_FIELDS,
+    VERSION_CLAIM,
+    current_version,
+    remember_version,
+    version_updated_at,
+)
+
+# updated_at versions the claims and the cached current-user payload (accounts.services.profile_cache);
+# from_db() takes the values in the model's field order
+LOADED_FIELDS = [
+    field.attname
+    for field in User._meta.concrete_fields  # noqa: SLF001
+    if field.attname in {"id", "is_active", "updated_at", *CLAIM_FIELDS.values()}
+]
+FIELD_CLAIMS = {field: claim for claim, field in CLAIM_FIELDS.items()}
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that builds the user from the token claims when they are still current.
+
+    The token's version claim is compared with the version the last committed save of the user published to the
+    shared ``user_versions`` cache (``accounts.services.claims.current_version``). When they match, the user is a
+    real ``User`` built from the id and the claims (role, approval, ...) without reading the users table; a
+    role change, a deactivation or a deletion made by any worker or by the bot moves the version, so the token
+    stops matching at once. Otherwise, the claim fields are read from the database: inactive and deleted users
+    get 401. Any field outside the claims loads the rest of the row in one query the first time it is read.
+
+    With the default database-backed version store, the version check is itself one read of the cache table on
+    every request, the same number of queries as loading the user. Pointing ``user_versions`` at Redis or
+    Memcached (``USER_VERSION_CACHE_BACKEND``) takes it off the database.
+    """
+
+    def get_user(self, validated_token: Token) -> User:
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(_("Token contained no recognizable user identification")) from e
+
+        version = current_version(user_id)
+        if version is not None and version == validated_token.get(VERSION_CLAIM):
+            return self.user_from_claims(user_id, validated_token)
+
+        values = User.objects.filter(pk=user_id, is_active=True).values_list(*LOADED_FIELDS).first()
+        if values is None:
+            raise AuthenticationFailed(_("No active account found for the given token."), code="no_active_account")
+        user = User.from_db(DEFAULT_DB_ALIAS, LOADED_FIELDS, values)
+        if version is None:
+            remember_version(user.pk, user.updated_at)
+        return user
+
+    @staticmethod
+    def user_from_claims(user_id: int, validated_token: Token) -> User:
+        known = {"id": user_id, "is_active": True, "updated_at": version_updated_at(validated_token[VERSION_CLAIM])}
+        values = [known[field] if field in known else validated_token[FIELD_CLAIMS[field]] for field in LOADED_FIELDS]
+        return User.from_db(DEFAULT_DB_ALIAS, LOADED_FIELDS, values)
+
+
+class ClaimsJWTScheme(SimpleJWTScheme):  # type: ignore[no-untyped-call]
+    """Describe ``ClaimsJWTAuthentication`` in the OpenAPI schema as the bearer JWT it is."""
+
+    target_class = "accounts.authentication.ClaimsJWTAuthentication"
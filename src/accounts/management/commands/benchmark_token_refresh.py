@@ -0,0 +1,53 @@
+import time
+import uuid
+from collections.abc import Callable
+from typing import Any, cast
+
+from django.core.cache import caches
+from django.core.management.base import ArgumentParser, BaseCommand
+from django.db import transaction
+
+from accounts.models.user import User
+from accounts.serializers.custom_token import CustomTokenRefreshSerializer, CustomTokenSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark token refresh with the user claims read from the database and from the cache. "
+        "The fixture user is created inside a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument("--refreshes", type=int, default=2000, help="Refreshes per pass (default: 2000)")
+
+    def handle(self, *args: tuple[Any], **options: dict[str, Any]) -> None:
+        refreshes = cast(int, options["refreshes"])
+        self.stdout.write(f"{type(caches['default']).__name__} cache, {refreshes} refreshes per pass")
+
+        with transaction.atomic():
+            # bulk_create() on the base manager: no registration/table/Telegram signals for the fixture user
+            token = uuid.uuid4().hex[:12]
+            user = User._base_manager.bulk_create(  # noqa: SLF001
+                [User(full_name="Benchmark", phone=f"+0{token[:10]}", username=f"benchmark-{token}")]
+            )[0]
+            refresh = str(CustomTokenSerializer.get_token(user))
+
+            def refresh_access(*, cold: bool) -> None:
+                for _ in range(refreshes):
+                    if cold:
+                        caches["default"].clear()
+                    CustomTokenRefreshSerializer(data={"refresh": refresh}).is_valid(raise_exception=True)
+
+            self._measure("claims from the database", refreshes, lambda: refresh_access(cold=True))
+            self._measure("claims from the cache", refreshes, lambda: refresh_access(cold=False))
+
+            caches["default"].clear()
+            transaction.set_rollback(True)
+
+    def _measure(self, label: str, count: int, func: Callable[[], Any]) -> None:
+        started = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(f"{label}: {count / elapsed:.0f} refreshes/s, {elapsed / count * 1e6:.0f} us each")
+        )
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-19 01:40
+
+import accounts.models.photo
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0009_alter_documentimage_options_alter_user_options'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='documentimage',
+            name='medium',
+            field=models.ImageField(blank=True, default='', upload_to=accounts.models.photo.rendition_upload_to, verbose_name='Medium'),
+        ),
+        migrations.AddField(
+            model_name='documentimage',
+            name='thumbnail',
+            field=models.ImageField(blank=True, default='', upload_to=accounts.models.photo.rendition_upload_to, verbose_name='Thumbnail'),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-19 01:46
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0010_documentimage_medium_documentimage_thumbnail'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PhotoBlob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sha256', models.CharField(max_length=64, unique=True, verbose_name='SHA-256')),
+                ('image', models.CharField(max_length=100, verbose_name='Image')),
+                ('thumbnail', models.CharField(blank=True, default='', max_length=100, verbose_name='Thumbnail')),
+                ('medium', models.CharField(blank=True, default='', max_length=100, verbose_name='Medium')),
+                ('size', models.PositiveBigIntegerField(default=0, verbose_name='Size')),
+                ('ref_count', models.PositiveIntegerField(default=0, verbose_name='Reference count')),
+                ('created', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Created')),
+            ],
+            options={
+                'verbose_name': 'Photo blob',
+                'verbose_name_plural': 'Photo blobs',
+            },
+        ),
+        migrations.AddField(
+            model_name='documentimage',
+            name='blob',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='accounts.photoblob', verbose_name='Blob'),
+        ),
+    ]
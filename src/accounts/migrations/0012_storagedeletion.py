@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-19 01:54
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0011_photoblob_documentimage_blob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StorageDeletion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255, unique=True, verbose_name='Name')),
+                ('created', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Created')),
+            ],
+            options={
+                'verbose_name': 'Storage deletion',
+                'verbose_name_plural': 'Storage deletions',
+            },
+        ),
+    ]
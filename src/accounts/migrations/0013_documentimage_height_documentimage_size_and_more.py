@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-19 01:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0012_storagedeletion'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='documentimage',
+            name='height',
+            field=models.PositiveIntegerField(blank=True, null=True, verbose_name='Height'),
+        ),
+        migrations.AddField(
+            model_name='documentimage',
+            name='size',
+            field=models.PositiveBigIntegerField(blank=True, null=True, verbose_name='Size'),
+        ),
+        migrations.AddField(
+            model_name='documentimage',
+            name='taken_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Taken at'),
+        ),
+        migrations.AddField(
+            model_name='documentimage',
+            name='width',
+            field=models.PositiveIntegerField(blank=True, null=True, verbose_name='Width'),
+        ),
+    ]
@@ -1,3 +1,4 @@
-from .user import User
+from .photo import BasePhoto, PhotoBlob, StorageDeletion
+from .user import DocumentImage, User
 
-__all__ = ["User"]
+__all__ = ["BasePhoto", "DocumentImage", "PhotoBlob", "StorageDeletion", "User"]
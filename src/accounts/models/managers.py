@@ -1,6 +1,16 @@
+import hashlib
+from collections.abc import Iterable
 from typing import Any
 
 from django.contrib.auth.models import UserManager
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.db import models, transaction
+from django.db.models import F
+from django.db.models.fields.files import FieldFile
+
+from services.background import run_in_background
+from services.storage import S3_DELETE_BATCH_SIZE, delete_files
 
 
 class CustomUserManager(UserManager):
@@ -19,3 +29,69 @@ class CustomUserManager(UserManager):
             raise ValueError("Superuser must have is_superuser=True.")
 
         return self._create_user(username, email, password, **extra_fields)
+
+
+def file_sha256(file: File) -> str:
+    digest = hashlib.sha256()
+    for chunk in file.chunks():
+        digest.update(chunk)
+    file.seek(0)
+    return digest.hexdigest()
+
+
+class PhotoBlobManager(models.Manager):
+    def acquire(self, field_file: FieldFile) -> Any:  # noqa: ANN401
+        """Take a reference to the blob with the file's content, uploading the file only if the content is new."""
+        digest = file_sha256(field_file)
+
+        blob = self.filter(sha256=digest).first()
+        if blob is not None and self.filter(pk=blob.pk).update(ref_count=F("ref_count") + 1):
+            return blob
+
+        field_file.save(field_file.name, field_file.file, save=False)
+        blob, created = self.get_or_create(
+            sha256=digest, defaults={"image": field_file.name, "size": field_file.size, "ref_count": 1}
+        )
+        if not created:
+            # a concurrent upload of the same content won the race
+            field_file.storage.delete(field_file.name)
+            self.filter(pk=blob.pk).update(ref_count=F("ref_count") + 1)
+        return blob
+
+    def release(self, blob_id: int) -> Any:  # noqa: ANN401
+        """Drop a reference; the last one removes the blob, which is returned so its files can be deleted."""
+        self.filter(pk=blob_id).update(ref_count=F("ref_count") - 1)
+
+        blob = self.filter(pk=blob_id, ref_count=0).first()
+        if blob is None or not self.filter(pk=blob_id, ref_count=0).delete()[0]:
+            return None
+        return blob
+
+
+class StorageDeletionManager(models.Manager):
+    def enqueue(self, names: Iterable[str]) -> None:
+        """Queue files for deletion in the current transaction; they are purged in the background after commit."""
+        deletions = [self.model(name=name) for name in names if name]
+        if not deletions:
+            return
+        self.bulk_create(deletions, ignore_conflicts=True)
+        run_in_background(self.purge)
+
+    def purge(self, batch_size: int = S3_DELETE_BATCH_SIZE) -> int:
+        """Delete queued files batch by batch and return how many were deleted; failed ones stay queued."""
+        purged = 0
+        while True:
+            with transaction.atomic():
+                deletions = list(
+                    self.select_for_update(skip_locked=True).order_by("pk").values_list("pk", "name")[:batch_size]
+                )
+                if not deletions:
+                    return purged
+
+                failed = set(delete_files(default_storage, [name for _, name in deletions]))
+                self.filter(pk__in=[pk for pk, name in deletions if name not in failed]).delete()
+                purged += len(deletions) - len(failed)
+
+            if failed:
+                # leave them for the next run instead of retrying the same batch right away
+                return purged
@@ -0,0 +1,111 @@
+from typing import Any
+
+from django.db import models, transaction
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from .managers import PhotoBlobManager, StorageDeletionManager
+
+
+def rendition_upload_to(instance: models.Model, filename: str) -> str:  # noqa: ARG001
+    """Keep renditions next to the original: the name is already built from the original path."""
+    return filename
+
+
+class PhotoBlob(models.Model):
+    """Stored image content shared by every photo row that uploaded the same bytes."""
+
+    sha256 = models.CharField(_("SHA-256"), max_length=64, unique=True)
+    image = models.CharField(_("Image"), max_length=100)
+    thumbnail = models.CharField(_("Thumbnail"), max_length=100, blank=True, default="")
+    medium = models.CharField(_("Medium"), max_length=100, blank=True, default="")
+    size = models.PositiveBigIntegerField(_("Size"), default=0)
+    ref_count = models.PositiveIntegerField(_("Reference count"), default=0)
+    created = models.DateTimeField(_("Created"), default=timezone.now)
+
+    objects = PhotoBlobManager()
+
+    class Meta:
+        verbose_name = _("Photo blob")
+        verbose_name_plural = _("Photo blobs")
+
+    def __str__(self) -> str:
+        return str(self.image)
+
+
+class StorageDeletion(models.Model):
+    """File waiting to be deleted from storage once the transaction that orphaned it has been committed."""
+
+    name = models.CharField(_("Name"), max_length=255, unique=True)
+    created = models.DateTimeField(_("Created"), default=timezone.now)
+
+    objects = StorageDeletionManager()
+
+    class Meta:
+        verbose_name = _("Storage deletion")
+        verbose_name_plural = _("Storage deletions")
+
+    def __str__(self) -> str:
+        return str(self.name)
+
+
+class BasePhoto(models.Model):
+    image: models.ImageField
+
+    thumbnail = models.ImageField(_("Thumbnail"), upload_to=rendition_upload_to, blank=True, default="")
+    medium = models.ImageField(_("Medium"), upload_to=rendition_upload_to, blank=True, default="")
+    blob = models.ForeignKey(
+        PhotoBlob, on_delete=models.PROTECT, related_name="+", null=True, blank=True, verbose_name=_("Blob")
+    )
+    width = models.PositiveIntegerField(_("Width"), null=True, blank=True)
+    height = models.PositiveIntegerField(_("Height"), null=True, blank=True)
+    size = models.PositiveBigIntegerField(_("Size"), null=True, blank=True)
+    taken_at = models.DateTimeField(_("Taken at"), null=True, blank=True)
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args: tuple[Any], **kwargs: dict[str, Any]) -> None:
+        if not self.has_new_image():
+            super().save(*args, **kwargs)
+            return
+
+        # the reference taken by attach_blob() must not outlive a failed insert
+        with transaction.atomic():
+            self.attach_blob()
+            super().save(*args, **kwargs)
+
+    def has_new_image(self) -> bool:
+        return self._state.adding and self.blob_id is None and bool(self.image) and not self.image._committed  # noqa: SLF001
+
+    def attach_blob(self) -> None:
+        """
+        Point the photo at the blob holding its content, uploading the file only if that content is new.
+
+        Must be called before the row is inserted; ``bulk_create`` callers do it explicitly.
+        """
+        self.record_metadata()
+
+        blob = PhotoBlob.objects.acquire(self.image)
+        self.blob = blob
+        self.image = blob.image
+        self.thumbnail = blob.thumbnail
+        self.medium = blob.medium
+
+    def record_metadata(self) -> None:
+        """Fill dimensions, size and capture time from the new, not yet stored image."""
+        self.width = self.image.width
+        self.height = self.image.height
+        self.size = self.image.size
+        # set by the ingest stage (see accounts.services.ingest) from the original EXIF data
+        self.taken_at = getattr(self.image.file, "taken_at", None)
+
+    def release_files(self) -> None:
+        """Queue the deleted photo's files for removal unless other photos still share them."""
+        if self.blob_id is None:
+            StorageDeletion.objects.enqueue([self.image.name, self.thumbnail.name, self.medium.name])
+            return
+
+        blob = PhotoBlob.objects.release(self.blob_id)
+        if blob is not None:
+            StorageDeletion.objects.enqueue([blob.image, blob.thumbnail, blob.medium])
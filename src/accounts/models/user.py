@@ -1,3 +1,6 @@
+from collections.abc import Iterable
+from typing import Any
+
 from django.contrib.auth.models import AbstractUser
 from django.contrib.auth.validators import UnicodeUsernameValidator
 from django.db import models
@@ -5,6 +8,7 @@ from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from .managers import CustomUserManager
+from .photo import BasePhoto
 
 
 class User(AbstractUser):
@@ -44,6 +48,9 @@ class User(AbstractUser):
     role = models.CharField(_("Role"), max_length=15, choices=Roles.choices, default=Roles.USER)
     is_approved = models.BooleanField(_("Is approved"), default=False)
     is_onboarded = models.BooleanField(_("Is onboarded"), default=False)
+    # the version of the token claims (accounts.services.claims) and of the cached current-user payload
+    # (accounts.services.profile_cache): saves passing update_fields must list it
+    updated_at = models.DateTimeField(_("Updated at"), auto_now=True)
 
     USERNAME_FIELD = "phone"  # auth using phone
     REQUIRED_FIELDS: list[str] = ["username"]
@@ -51,12 +58,25 @@ class User(AbstractUser):
     def __str__(self) -> str:
         return str(self.full_name)
 
+    def refresh_from_db(
+        self,
+        using: str | None = None,
+        fields: Iterable[str] | None = None,
+        from_queryset: models.QuerySet[Any] | None = None,
+    ) -> None:
+        # a user built from token claims (accounts.authentication) loads the rest of its row on the first read
+        # of another field, in one query instead of one per field
+        deferred = self.get_deferred_fields()
+        if fields is not None and deferred.intersection(fields):
+            fields = deferred.union(fields)
+        super().refresh_from_db(using, fields, from_queryset)
+
     class Meta:
         verbose_name = _("User")
         verbose_name_plural = _("Users")
 
 
-class DocumentImage(models.Model):
+class DocumentImage(BasePhoto):
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="documents", verbose_name=_("User"))
     image = models.ImageField(_("Image"), upload_to="documents/%Y/%m/%d/")
     created = models.DateTimeField(_("Created"), default=timezone.now)
@@ -1,34 +1,19 @@
-import io
 from typing import Any
 
 from django.core.files.base import ContentFile
-from PIL import Image
-from pillow_heif import register_heif_opener
 from rest_framework import serializers
 
-register_heif_opener()
+from accounts.services.ingest import ingest_image
 
 
 class HEIFImageField(serializers.ImageField):
+    """Image field that also accepts HEIF/HEIC and normalises every upload before it is stored."""
+
     def to_internal_value(self, data: Any) -> ContentFile:  # noqa: ANN401
         image = super().to_internal_value(data)
 
-        if image.name.lower().endswith((".heif", ".heic")):
-            try:
-                with Image.open(image) as img:
-                    converted_img = img
-                    if img.mode != "RGB":
-                        converted_img = img.convert("RGB")
-
-                    output = io.BytesIO()
-                    converted_img.save(output, format="JPEG", quality=95)
-                    output.seek(0)
-
-                    file_name = f"{image.name.split('.')[0]}.jpg"
-                    image = ContentFile(output.read(), name=file_name)
-
-            except Exception as e:
-                msg = f"Failed to process HEIF image: {e!s}"
-                raise serializers.ValidationError(msg) from e
-
-        return image
+        try:
+            return ingest_image(image, image.name)
+        except Exception as e:
+            msg = f"Failed to process image: {e!s}"
+            raise serializers.ValidationError(msg) from e
@@ -1,9 +1,12 @@
 from typing import Any
 
+from rest_framework.exceptions import AuthenticationFailed
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
-from rest_framework_simplejwt.tokens import AccessToken, RefreshToken, Token
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
 
 from accounts.models.user import User
+from accounts.services.claims import cached_token_claims, token_claims
 
 
 class CustomTokenSerializer(TokenObtainPairSerializer):
@@ -13,32 +16,28 @@ class CustomTokenSerializer(TokenObtainPairSerializer):
         token = super().get_token(user)
 
         token["user_id"] = user.id
-        token["username"] = user.username
-        token["phone"] = user.phone
-        token["role"] = user.role
-        token["approved"] = user.is_approved
-        token["onboarded"] = user.is_onboarded
+        for claim, value in token_claims(user).items():
+            token[claim] = value
 
         return token
 
 
 class CustomTokenRefreshSerializer(TokenRefreshSerializer):
     def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
-        refresh = RefreshToken(attrs["refresh"])
-        user_id = refresh.payload.get("user_id")
-        user = User.objects.get(id=user_id)
-
-        data = super().validate(attrs)
-
-        new_access = AccessToken(data["access"])  # type: ignore[arg-type]
-        new_access.payload.update(
-            {
-                "username": user.username,
-                "phone": user.phone,
-                "role": user.role,
-                "approved": user.is_approved,
-                "onboarded": user.is_onboarded,
-            }
-        )
-        data["access"] = str(new_access)
-        return data
+        """
+        Issue an access token with up-to-date claims.
+
+        The refresh token is decoded and the access token signed once; the claims come from the cache, so a
+        refresh normally only reads the user's version from the shared version store.
+        """
+        refresh = self.token_class(attrs["refresh"])
+
+        claims = cached_token_claims(refresh.payload.get(api_settings.USER_ID_CLAIM))
+        if claims is None:
+            raise AuthenticationFailed(self.error_messages["no_active_account"], "no_active_account")
+
+        access = refresh.access_token
+        for claim, value in claims.items():
+            access[claim] = value
+
+        return {"access": str(access)}
@@ -6,11 +6,12 @@ from accounts.models.user import DocumentImage, User
 class DocumentImageSerializer(serializers.ModelSerializer):
     class Meta:
         model = DocumentImage
-        fields = ["id", "image", "created"]
+        fields = ["id", "image", "thumbnail", "medium", "created"]
+        read_only_fields = ["thumbnail", "medium"]
 
 
-class UserSerializer(serializers.ModelSerializer):
-    documents = DocumentImageSerializer(many=True, read_only=True)
+class UserSummarySerializer(serializers.ModelSerializer):
+    """User fields without the documents, for lists that do not ask for them."""
 
     class Meta:
         model = User
@@ -22,10 +23,16 @@ class UserSerializer(serializers.ModelSerializer):
             "role",
             "is_approved",
             "is_onboarded",
-            "documents",
         ]
 
 
+class UserSerializer(UserSummarySerializer):
+    documents = DocumentImageSerializer(many=True, read_only=True)
+
+    class Meta(UserSummarySerializer.Meta):
+        fields = [*UserSummarySerializer.Meta.fields, "documents"]
+
+
 class ClientSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
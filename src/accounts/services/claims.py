@@ -0,0 +1,97 @@
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.db import transaction
+
+from accounts.models.user import User
+
+CLAIMS_CACHE_KEY = "user-claims:{user_id}:{version}"
+VERSION_CACHE_KEY = "user-version:{user_id}"
+
+# the user's updated_at when the token was issued, see current_version()
+VERSION_CLAIM = "version"
+
+# custom claim -> User field it is taken from
+CLAIM_FIELDS = {
+    "username": "username",
+    "phone": "phone",
+    "role": "role",
+    "approved": "is_approved",
+    "onboarded": "is_onboarded",
+}
+
+
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+def token_claims(user: User) -> dict[str, Any]:
+    """Build the custom claims every access token carries next to the user id."""
+    claims = {claim: getattr(user, field) for claim, field in CLAIM_FIELDS.items()}
+    claims[VERSION_CLAIM] = user_version(user.updated_at)
+    return claims
+
+
+def user_version(updated_at: datetime) -> int:
+    """Turn ``updated_at`` into the integer kept in the version claim and in the shared version store."""
+    return (updated_at - EPOCH) // timedelta(microseconds=1)
+
+
+def version_updated_at(version: int) -> datetime:
+    return EPOCH + timedelta(microseconds=version)
+
+
+def current_version(user_id: Any) -> int | None:  # noqa: ANN401
+    """
+    Return the version of the user's last committed save, or ``None`` if the store does not know it.
+
+    The store is the ``user_versions`` cache, which every web worker and the bot share (the database by default).
+    A token whose version claim equals it carries the user's current claims; any other token, or a user the
+    store does not know, needs the claims read from the database.
+    """
+    return caches["user_versions"].get(VERSION_CACHE_KEY.format(user_id=user_id))  # type: ignore[no-any-return]
+
+
+def publish_version(user_id: Any, updated_at: datetime) -> None:  # noqa: ANN401
+    """Make ``updated_at`` the user's current version once the saving transaction commits."""
+    key = VERSION_CACHE_KEY.format(user_id=user_id)
+    version = user_version(updated_at)
+    transaction.on_commit(lambda: caches["user_versions"].set(key, version))
+
+
+def remember_version(user_id: Any, updated_at: datetime) -> None:  # noqa: ANN401
+    """
+    Store a version just read from the database, unless a save has published one in the meantime.
+
+    ``add()`` never overwrites, so a read racing a save cannot put the older version back.
+    """
+    caches["user_versions"].add(VERSION_CACHE_KEY.format(user_id=user_id), user_version(updated_at))
+
+
+def forget_version(user_id: Any) -> None:  # noqa: ANN401
+    key = VERSION_CACHE_KEY.format(user_id=user_id)
+    transaction.on_commit(lambda: caches["user_versions"].delete(key))
+
+
+def cached_token_claims(user_id: Any) -> dict[str, Any] | None:  # noqa: ANN401
+    """
+    Return the claims of an active user, or ``None`` if the user is gone or deactivated.
+
+    Both answers are cached per process for ``USER_CLAIMS_CACHE_TIMEOUT`` seconds under the user's current
+    version (see ``current_version``): a save made by any worker or by the bot publishes a new version, so the
+    next refresh reads the claims from the database whichever process serves it.
+    """
+    version = current_version(user_id)
+    claims = None if version is None else cache.get(CLAIMS_CACHE_KEY.format(user_id=user_id, version=version))
+    if claims is None:
+        user = User.objects.filter(pk=user_id).first()
+        if user is None:
+            return None
+        if version is None:
+            remember_version(user.pk, user.updated_at)
+        # an empty dict marks an inactive user
+        claims = token_claims(user) if user.is_active else {}
+        key = CLAIMS_CACHE_KEY.format(user_id=user_id, version=user_version(user.updated_at))
+        cache.set(key, claims, settings.USER_CLAIMS_CACHE_TIMEOUT)
+    return claims or None
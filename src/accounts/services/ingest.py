@@ -0,0 +1,147 @@
+import io
+import posixpath
+from datetime import datetime
+from typing import IO, Any
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.utils import timezone
+from PIL import ExifTags, Image, ImageOps
+from pillow_heif import register_heif_opener
+
+register_heif_opener()
+
+EXIF_DATETIME_FORMAT = "%Y:%m:%d %H:%M:%S"
+
+# JPEG markers: start/end of image, start of scan, segments without a length, and the metadata segments
+# dropped without touching the compressed pixels (every APPn but JFIF, the ICC profile and Adobe, and comments)
+JPEG_MARKER_PREFIX = 0xFF
+JPEG_SOI = b"\xff\xd8"
+JPEG_EOI = b"\xff\xd9"
+JPEG_SOS = 0xDA
+JPEG_STANDALONE_MARKERS = {0x01, *range(0xD0, 0xD8)}
+JPEG_APP_MARKERS = range(0xE0, 0xF0)
+JPEG_KEPT_APP_MARKERS = {0xE0, 0xEE}
+JPEG_APP2 = 0xE2
+JPEG_COM = 0xFE
+ICC_PROFILE_SIGNATURE = b"ICC_PROFILE\x00"
+
+
+class IngestedImage(ContentFile):
+    """Normalised upload that also carries the capture time read from the original EXIF data."""
+
+    def __init__(self, content: bytes, name: str, taken_at: datetime | None) -> None:
+        super().__init__(content, name=name)
+        self.taken_at = taken_at
+
+
+def capture_time(exif: Image.Exif) -> datetime | None:
+    """Read DateTimeOriginal (or DateTime) from EXIF, honouring OffsetTimeOriginal when the camera wrote it."""
+    exif_ifd = exif.get_ifd(ExifTags.IFD.Exif)
+    value = exif_ifd.get(ExifTags.Base.DateTimeOriginal) or exif.get(ExifTags.Base.DateTime)
+    if not isinstance(value, str):
+        return None
+
+    try:
+        taken_at = datetime.strptime(value.strip("\x00 "), EXIF_DATETIME_FORMAT)  # noqa: DTZ007
+    except ValueError:
+        return None
+
+    offset = exif_ifd.get(ExifTags.Base.OffsetTimeOriginal)
+    if isinstance(offset, str):
+        try:
+            return datetime.fromisoformat(f"{taken_at.isoformat()}{offset.strip()}")
+        except ValueError:
+            pass
+    return timezone.make_aware(taken_at, timezone.get_current_timezone()) if settings.USE_TZ else taken_at
+
+
+def strip_jpeg_metadata(data: bytes) -> bytes | None:
+    """
+    Drop EXIF, XMP, IPTC and comment segments from a JPEG without re-encoding it.
+
+    Everything from the first scan to the end of the image is copied as is; data after it
+    (the extra images of an MPO file) is dropped. Returns None when the file is not a well-formed JPEG.
+    """
+    if not data.startswith(JPEG_SOI):
+        return None
+
+    output = bytearray(JPEG_SOI)
+    position = len(JPEG_SOI)
+    while position + 4 <= len(data):
+        if data[position] != JPEG_MARKER_PREFIX:
+            return None
+        marker = data[position + 1]
+        if marker == JPEG_MARKER_PREFIX:
+            # fill byte before a marker
+            position += 1
+            continue
+        if marker in JPEG_STANDALONE_MARKERS:
+            output += data[position : position + 2]
+            position += 2
+            continue
+        if marker == JPEG_SOS:
+            end = data.find(JPEG_EOI, position)
+            if end == -1:
+                return None
+            output += data[position : end + len(JPEG_EOI)]
+            return bytes(output)
+
+        end = position + 2 + int.from_bytes(data[position + 2 : position + 4])
+        if end > len(data):
+            return None
+        segment = data[position:end]
+        is_metadata = marker == JPEG_COM or (
+            marker in JPEG_APP_MARKERS
+            and marker not in JPEG_KEPT_APP_MARKERS
+            and not (marker == JPEG_APP2 and segment[4:].startswith(ICC_PROFILE_SIGNATURE))
+        )
+        if not is_metadata:
+            output += segment
+        position = end
+    return None
+
+
+def ingest_image(upload: IO[bytes], name: str) -> IngestedImage:
+    """
+    Prepare an uploaded photo for storage.
+
+    The EXIF orientation is applied to the pixels, metadata is stripped and images larger than
+    ``PHOTO_INGEST_MAX_SIZE`` are downscaled. Only rotating or downscaling re-encodes a JPEG: otherwise
+    its metadata segments are cut out losslessly. PNG files without metadata are stored byte for byte,
+    everything else (HEIC, WebP, ...) is re-encoded as JPEG.
+    """
+    max_size = settings.PHOTO_INGEST_MAX_SIZE
+
+    with Image.open(upload) as img:
+        exif = img.getexif()
+        taken_at = capture_time(exif)
+
+        if max(img.size) <= max_size and exif.get(ExifTags.Base.Orientation, 1) == 1:
+            upload.seek(0)
+            if img.format == "PNG" and not exif:
+                return IngestedImage(upload.read(), name=name, taken_at=taken_at)
+            if img.format == "JPEG" and (content := strip_jpeg_metadata(upload.read())) is not None:
+                return IngestedImage(content, name=name, taken_at=taken_at)
+
+        image_format = "PNG" if img.format == "PNG" else "JPEG"
+        save_options: dict[str, Any] = {"optimize": True}
+        if image_format == "JPEG":
+            save_options["quality"] = settings.PHOTO_INGEST_QUALITY
+            # Pillow writes the original comment back unless given another one
+            save_options["comment"] = b""
+        if icc_profile := img.info.get("icc_profile"):
+            # colour profile is not metadata worth stripping: without it colours shift
+            save_options["icc_profile"] = icc_profile
+
+        image = ImageOps.exif_transpose(img)
+        image.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+        if image_format == "JPEG" and image.mode not in {"RGB", "L"}:
+            image = image.convert("RGB")
+
+        output = io.BytesIO()
+        image.save(output, format=image_format, **save_options)
+
+    root, _ = posixpath.splitext(name)
+    extension = "png" if image_format == "PNG" else "jpg"
+    return IngestedImage(output.getvalue(), name=f"{root}.{extension}", taken_at=taken_at)
@@ -0,0 +1,38 @@
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from accounts.models.user import User
+from accounts.services.claims import publish_version
+
+PROFILE_CACHE_KEY = "current-user:{user_id}:{version}"
+
+
+def cached_profile(user: User, serialize: Callable[[], Mapping[str, Any]]) -> Mapping[str, Any]:
+    """
+    Return the current-user payload from the cache, serializing and caching it on a miss.
+
+    The key holds the user's ``updated_at``, which moves when the user is saved and when one of their documents
+    is saved or deleted (see ``accounts.signals``), whichever process does it: an outdated entry is simply never
+    asked for again. Entries live for ``CURRENT_USER_CACHE_TIMEOUT`` seconds. A payload with documents still
+    waiting for their renditions is not cached: the renditions are written with ``QuerySet.update()``, which
+    sends no signal.
+    """
+    key = PROFILE_CACHE_KEY.format(user_id=user.pk, version=user.updated_at.timestamp())
+    data = cache.get(key)
+    if data is None:
+        data = serialize()
+        if all(document["thumbnail"] for document in data.get("documents", [])):
+            cache.set(key, data, settings.CURRENT_USER_CACHE_TIMEOUT)
+    return data  # type: ignore[no-any-return]
+
+
+def touch_profile(user_id: Any) -> None:  # noqa: ANN401
+    """Bump ``updated_at`` of a user, so their cached payload is serialized again."""
+    updated_at = timezone.now()
+    User.objects.filter(pk=user_id).update(updated_at=updated_at)
+    # tokens issued before carry the old version, so requests read the new updated_at from the database
+    publish_version(user_id, updated_at)
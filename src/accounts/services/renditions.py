@@ -0,0 +1,82 @@
+import io
+import logging
+import posixpath
+import threading
+from collections.abc import Iterable
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from PIL import Image, ImageOps
+from pillow_heif import register_heif_opener
+
+from accounts.models.photo import BasePhoto, PhotoBlob
+from services.background import run_in_background
+
+register_heif_opener()
+
+logger = logging.getLogger(__name__)
+
+RENDITION_EXTENSIONS = {"WEBP": "webp", "JPEG": "jpg"}
+
+_blob_locks = tuple(threading.Lock() for _ in range(64))
+
+
+def rendition_name(original_name: str, rendition: str) -> str:
+    """Build the storage name of a rendition, e.g. ``cars/2025/03/15/car1_thumbnail.webp``."""
+    root, _ = posixpath.splitext(original_name)
+    extension = RENDITION_EXTENSIONS[settings.PHOTO_RENDITION_FORMAT]
+    return f"{root}_{rendition}.{extension}"
+
+
+def build_rendition(image: Image.Image, max_size: int) -> ContentFile:
+    rendition = image.copy()
+    rendition.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+
+    image_format = settings.PHOTO_RENDITION_FORMAT
+    if image_format == "JPEG" and rendition.mode != "RGB":
+        rendition = rendition.convert("RGB")
+
+    output = io.BytesIO()
+    rendition.save(output, format=image_format, quality=settings.PHOTO_RENDITION_QUALITY)
+    return ContentFile(output.getvalue())
+
+
+def generate_renditions(photo: BasePhoto) -> None:
+    """Render every size from ``settings.PHOTO_RENDITIONS`` and store it next to the original image."""
+    with photo.image.open("rb") as original, Image.open(original) as img:
+        image = ImageOps.exif_transpose(img)
+        for field_name, max_size in settings.PHOTO_RENDITIONS.items():
+            content = build_rendition(image, max_size)
+            getattr(photo, field_name).save(rendition_name(photo.image.name, field_name), content, save=False)
+
+    update = {field_name: getattr(photo, field_name).name for field_name in settings.PHOTO_RENDITIONS}
+    type(photo).objects.filter(pk=photo.pk).update(**update)
+    if photo.blob_id is not None:
+        PhotoBlob.objects.filter(pk=photo.blob_id).update(**update)
+
+
+def _generate_renditions_by_pk(model: type[BasePhoto], pk: int) -> None:
+    photo = model.objects.filter(pk=pk).first()
+    if photo is None or not photo.image:
+        return
+    if photo.blob_id is None:
+        generate_renditions(photo)
+        return
+
+    # duplicates of the same content share one set of renditions: render it once, copy it for the rest
+    with _blob_locks[photo.blob_id % len(_blob_locks)]:
+        blob = PhotoBlob.objects.filter(pk=photo.blob_id).exclude(thumbnail="").first()
+        if blob is None:
+            generate_renditions(photo)
+            return
+        update = {field_name: getattr(blob, field_name) for field_name in settings.PHOTO_RENDITIONS}
+        model.objects.filter(pk=pk).update(**update)
+
+
+def schedule_renditions(photos: Iterable[BasePhoto]) -> None:
+    """Generate renditions in the background after the upload transaction commits."""
+    for photo in photos:
+        if photo.thumbnail:
+            # a duplicate upload that already got its renditions from the blob
+            continue
+        run_in_background(_generate_renditions_by_pk, type(photo), photo.pk)
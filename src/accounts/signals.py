@@ -7,13 +7,17 @@ from aiogram.enums import ParseMode
 from aiogram.exceptions import AiogramError
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 from django.conf import settings
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.utils import timezone
 
+from accounts.services.claims import forget_version, publish_version
+from accounts.services.profile_cache import touch_profile
+from accounts.services.renditions import schedule_renditions
+from project.metrics import external_call
 from services.table_service import crm_table_manager
 
-from .models import User
+from .models import DocumentImage, User
 
 logger = logging.getLogger(__name__)
 URL = settings.FRONTEND_URL
@@ -135,7 +139,8 @@ def _handle_notification_sending(text: str, keyboard: InlineKeyboardMarkup) -> N
         if loop.is_running():
             asyncio.create_task(coro)  # noqa: RUF006
         else:
-            loop.run_until_complete(coro)
+            with external_call("telegram"):
+                loop.run_until_complete(coro)
 
     except Exception as e:
         msg = f"Failed to process notification sending: {e!s}"
@@ -165,3 +170,44 @@ def send_registration_notification(sender: User, instance: User, created: bool,
     except Exception as e:
         msg = f"Unexpected error in registration notification: {e!s}"
         logger.exception(msg)
+
+
+@receiver(post_save, sender=User)
+def publish_user_version(sender: User, instance: User, **kwargs: dict[Any, str]) -> None:  # noqa: ARG001
+    """Let the next request and token refresh pick up the changed role, approval or activity."""
+    publish_version(instance.pk, instance.updated_at)
+
+
+@receiver(post_delete, sender=User)
+def forget_user_version(sender: User, instance: User, **kwargs: dict[Any, str]) -> None:  # noqa: ARG001
+    """Stop accepting the deleted user's tokens."""
+    forget_version(instance.pk)
+
+
+@receiver(post_save, sender=DocumentImage)
+@receiver(post_delete, sender=DocumentImage)
+def touch_document_owner_profile(
+    sender: DocumentImage,  # noqa: ARG001
+    instance: DocumentImage,
+    **kwargs: dict[Any, str],  # noqa: ARG001
+) -> None:
+    """Bump the profile version of the user whose documents changed."""
+    touch_profile(instance.user_id)
+
+
+@receiver(post_save, sender=DocumentImage)
+def generate_document_renditions(
+    sender: DocumentImage,  # noqa: ARG001
+    instance: DocumentImage,
+    created: bool,  # noqa: FBT001
+    **kwargs: dict[Any, str],  # noqa: ARG001
+) -> None:
+    """Generate thumbnail and medium renditions for an uploaded document photo."""
+    if created:
+        schedule_renditions([instance])
+
+
+@receiver(post_delete, sender=DocumentImage)
+def delete_document_files(sender: DocumentImage, instance: DocumentImage, **kwargs: dict[Any, str]) -> None:  # noqa: ARG001
+    """Queue the files of a deleted document photo for removal from storage."""
+    instance.release_files()
@@ -0,0 +1,139 @@
+from typing import IO, Any
+
+from django.conf import settings
+from django.core.exceptions import RequestDataTooBig, SuspiciousOperation, TooManyFilesSent
+from django.core.files.uploadhandler import FileUploadHandler
+from django.utils.translation import gettext_lazy as _
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+SNIFF_SIZE = 12
+
+HEIF_BRANDS = {b"heic", b"heix", b"hevc", b"hevx", b"heim", b"heis", b"mif1", b"msf1"}
+SPREADSHEET_SIGNATURES = (b"PK\x03\x04", b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1")
+
+# Upload fields that carry something other than photos
+NON_IMAGE_FIELDS = {"excel_file": SPREADSHEET_SIGNATURES}
+
+
+class UploadTooLarge(APIException):
+    status_code = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    default_detail = _("Upload is too large.")
+    default_code = "upload_too_large"
+
+
+class TooManyUploadedFiles(APIException):
+    status_code = status.HTTP_400_BAD_REQUEST
+    default_detail = _("Too many files in one request.")
+    default_code = "too_many_files"
+
+
+class UnsupportedUploadType(APIException):
+    status_code = status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+    default_detail = _("Unsupported file type.")
+    default_code = "unsupported_file_type"
+
+
+class RejectedUpload(SuspiciousOperation):
+    """
+    An upload the handler stopped, as a Django error: outside DRF views (the admin) Django answers it with 400.
+
+    ``project.exceptions.api_exception_handler`` turns it into ``api_error`` with ``detail`` in the API.
+    """
+
+    api_error: type[APIException]
+
+    def __init__(self, message: str, error_type: str) -> None:
+        super().__init__(message)
+        self.detail = {"message": message, "error_type": error_type}
+
+
+class UploadTooBig(RejectedUpload, RequestDataTooBig):
+    api_error = UploadTooLarge
+
+
+class TooManyFiles(RejectedUpload, TooManyFilesSent):
+    api_error = TooManyUploadedFiles
+
+
+class UnsupportedFile(RejectedUpload):
+    api_error = UnsupportedUploadType
+
+
+def request_too_large() -> UploadTooBig:
+    message = _("Maximum request size %(size)s exceeded.") % {"size": settings.MAX_UPLOAD_REQUEST_SIZE}
+    return UploadTooBig(message, "request_too_large")
+
+
+def is_image_signature(head: bytes) -> bool:
+    """Recognise JPEG, PNG, WebP and HEIF/HEIC by their magic bytes."""
+    if head.startswith((b"\xff\xd8\xff", b"\x89PNG\r\n\x1a\n")):
+        return True
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return True
+    return head[4:8] == b"ftyp" and head[8:12] in HEIF_BRANDS
+
+
+class StreamingLimitUploadHandler(FileUploadHandler):
+    """
+    Reject oversized or non-image uploads while the request body is still being streamed.
+
+    Must be the first entry of ``FILE_UPLOAD_HANDLERS``: it passes every chunk through unchanged
+    and only raises, so the memory/temporary file handlers after it never store rejected data.
+    It raises ``RejectedUpload``, which every view can answer, not DRF errors.
+    """
+
+    def handle_raw_input(
+        self,
+        input_data: IO[bytes],
+        META: dict[str, Any],  # noqa: N803
+        content_length: int,
+        boundary: bytes,
+        encoding: str | None = None,
+    ) -> None:
+        if content_length > settings.MAX_UPLOAD_REQUEST_SIZE:
+            raise request_too_large()
+        self.file_count = 0
+        self.request_size = 0
+
+    def new_file(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        super().new_file(*args, **kwargs)
+        self.file_count += 1
+        if self.file_count > settings.MAX_UPLOAD_FILES:
+            raise TooManyFiles(
+                _("Maximum number of files %(count)s exceeded.") % {"count": settings.MAX_UPLOAD_FILES},
+                "too_many_files",
+            )
+        self.file_size = 0
+        self.head = b""
+        self.sniffed = False
+
+    def receive_data_chunk(self, raw_data: bytes, start: int) -> bytes:
+        self.file_size += len(raw_data)
+        self.request_size += len(raw_data)
+        if self.file_size > settings.MAX_UPLOAD_SIZE:
+            raise UploadTooBig(
+                _("Maximum size %(size)s exceeded.") % {"size": settings.MAX_UPLOAD_SIZE}, "file_too_large"
+            )
+        if self.request_size > settings.MAX_UPLOAD_REQUEST_SIZE:
+            raise request_too_large()
+
+        if not self.sniffed:
+            self.head += raw_data[: SNIFF_SIZE - len(self.head)]
+            if len(self.head) >= SNIFF_SIZE:
+                self._check_signature()
+
+        return raw_data
+
+    def file_complete(self, file_size: int) -> None:
+        if not self.sniffed:
+            self._check_signature()
+
+    def _check_signature(self) -> None:
+        self.sniffed = True
+        signatures = NON_IMAGE_FIELDS.get(self.field_name)
+        allowed = self.head.startswith(signatures) if signatures else is_image_signature(self.head)
+        if not allowed:
+            raise UnsupportedFile(
+                _("File '%(name)s' has an unsupported type.") % {"name": self.file_name}, "unsupported_file_type"
+            )
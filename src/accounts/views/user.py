@@ -1,5 +1,6 @@
-from typing import Any, cast
+from typing import Any
 
+from django.db.models import QuerySet, prefetch_related_objects
 from drf_spectacular.utils import OpenApiExample, OpenApiParameter, OpenApiResponse, extend_schema
 from rest_framework import mixins, status, viewsets
 from rest_framework.decorators import action
@@ -8,7 +9,13 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 
 from accounts.models.user import DocumentImage, User
-from accounts.serializers.user import ClientSerializer, DocumentImageSerializer, UserSerializer
+from accounts.serializers.user import (
+    ClientSerializer,
+    DocumentImageSerializer,
+    UserSerializer,
+    UserSummarySerializer,
+)
+from accounts.services.profile_cache import cached_profile
 from accounts.services.single_resource import SingleResourceMixin
 from project.permissions import IsAdminOrManager, IsApproved
 
@@ -19,7 +26,10 @@ class CurrentUserViewSet(SingleResourceMixin, mixins.ListModelMixin):
     permission_classes = [IsAuthenticated]
 
     def get_object(self) -> User:
-        return cast(User, self.request.user)
+        # request.user holds the token claims and loads the rest of its row once the serializer reads it
+        user = self.request.user
+        prefetch_related_objects([user], "documents")
+        return user
 
     @extend_schema(
         summary="Retrieve the currently authenticated user",
@@ -43,6 +53,8 @@ class CurrentUserViewSet(SingleResourceMixin, mixins.ListModelMixin):
                                 {
                                     "id": 1,
                                     "image": "http://example.com/media/documents/2023/10/01/image1.jpg",
+                                    "thumbnail": "http://example.com/media/documents/2023/10/01/image1_thumbnail.webp",
+                                    "medium": "http://example.com/media/documents/2023/10/01/image1_medium.webp",
                                     "created": "2023-10-01T12:34:56Z",
                                 },
                             ],
@@ -54,7 +66,7 @@ class CurrentUserViewSet(SingleResourceMixin, mixins.ListModelMixin):
         },
     )
     def list(self, request: Request, *args: tuple[Any], **kwargs: dict[str, Any]) -> Response:
-        return super().list(request, *args, **kwargs)
+        return Response(cached_profile(request.user, lambda: self.get_serializer(self.get_object()).data))
 
     @extend_schema(
         summary="Onboard current user",
@@ -81,7 +93,7 @@ class CurrentUserViewSet(SingleResourceMixin, mixins.ListModelMixin):
             return Response({"message": "The user is already onboarded"}, status=status.HTTP_200_OK)
 
         user.is_onboarded = True
-        user.save()
+        user.save(update_fields=["is_onboarded", "updated_at"])
         return Response(
             {"message": f"User '{user.full_name}' has been successfully onboarded"}, status=status.HTTP_200_OK
         )
@@ -118,11 +130,15 @@ class DocumentImageViewSet(viewsets.ReadOnlyModelViewSet):
                             {
                                 "id": 1,
                                 "image": "http://example.com/media/documents/2023/10/01/image1.jpg",
+                                "thumbnail": "http://example.com/media/documents/2023/10/01/image1_thumbnail.webp",
+                                "medium": "http://example.com/media/documents/2023/10/01/image1_medium.webp",
                                 "created": "2023-10-01T12:34:56Z",
                             },
                             {
                                 "id": 2,
                                 "image": "http://example.com/media/documents/2023/10/01/image2.jpg",
+                                "thumbnail": "http://example.com/media/documents/2023/10/01/image2_thumbnail.webp",
+                                "medium": "http://example.com/media/documents/2023/10/01/image2_medium.webp",
                                 "created": "2023-10-01T12:35:56Z",
                             },
                         ],
@@ -142,9 +158,34 @@ class UserViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = UserSerializer
     permission_classes = [IsAdminOrManager]
 
+    def include_documents(self) -> bool:
+        # a single user always comes with documents, the list only with ?include=documents
+        if self.action != "list":
+            return True
+        include: str = self.request.query_params.get("include", "")
+        return "documents" in include.split(",")
+
+    def get_queryset(self) -> QuerySet:
+        queryset = super().get_queryset()
+        return queryset.prefetch_related("documents") if self.include_documents() else queryset
+
+    def get_serializer_class(self) -> Any:  # noqa: ANN401
+        return UserSerializer if self.include_documents() else UserSummarySerializer
+
     @extend_schema(
         summary="List all users",
-        description="Retrieve a list of all users. Only accessible to users with the role 'admin' or 'manager'.",
+        description="Retrieve a list of all users. Only accessible to users with the role 'admin' or 'manager'. "
+        "Documents are included only with ?include=documents.",
+        parameters=[
+            OpenApiParameter(
+                name="include",
+                type=str,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                enum=["documents"],
+                description="Add each user's documents to the response.",
+            ),
+        ],
         responses={
             200: OpenApiResponse(
                 description="Users retrieved successfully",
@@ -165,6 +206,8 @@ class UserViewSet(viewsets.ReadOnlyModelViewSet):
                                     {
                                         "id": 1,
                                         "image": "http://example.com/media/documents/2023/10/01/image1.jpg",
+                                        "thumbnail": "http://example.com/media/documents/2023/10/01/image1_thumbnail.webp",
+                                        "medium": "http://example.com/media/documents/2023/10/01/image1_medium.webp",
                                         "created": "2023-10-01T12:34:56Z",
                                     },
                                 ],
@@ -181,6 +224,8 @@ class UserViewSet(viewsets.ReadOnlyModelViewSet):
                                     {
                                         "id": 2,
                                         "image": "http://example.com/media/documents/2023/10/01/image1.jpg",
+                                        "thumbnail": "http://example.com/media/documents/2023/10/01/image1_thumbnail.webp",
+                                        "medium": "http://example.com/media/documents/2023/10/01/image1_medium.webp",
                                         "created": "2023-10-01T12:34:56Z",
                                     },
                                 ],
@@ -0,0 +1,56 @@
+from typing import Any, cast
+
+from django.core.management.base import ArgumentParser, BaseCommand, CommandError
+
+from accounts.models.user import User
+from project.query_audit import ENDPOINTS, audit_endpoints
+
+# longest SQL shown for a repeated pattern
+PATTERN_PREVIEW = 160
+
+
+class Command(BaseCommand):
+    help = (
+        "Request every API endpoint as every role against generated datasets of growing size and fail if an "
+        "endpoint's query count grows with the number of rows (N+1). Fixture rows are rolled back."
+    )
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument(
+            "--sizes", type=int, nargs="+", default=[5, 20], help="Rows of each kind per dataset (default: 5 20)"
+        )
+        parser.add_argument("--role", action="append", dest="roles", choices=User.Roles.values, help="Repeatable")
+        parser.add_argument("--endpoint", action="append", dest="endpoints", help="Repeatable (default: all)")
+        parser.add_argument(
+            "--tolerance", type=int, default=0, help="Extra queries allowed on the largest dataset (default: 0)"
+        )
+
+    def handle(self, *args: tuple[Any], **options: dict[str, Any]) -> None:
+        sizes = cast(list[int], options["sizes"])
+        tolerance = cast(int, options["tolerance"])
+        if len(set(sizes)) < 2:  # noqa: PLR2004
+            msg = "Give at least two different --sizes"
+            raise CommandError(msg)
+
+        audits = audit_endpoints(
+            sizes, cast(list[str] | None, options["roles"]), cast(list[str] | None, options["endpoints"]) or ENDPOINTS
+        )
+
+        growing = []
+        for audit in audits:
+            counts = " -> ".join(str(audit.queries[size]) for size in sorted(audit.queries))
+            statuses = "/".join(sorted({str(status) for status in audit.status.values()}))
+            line = f"GET {audit.endpoint} [{audit.role}] {statuses}: {counts} queries"
+            if not audit.grows(tolerance):
+                self.stdout.write(line)
+                continue
+
+            growing.append(audit)
+            self.stdout.write(self.style.ERROR(line))
+            for sql, count in audit.repeated:
+                self.stdout.write(f"    {count} x {sql[:PATTERN_PREVIEW]}")
+
+        if growing:
+            msg = f"{len(growing)} endpoint/role pairs run more queries on more rows"
+            raise CommandError(msg)
+        self.stdout.write(self.style.SUCCESS(f"{len(audits)} endpoint/role pairs, query counts do not grow"))
@@ -0,0 +1,49 @@
+from typing import Any, cast
+
+from django.core.management.base import ArgumentParser, BaseCommand
+
+from accounts.models.photo import BasePhoto
+from accounts.models.user import DocumentImage
+from accounts.services.renditions import generate_renditions
+from autotrips.models.acceptance_report import CarPhoto, DocumentPhoto, KeyPhoto
+from autotrips.models.vehicle_info import VehicleDocumentPhoto
+
+PHOTO_MODELS: tuple[type[BasePhoto], ...] = (CarPhoto, KeyPhoto, DocumentPhoto, VehicleDocumentPhoto, DocumentImage)
+
+
+class Command(BaseCommand):
+    help = "Generate thumbnail and medium renditions for already uploaded photos"
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument("--force", action="store_true", help="Regenerate renditions that already exist")
+        parser.add_argument("--batch-size", type=int, default=200, help="Rows fetched per query (default: 200)")
+
+    def handle(self, *args: tuple[Any], **options: dict[str, Any]) -> None:
+        force = cast(bool, options["force"])
+        batch_size = cast(int, options["batch_size"])
+
+        for model in PHOTO_MODELS:
+            success_count, error_count = self._process_model(model, force=force, batch_size=batch_size)
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{model._meta.verbose_name_plural}: generated {success_count}, errors {error_count}"  # noqa: SLF001
+                )
+            )
+
+    def _process_model(self, model: type[BasePhoto], *, force: bool, batch_size: int) -> tuple[int, int]:
+        success_count = 0
+        error_count = 0
+
+        queryset = model.objects.exclude(image="").order_by("pk")
+        if not force:
+            queryset = queryset.filter(thumbnail="")
+
+        for photo in queryset.iterator(chunk_size=batch_size):
+            try:
+                generate_renditions(photo)
+                success_count += 1
+            except Exception as e:  # noqa: BLE001
+                self.stdout.write(self.style.ERROR(f"{model.__name__} {photo.pk}: Error - {e!s}"))
+                error_count += 1
+
+        return success_count, error_count
@@ -0,0 +1,102 @@
+import time
+import uuid
+from collections.abc import Callable
+from functools import partial
+from typing import Any, cast
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import ArgumentParser, BaseCommand, CommandError
+from django.db import transaction
+from rest_framework import serializers
+
+from autotrips.models.vehicle_info import VehicleInfo, VehicleTransporter, VehicleType
+from autotrips.serializers.vehicle_bid import get_vehicle_bid_serializer
+from autotrips.views.vehicle_bid import VehicleBidViewSet
+from project.read_plan import ReadPlan, compile_plan
+
+User = get_user_model()
+
+# (role, status) pairs selecting every role serializer, also checked by autotrips.tests.test_read_plan
+BOARDS = (
+    ("admin", None),
+    ("logistician", "initial"),
+    ("logistician", "loading"),
+    ("opening_manager", None),
+    ("title", None),
+    ("inspector", None),
+    ("re_export", None),
+    ("user", None),
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark building the bid lists of every role with the DRF serializers and with their compiled "
+        "read plans (autotrips.tests.test_read_plan checks that both render to the same JSON). Fixture rows "
+        "are created inside a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument("--bids", type=int, default=5000, help="Number of bids (default: 5000)")
+        parser.add_argument("--passes", type=int, default=3, help="Builds per measurement (default: 3)")
+
+    def handle(self, *args: tuple[Any], **options: dict[str, Any]) -> None:
+        bids_count = cast(int, options["bids"])
+        passes = cast(int, options["passes"])
+
+        with transaction.atomic():
+            self._create_fixtures(bids_count)
+            queryset = VehicleBidViewSet.queryset.all()
+            self.stdout.write(f"{bids_count} bids, {passes} passes")
+            for role, status in BOARDS:
+                serializer_class = get_vehicle_bid_serializer(role, status)
+                plan = compile_plan(serializer_class())
+                if plan is None:
+                    msg = f"{serializer_class.__name__} cannot be compiled into a read plan"
+                    raise CommandError(msg)
+
+                serializer_ms = self._measure(passes, partial(self._serialize, serializer_class, queryset))
+                plan_ms = self._measure(passes, partial(self._read, plan, queryset))
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"{serializer_class.__name__}: serializer {serializer_ms:.0f} ms, "
+                        f"read plan {plan_ms:.0f} ms ({serializer_ms / plan_ms:.1f}x)"
+                    )
+                )
+            transaction.set_rollback(True)
+
+    @staticmethod
+    def _serialize(serializer_class: type[serializers.ModelSerializer], queryset: Any) -> Any:  # noqa: ANN401
+        return serializer_class(queryset.all(), many=True).data
+
+    @staticmethod
+    def _read(plan: ReadPlan, queryset: Any) -> Any:  # noqa: ANN401
+        return plan.rows(queryset.all())
+
+    @staticmethod
+    def _measure(passes: int, func: Callable[[], Any]) -> float:
+        started = time.perf_counter()
+        for _ in range(passes):
+            func()
+        return (time.perf_counter() - started) / passes * 1000
+
+    def _create_fixtures(self, bids_count: int) -> None:
+        # bulk_create() on the base managers: no registration/table/Telegram signals for fixture rows
+        token = uuid.uuid4().hex[:12]
+        client = User._base_manager.bulk_create(  # noqa: SLF001
+            [User(full_name="Benchmark", phone=f"+0{token[:10]}", username=f"benchmark-{token}", role="client")]
+        )[0]
+        v_type = VehicleType.objects.create(v_type=f"benchmark-{token}")
+        transporter = VehicleTransporter.objects.create(number=token[:10])
+        VehicleInfo._base_manager.bulk_create(  # noqa: SLF001
+            VehicleInfo(
+                client=client,
+                v_type=v_type if number % 2 else None,
+                vehicle_transporter=transporter if number % 3 else None,
+                year_brand_model="2020 Benchmark Model",
+                vin=f"BENCH{token}{number:06d}",
+                price=number * 10,
+                comment="Комментарий к заявке",
+            )
+            for number in range(bids_count)
+        )
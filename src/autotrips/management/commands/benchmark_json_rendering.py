@@ -0,0 +1,80 @@
+import io
+import time
+import uuid
+from collections.abc import Callable
+from functools import partial
+from typing import Any, cast
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import ArgumentParser, BaseCommand
+from django.db import transaction
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from autotrips.models.vehicle_info import VehicleInfo, VehicleType
+from autotrips.serializers.vehicle_bid import AdminVehicleBidSerialiser
+from autotrips.views.vehicle_bid import VehicleBidViewSet
+from project.parsers import ORJSONParser
+from project.renderers import ORJSONRenderer
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark rendering the admin bid list to JSON and parsing it back with DRF's stdlib-json classes and "
+        "the orjson ones. Fixture rows are created inside a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument("--bids", type=int, default=2000, help="Number of bids (default: 2000)")
+        parser.add_argument("--passes", type=int, default=20, help="Renders per measurement (default: 20)")
+
+    def handle(self, *args: tuple[Any], **options: dict[str, Any]) -> None:
+        bids_count = cast(int, options["bids"])
+        passes = cast(int, options["passes"])
+
+        with transaction.atomic():
+            self._create_fixtures(bids_count)
+            data = AdminVehicleBidSerialiser(VehicleBidViewSet.queryset.all(), many=True).data
+            transaction.set_rollback(True)
+
+        content = JSONRenderer().render(data)
+        if ORJSONRenderer().render(data) != content:
+            self.stdout.write(self.style.WARNING("orjson output differs from the stdlib renderer"))
+        self.stdout.write(f"{len(data)} bids, {len(content) / 1024:.0f} KiB of JSON, {passes} passes")
+
+        for label, renderer in (("stdlib json render", JSONRenderer()), ("orjson render", ORJSONRenderer())):
+            self._measure(label, passes, partial(renderer.render, data))
+        for label, parser in (("stdlib json parse", JSONParser()), ("orjson parse", ORJSONParser())):
+            self._measure(label, passes, partial(self._parse, parser, content))
+
+    def _measure(self, label: str, passes: int, func: Callable[[], Any]) -> None:
+        started = time.perf_counter()
+        for _ in range(passes):
+            func()
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(f"{label}: {elapsed / passes * 1000:.1f} ms per pass"))
+
+    @staticmethod
+    def _parse(parser: JSONParser, content: bytes) -> Any:  # noqa: ANN401
+        return parser.parse(io.BytesIO(content))
+
+    def _create_fixtures(self, bids_count: int) -> None:
+        # bulk_create() on the base managers: no registration/table/Telegram signals for fixture rows
+        token = uuid.uuid4().hex[:12]
+        client = User._base_manager.bulk_create(  # noqa: SLF001
+            [User(full_name="Benchmark", phone=f"+0{token[:10]}", username=f"benchmark-{token}", role="client")]
+        )[0]
+        v_type = VehicleType.objects.create(v_type=f"benchmark-{token}")
+        VehicleInfo._base_manager.bulk_create(  # noqa: SLF001
+            VehicleInfo(
+                client=client,
+                v_type=v_type,
+                year_brand_model="2020 Benchmark Model",
+                vin=f"BENCH{token}{number:06d}",
+                price=number * 10,
+                comment="Комментарий к заявке",
+            )
+            for number in range(bids_count)
+        )
@@ -0,0 +1,87 @@
+import time
+import uuid
+from collections.abc import Callable
+from typing import Any, cast
+
+from django.contrib.auth import get_user_model
+from django.core.files.storage import default_storage
+from django.core.management.base import ArgumentParser, BaseCommand
+from django.db import transaction
+
+from autotrips.models.acceptance_report import AcceptenceReport, CarPhoto, DocumentPhoto, KeyPhoto
+from autotrips.models.vehicle_info import VehicleInfo
+from autotrips.serializers.acceptance_report import AcceptanceReportSerializer
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark serializing a list of acceptance reports with photos. "
+        "Fixture rows are created inside a transaction that is rolled back; no files are uploaded."
+    )
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument("--reports", type=int, default=1000, help="Number of reports (default: 1000)")
+        parser.add_argument("--photos", type=int, default=3, help="Photos of each kind per report (default: 3)")
+
+    def handle(self, *args: tuple[Any], **options: dict[str, Any]) -> None:
+        reports_count = cast(int, options["reports"])
+        photos_count = cast(int, options["photos"])
+
+        if not getattr(default_storage, "querystring_auth", False):
+            self.stdout.write(self.style.WARNING(f"{type(default_storage).__name__} does not sign URLs"))
+
+        with transaction.atomic():
+            reports = self._create_fixtures(reports_count, photos_count)
+            urls_count = len(reports) * photos_count * 3 * 3  # photo kinds * (image, thumbnail, medium)
+            self.stdout.write(f"{len(reports)} reports, {urls_count} photo URLs per pass")
+
+            cache_window = getattr(default_storage, "url_cache_window", None)
+            if cache_window:
+                default_storage.url_cache_window = 0
+                self._measure("signing every URL", lambda: AcceptanceReportSerializer(reports, many=True).data)
+                default_storage.url_cache_window = cache_window
+
+            self._measure("cold URL cache", lambda: AcceptanceReportSerializer(reports, many=True).data)
+            self._measure("warm URL cache", lambda: AcceptanceReportSerializer(reports, many=True).data)
+
+            transaction.set_rollback(True)
+
+    def _measure(self, label: str, func: Callable[[], Any]) -> None:
+        started = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(f"{label}: {elapsed * 1000:.1f} ms"))
+
+    def _create_fixtures(self, reports_count: int, photos_count: int) -> list[AcceptenceReport]:
+        # bulk_create() on the base managers: no registration/table/Telegram signals for fixture rows
+        token = uuid.uuid4().hex[:12]
+        user = User._base_manager.bulk_create(  # noqa: SLF001
+            [User(full_name="Benchmark", phone=f"+0{token[:10]}", username=f"benchmark-{token}")]
+        )[0]
+        vehicle = VehicleInfo._base_manager.bulk_create(  # noqa: SLF001
+            [VehicleInfo(client=user, year_brand_model="Benchmark", vin=f"BENCH{token}")]
+        )[0]
+        reports = AcceptenceReport.objects.bulk_create(
+            AcceptenceReport(reporter=user, vehicle=vehicle, report_number=number)
+            for number in range(1, reports_count + 1)
+        )
+
+        for model, folder in ((CarPhoto, "cars"), (KeyPhoto, "keys"), (DocumentPhoto, "car-docs")):
+            model.objects.bulk_create(
+                model(
+                    report=report,
+                    image=f"{folder}/benchmark/{token}/{report.pk}_{index}.jpg",
+                    thumbnail=f"{folder}/benchmark/{token}/{report.pk}_{index}_thumbnail.webp",
+                    medium=f"{folder}/benchmark/{token}/{report.pk}_{index}_medium.webp",
+                )
+                for report in reports
+                for index in range(photos_count)
+            )
+
+        return list(
+            AcceptenceReport.objects.filter(vehicle=vehicle)
+            .select_related("reporter", "vehicle")
+            .prefetch_related("car_photos", "key_photos", "document_photos")
+        )
@@ -0,0 +1,65 @@
+from datetime import timedelta
+from typing import Any, cast
+
+from django.apps import apps
+from django.core.files.storage import default_storage
+from django.core.management.base import ArgumentParser, BaseCommand
+from django.utils import timezone
+
+from accounts.models.photo import BasePhoto, PhotoBlob, StorageDeletion
+from services.storage import iter_stored_files
+
+
+class Command(BaseCommand):
+    help = "Find stored photo files that no row references any more and delete them"
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument(
+            "--min-age",
+            type=int,
+            default=24,
+            help="Only files older than this many hours, so uploads in flight are kept (default: 24)",
+        )
+        parser.add_argument("--dry-run", action="store_true", help="Only list orphaned files")
+
+    def handle(self, *args: tuple[Any], **options: dict[str, Any]) -> None:
+        min_age = cast(int, options["min_age"])
+        dry_run = cast(bool, options["dry_run"])
+
+        photo_models = [model for model in apps.get_models() if issubclass(model, BasePhoto)]
+        referenced = self._referenced_names(photo_models)
+        prefixes = sorted({self._upload_prefix(model) for model in photo_models})
+        cutoff = timezone.now() - timedelta(hours=min_age)
+
+        orphans = [
+            name
+            for prefix in prefixes
+            for name, modified in iter_stored_files(default_storage, prefix)
+            if name not in referenced and modified < cutoff
+        ]
+
+        for name in orphans:
+            self.stdout.write(name)
+        if dry_run:
+            self.stdout.write(self.style.SUCCESS(f"Orphaned files: {len(orphans)}"))
+            return
+
+        StorageDeletion.objects.bulk_create([StorageDeletion(name=name) for name in orphans], ignore_conflicts=True)
+        purged = StorageDeletion.objects.purge()
+        self.stdout.write(self.style.SUCCESS(f"Orphaned files: {len(orphans)}, deleted {purged}"))
+
+    def _referenced_names(self, photo_models: list[type[BasePhoto]]) -> set[str]:
+        referenced: set[str] = set()
+        for model in photo_models:
+            for names in model.objects.values_list("image", "thumbnail", "medium").iterator(chunk_size=2000):
+                referenced.update(names)
+        for names in PhotoBlob.objects.values_list("image", "thumbnail", "medium").iterator(chunk_size=2000):
+            referenced.update(names)
+        # already queued files are deleted by the queue itself
+        referenced.update(StorageDeletion.objects.values_list("name", flat=True))
+        referenced.discard("")
+        return referenced
+
+    def _upload_prefix(self, model: type[BasePhoto]) -> str:
+        upload_to = model._meta.get_field("image").upload_to  # noqa: SLF001
+        return cast(str, upload_to).split("%", 1)[0]
@@ -0,0 +1,54 @@
+# Generated by Django 5.2.18 on 2026-10-19 01:40
+
+import accounts.models.photo
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('autotrips', '0017_alter_vehicledocumentphoto_options_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='carphoto',
+            name='medium',
+            field=models.ImageField(blank=True, default='', upload_to=accounts.models.photo.rendition_upload_to, verbose_name='Medium'),
+        ),
+        migrations.AddField(
+            model_name='carphoto',
+            name='thumbnail',
+            field=models.ImageField(blank=True, default='', upload_to=accounts.models.photo.rendition_upload_to, verbose_name='Thumbnail'),
+        ),
+        migrations.AddField(
+            model_name='documentphoto',
+            name='medium',
+            field=models.ImageField(blank=True, default='', upload_to=accounts.models.photo.rendition_upload_to, verbose_name='Medium'),
+        ),
+        migrations.AddField(
+            model_name='documentphoto',
+            name='thumbnail',
+            field=models.ImageField(blank=True, default='', upload_to=accounts.models.photo.rendition_upload_to, verbose_name='Thumbnail'),
+        ),
+        migrations.AddField(
+            model_name='keyphoto',
+            name='medium',
+            field=models.ImageField(blank=True, default='', upload_to=accounts.models.photo.rendition_upload_to, verbose_name='Medium'),
+        ),
+        migrations.AddField(
+            model_name='keyphoto',
+            name='thumbnail',
+            field=models.ImageField(blank=True, default='', upload_to=accounts.models.photo.rendition_upload_to, verbose_name='Thumbnail'),
+        ),
+        migrations.AddField(
+            model_name='vehicledocumentphoto',
+            name='medium',
+            field=models.ImageField(blank=True, default='', upload_to=accounts.models.photo.rendition_upload_to, verbose_name='Medium'),
+        ),
+        migrations.AddField(
+            model_name='vehicledocumentphoto',
+            name='thumbnail',
+            field=models.ImageField(blank=True, default='', upload_to=accounts.models.photo.rendition_upload_to, verbose_name='Thumbnail'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-19 01:46
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0011_photoblob_documentimage_blob'),
+        ('autotrips', '0018_carphoto_medium_carphoto_thumbnail_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='carphoto',
+            name='blob',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='accounts.photoblob', verbose_name='Blob'),
+        ),
+        migrations.AddField(
+            model_name='documentphoto',
+            name='blob',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='accounts.photoblob', verbose_name='Blob'),
+        ),
+        migrations.AddField(
+            model_name='keyphoto',
+            name='blob',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='accounts.photoblob', verbose_name='Blob'),
+        ),
+        migrations.AddField(
+            model_name='vehicledocumentphoto',
+            name='blob',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='accounts.photoblob', verbose_name='Blob'),
+        ),
+    ]
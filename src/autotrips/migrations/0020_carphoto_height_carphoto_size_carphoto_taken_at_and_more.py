@@ -0,0 +1,93 @@
+# Generated by Django 5.2.18 on 2026-10-19 01:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('autotrips', '0019_carphoto_blob_documentphoto_blob_keyphoto_blob_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='carphoto',
+            name='height',
+            field=models.PositiveIntegerField(blank=True, null=True, verbose_name='Height'),
+        ),
+        migrations.AddField(
+            model_name='carphoto',
+            name='size',
+            field=models.PositiveBigIntegerField(blank=True, null=True, verbose_name='Size'),
+        ),
+        migrations.AddField(
+            model_name='carphoto',
+            name='taken_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Taken at'),
+        ),
+        migrations.AddField(
+            model_name='carphoto',
+            name='width',
+            field=models.PositiveIntegerField(blank=True, null=True, verbose_name='Width'),
+        ),
+        migrations.AddField(
+            model_name='documentphoto',
+            name='height',
+            field=models.PositiveIntegerField(blank=True, null=True, verbose_name='Height'),
+        ),
+        migrations.AddField(
+            model_name='documentphoto',
+            name='size',
+            field=models.PositiveBigIntegerField(blank=True, null=True, verbose_name='Size'),
+        ),
+        migrations.AddField(
+            model_name='documentphoto',
+            name='taken_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Taken at'),
+        ),
+        migrations.AddField(
+            model_name='documentphoto',
+            name='width',
+            field=models.PositiveIntegerField(blank=True, null=True, verbose_name='Width'),
+        ),
+        migrations.AddField(
+            model_name='keyphoto',
+            name='height',
+            field=models.PositiveIntegerField(blank=True, null=True, verbose_name='Height'),
+        ),
+        migrations.AddField(
+            model_name='keyphoto',
+            name='size',
+            field=models.PositiveBigIntegerField(blank=True, null=True, verbose_name='Size'),
+        ),
+        migrations.AddField(
+            model_name='keyphoto',
+            name='taken_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Taken at'),
+        ),
+        migrations.AddField(
+            model_name='keyphoto',
+            name='width',
+            field=models.PositiveIntegerField(blank=True, null=True, verbose_name='Width'),
+        ),
+        migrations.AddField(
+            model_name='vehicledocumentphoto',
+            name='height',
+            field=models.PositiveIntegerField(blank=True, null=True, verbose_name='Height'),
+        ),
+        migrations.AddField(
+            model_name='vehicledocumentphoto',
+            name='size',
+            field=models.PositiveBigIntegerField(blank=True, null=True, verbose_name='Size'),
+        ),
+        migrations.AddField(
+            model_name='vehicledocumentphoto',
+            name='taken_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Taken at'),
+        ),
+        migrations.AddField(
+            model_name='vehicledocumentphoto',
+            name='width',
+            field=models.PositiveIntegerField(blank=True, null=True, verbose_name='Width'),
+        ),
+    ]
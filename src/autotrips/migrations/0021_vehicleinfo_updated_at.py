@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:12
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('autotrips', '0020_carphoto_height_carphoto_size_carphoto_taken_at_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='vehicleinfo',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now, verbose_name='Updated at'),
+            preserve_default=False,
+        ),
+    ]
@@ -5,6 +5,7 @@ from django.db import models
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+from accounts.models.photo import BasePhoto
 from autotrips.models.vehicle_info import VehicleInfo
 
 User = get_user_model()
@@ -49,7 +50,7 @@ class AcceptenceReport(models.Model):
         super().save(*args, **kwargs)
 
 
-class CarPhoto(models.Model):
+class CarPhoto(BasePhoto):
     report = models.ForeignKey(
         AcceptenceReport, on_delete=models.CASCADE, related_name="car_photos", verbose_name=_("Report")
     )
@@ -64,7 +65,7 @@ class CarPhoto(models.Model):
         return f"{self.report.vehicle.year_brand_model}_car_{self.created}"
 
 
-class KeyPhoto(models.Model):
+class KeyPhoto(BasePhoto):
     report = models.ForeignKey(
         AcceptenceReport, on_delete=models.CASCADE, related_name="key_photos", verbose_name=_("Report")
     )
@@ -79,7 +80,7 @@ class KeyPhoto(models.Model):
         return f"{self.report.vehicle.year_brand_model}_key_{self.created}"
 
 
-class DocumentPhoto(models.Model):
+class DocumentPhoto(BasePhoto):
     report = models.ForeignKey(
         AcceptenceReport, on_delete=models.CASCADE, related_name="document_photos", verbose_name=_("Report")
     )
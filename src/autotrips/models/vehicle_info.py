@@ -6,6 +6,7 @@ from django.db import models
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+from accounts.models.photo import BasePhoto
 from autotrips.models.managers import VehicleInfoManager
 
 User = get_user_model()
@@ -140,6 +141,8 @@ class VehicleInfo(models.Model):
     status = models.CharField(_("Status"), max_length=20, choices=Statuses.choices, default=Statuses.INITIAL)
     status_changed = models.DateTimeField(_("Status changed"), default=timezone.now)
     creation_time = models.DateTimeField(_("Creation time"), default=timezone.now)
+    # the row version of the cached list fragments (autotrips.services.fragments): QuerySet.update() calls must set it
+    updated_at = models.DateTimeField(_("Updated at"), auto_now=True)
 
     objects = VehicleInfoManager()
 
@@ -204,7 +207,7 @@ class VehicleTransporter(models.Model):
         return str(self.number)
 
 
-class VehicleDocumentPhoto(models.Model):
+class VehicleDocumentPhoto(BasePhoto):
     vehicle = models.ForeignKey(
         VehicleInfo, on_delete=models.CASCADE, related_name="document_photos", verbose_name=_("Vehicle")
     )
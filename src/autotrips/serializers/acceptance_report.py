@@ -22,24 +22,28 @@ class UserReportSerializer(serializers.ModelSerializer):
 class CarPhotoSerializer(serializers.ModelSerializer):
     class Meta:
         model = CarPhoto
-        fields = ["id", "image", "created"]
+        fields = ["id", "image", "thumbnail", "medium", "created"]
+        read_only_fields = ["thumbnail", "medium"]
 
 
 class KeyPhotoSerializer(serializers.ModelSerializer):
     class Meta:
         model = KeyPhoto
-        fields = ["id", "image", "created"]
+        fields = ["id", "image", "thumbnail", "medium", "created"]
+        read_only_fields = ["thumbnail", "medium"]
 
 
 class DocumentPhotoSerializer(serializers.ModelSerializer):
     class Meta:
         model = DocumentPhoto
-        fields = ["id", "image", "created"]
+        fields = ["id", "image", "thumbnail", "medium", "created"]
+        read_only_fields = ["thumbnail", "medium"]
 
 
 class AcceptanceReportSerializer(serializers.ModelSerializer):
     reporter = UserReportSerializer(read_only=True)
-    vin = serializers.CharField(write_only=True, required=True)
+    vin = serializers.CharField(source="vehicle.vin", required=True)
+    year_brand_model = serializers.CharField(source="vehicle.year_brand_model", read_only=True)
     car_photos = CarPhotoSerializer(many=True, read_only=True)
     uploaded_car_photos = serializers.ListField(
         child=HEIFImageField(
@@ -81,7 +85,6 @@ class AcceptanceReportSerializer(serializers.ModelSerializer):
         model = AcceptenceReport
         fields = [
             "id",
-            "vin",
             "reporter",
             "place",
             "comment",
@@ -95,6 +98,9 @@ class AcceptanceReportSerializer(serializers.ModelSerializer):
             "car_photos",
             "key_photos",
             "document_photos",
+            # last, where to_representation() used to add them
+            "vin",
+            "year_brand_model",
         ]
         read_only_fields = ["report_number", "report_time", "acceptance_date"]
 
@@ -102,7 +108,7 @@ class AcceptanceReportSerializer(serializers.ModelSerializer):
         uploaded_car_photos = validated_data.pop("uploaded_car_photos")
         uploaded_key_photos = validated_data.pop("uploaded_key_photos")
         uploaded_doc_photos = validated_data.pop("uploaded_document_photos")
-        vin = validated_data.pop("vin")
+        vin = validated_data.pop("vehicle")["vin"]
 
         try:
             vehicle = VehicleInfo.objects.get(vin=vin)
@@ -122,12 +128,6 @@ class AcceptanceReportSerializer(serializers.ModelSerializer):
 
         return report
 
-    def to_representation(self, instance: AcceptenceReport) -> Any:  # noqa: ANN401
-        data = super().to_representation(instance)
-        data["vin"] = instance.vehicle.vin
-        data["year_brand_model"] = instance.vehicle.year_brand_model
-        return data
-
 
 class AcceptanceReportPartialUpdateSerializer(serializers.Serializer):
     uploaded_car_photos = serializers.ListField(
@@ -1,10 +1,13 @@
-from typing import Any
+from datetime import date
+from typing import Any, ClassVar
 
+from django.db.models import Expression, OuterRef, Subquery
 from django.utils.translation import gettext_lazy as _
 from drf_spectacular.utils import OpenApiExample, extend_schema_serializer
 from rest_framework import serializers
 
 from accounts.serializers.user import ClientSerializer
+from autotrips.models.acceptance_report import AcceptenceReport
 from autotrips.models.vehicle_info import VehicleInfo, VehicleTransporter
 from autotrips.serializers.vehicle_info import VehicleTypeSerializer
 
@@ -240,6 +243,9 @@ class LogisticianLoadingVehicleBidSerializer(BaseVehicleBidSerializer):
     ]
     required_fields = ["logistician_keys_number", "vehicle_transporter"]
     protected_fields = ["logistician_keys_number", "vehicle_transporter"]
+    read_plan_nested: ClassVar[dict[str, type[serializers.Serializer]]] = {
+        "vehicle_transporter": VehicleTransporterSerializer
+    }
 
     def update(self, instance: VehicleInfo, validated_data: dict[str, Any]) -> VehicleInfo:
         if instance.logistician_keys_number and instance.vehicle_transporter and instance.approved_by_receiver:
@@ -255,7 +261,7 @@ class LogisticianLoadingVehicleBidSerializer(BaseVehicleBidSerializer):
 
     def to_representation(self, instance: VehicleInfo) -> Any:  # noqa: ANN401
         data = super().to_representation(instance)
-        if instance.vehicle_transporter:
+        if "vehicle_transporter" in data and instance.vehicle_transporter:
             data["vehicle_transporter"] = VehicleTransporterSerializer(instance.vehicle_transporter).data
         return data
 
@@ -310,7 +316,17 @@ class TitleVehicleBidSerializer(BaseVehicleBidSerializer):
 
 
 class InspectorVehicleBidSerializer(BaseVehicleBidSerializer):
-    read_only_fields = ["location", "transit_method"]
+    acceptance_date = serializers.SerializerMethodField()
+
+    read_plan_annotations: ClassVar[dict[str, Expression]] = {
+        "acceptance_date": Subquery(
+            AcceptenceReport.objects.filter(vehicle=OuterRef("pk"))
+            .order_by("-acceptance_date")
+            .values("acceptance_date")[:1]
+        )
+    }
+
+    read_only_fields = ["location", "transit_method", "acceptance_date"]
     required_fields = ["inspection_done"]
     protected_fields = ["inspection_done", "inspection_date"]
     optional_fields = [
@@ -342,13 +358,11 @@ class InspectorVehicleBidSerializer(BaseVehicleBidSerializer):
 
         return super().update(instance, validated_data)
 
-    def to_representation(self, instance: VehicleInfo) -> Any:  # noqa: ANN401
-        response_data = super().to_representation(instance)
-        acceptance_date = (
+    def get_acceptance_date(self, instance: VehicleInfo) -> date | None:
+        acceptance_date: date | None = (
             instance.reports.order_by("-acceptance_date").values_list("acceptance_date", flat=True).first()
         )
-        response_data["acceptance_date"] = acceptance_date
-        return response_data
+        return acceptance_date
 
 
 class ReExportVehicleBidSerializer(BaseVehicleBidSerializer):
@@ -1,3 +1,4 @@
+from collections.abc import Iterable, Mapping
 from typing import Any
 
 import pandas as pd
@@ -5,19 +6,77 @@ from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AbstractUser
 from django.core.files.uploadedfile import UploadedFile
+from django.db.models import QuerySet, prefetch_related_objects
 from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
 from rest_framework.validators import UniqueValidator
 
 from accounts.serializers.custom_image import HEIFImageField
 from accounts.serializers.user import ClientSerializer
+from accounts.services.renditions import schedule_renditions
 from accounts.validators import FileMaxSizeValidator
 from autotrips.models.vehicle_info import VehicleDocumentPhoto, VehicleInfo, VehicleType
 
 User = get_user_model()
 
 
+class PrefetchedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    ``PrimaryKeyRelatedField`` that resolves ids among objects loaded in advance for a whole list of items.
+
+    Ids that were not loaded (missing objects, malformed values) go through the regular lookup, so they fail
+    with the usual errors.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:  # noqa: ANN401
+        super().__init__(**kwargs)
+        self.prefetched: dict[str, Any] = {}
+
+    def prefetch(self, values: Iterable[Any]) -> None:
+        ids = {str(value) for value in values if not isinstance(value, bool) and str(value).isdigit()}
+        if ids:
+            self.prefetched = {str(obj.pk): obj for obj in self.get_queryset().filter(pk__in=ids)}
+
+    def to_internal_value(self, data: Any) -> Any:  # noqa: ANN401
+        if not isinstance(data, bool) and str(data) in self.prefetched:
+            return self.prefetched[str(data)]
+        return super().to_internal_value(data)
+
+
+class PrefetchedUniqueValidator(UniqueValidator):
+    """``UniqueValidator`` checking against the values known to be taken instead of querying for each value."""
+
+    def __init__(self, taken: set[str], queryset: QuerySet, message: Any = None) -> None:  # noqa: ANN401
+        super().__init__(queryset=queryset, message=message)
+        self.taken = taken
+
+    def __call__(self, value: Any, serializer_field: serializers.Field) -> None:  # noqa: ANN401
+        if value in self.taken:
+            raise serializers.ValidationError(self.message, code="unique")
+
+
 class VehicleInfoListSerializer(serializers.ListSerializer):
+    def to_internal_value(self, data: Any) -> list[dict[str, Any]]:  # noqa: ANN401
+        if isinstance(data, list):
+            self.prefetch_lookups([item for item in data if isinstance(item, Mapping)])
+        return super().to_internal_value(data)  # type: ignore[no-any-return]
+
+    def prefetch_lookups(self, items: list[Mapping[str, Any]]) -> None:
+        """Check the VINs and resolve the client and type ids of all items with one query each."""
+        fields = self.child.fields
+
+        vins = {item["vin"].strip() for item in items if isinstance(item.get("vin"), str)}
+        taken = set(VehicleInfo.objects.filter(vin__in=vins).values_list("vin", flat=True)) if vins else set()
+        fields["vin"].validators = [
+            PrefetchedUniqueValidator(taken, validator.queryset, validator.message)
+            if isinstance(validator, UniqueValidator)
+            else validator
+            for validator in fields["vin"].validators
+        ]
+
+        for name in ("client", "v_type"):
+            fields[name].prefetch(item.get(name) for item in items)
+
     def validate(self, attrs: list[dict[str, Any]]) -> list[dict[str, Any]]:
         if not attrs:
             return attrs
@@ -52,8 +111,14 @@ class VehicleInfoListSerializer(serializers.ListSerializer):
         ]
 
         if vehicle_photos_to_create:
-            VehicleDocumentPhoto.objects.bulk_create(vehicle_photos_to_create)
-
+            # bulk_create() skips save(), so deduplicate the uploads explicitly
+            for photo in vehicle_photos_to_create:
+                photo.attach_blob()
+            created_photos = VehicleDocumentPhoto.objects.bulk_create(vehicle_photos_to_create)
+            schedule_renditions(created_photos)
+
+        # one query for the photos of all created vehicles instead of one per vehicle in the response
+        prefetch_related_objects(created_vehicles, "document_photos")
         return created_vehicles  # type: ignore[no-any-return]
 
     def update(self, _: VehicleInfo, __: dict[str, Any]) -> None:
@@ -63,14 +128,15 @@ class VehicleInfoListSerializer(serializers.ListSerializer):
 class VehicleDocumentPhotoSerializer(serializers.ModelSerializer):
     class Meta:
         model = VehicleDocumentPhoto
-        fields = ["id", "image", "created"]
+        fields = ["id", "image", "thumbnail", "medium", "created"]
+        read_only_fields = ["thumbnail", "medium"]
 
 
 class VehicleInfoSerializer(serializers.ModelSerializer):
-    client = serializers.PrimaryKeyRelatedField(
+    client = PrefetchedPrimaryKeyRelatedField(
         queryset=User.objects.filter(role=User.Roles.CLIENT), write_only=False, required=True
     )
-    v_type = serializers.PrimaryKeyRelatedField(
+    v_type = PrefetchedPrimaryKeyRelatedField(
         queryset=VehicleType.objects.all(), write_only=False, required=False, allow_null=True
     )
     price = serializers.DecimalField(max_digits=12, decimal_places=2, required=False, allow_null=True)
@@ -139,8 +205,10 @@ class VehicleInfoSerializer(serializers.ModelSerializer):
 
     def to_representation(self, instance: VehicleInfo) -> Any:  # noqa: ANN401
         representation = super().to_representation(instance)
-        representation["client"] = ClientSerializer(instance.client).data
-        representation["v_type"] = VehicleTypeSerializer(instance.v_type).data if instance.v_type else None
+        if "client" in representation:
+            representation["client"] = ClientSerializer(instance.client).data
+        if "v_type" in representation:
+            representation["v_type"] = VehicleTypeSerializer(instance.v_type).data if instance.v_type else None
         return representation
 
     def create(self, validated_data: dict[str, Any]) -> VehicleInfo:
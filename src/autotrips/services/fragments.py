@@ -0,0 +1,64 @@
+import hashlib
+from collections.abc import Callable, Hashable, Mapping
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models.query import QuerySet
+from django.utils import timezone
+
+from autotrips.models.vehicle_info import VehicleInfo
+
+FRAGMENT_CACHE_KEY = "vehicle-fragment:{variant}:{pk}:{version}"
+
+Fragment = Mapping[str, Any]
+
+
+def fragment_variant(*parts: Hashable) -> str:
+    """
+    Digest of what shapes a row's representation besides the row: serializer class, field selection, host.
+
+    The active timezone is always added, datetimes are rendered in it.
+    """
+    parts = (*parts, timezone.get_current_timezone_name())
+    return hashlib.blake2b(repr(parts).encode(), digest_size=8).hexdigest()
+
+
+def cached_fragments(
+    queryset: QuerySet[VehicleInfo],
+    variant: str,
+    serialize: Callable[[QuerySet[VehicleInfo]], list[Fragment]],
+    cacheable: Callable[[Fragment], bool] | None = None,
+) -> list[Fragment]:
+    """
+    Representations of the vehicles in ``queryset``, in its order, serializing only rows not cached yet.
+
+    One query reads the ids and ``updated_at`` of the rows, the cache returns the fragments stored for those
+    versions and ``serialize`` gets the queryset narrowed to the rest. Saving a vehicle moves ``updated_at``, so
+    the next read misses its old fragment; rows from ``bulk_create()`` have none yet. Changes to the related rows
+    a fragment embeds bump ``updated_at`` of their vehicles (``autotrips.signals``). Fragments ``cacheable``
+    rejects are returned but not stored; stored ones live ``VEHICLE_FRAGMENT_CACHE_TIMEOUT`` seconds.
+    """
+    keys = [
+        (pk, FRAGMENT_CACHE_KEY.format(variant=variant, pk=pk, version=updated_at.timestamp()))
+        for pk, updated_at in queryset.values_list("pk", "updated_at")
+    ]
+    cache = caches["vehicle_fragments"]
+    fragments = cache.get_many([key for _, key in keys])
+    missing = {pk: key for pk, key in keys if key not in fragments}
+    if missing:
+        # a cold list is serialized as it is, not through a filter on every id
+        rows = queryset if len(missing) == len(keys) else queryset.filter(pk__in=missing)
+        fresh = {missing[data["id"]]: data for data in serialize(rows) if data["id"] in missing}
+        fragments.update(fresh)
+        cache.set_many(
+            {key: data for key, data in fresh.items() if cacheable is None or cacheable(data)},
+            settings.VEHICLE_FRAGMENT_CACHE_TIMEOUT,
+        )
+    # a row deleted between the two queries is left out
+    return [fragments[key] for _, key in keys if key in fragments]
+
+
+def touch_vehicles(**lookup: Any) -> None:  # noqa: ANN401
+    """Bump ``updated_at`` of the vehicles matching ``lookup``, so their cached fragments are serialized again."""
+    VehicleInfo.objects.filter(**lookup).update(updated_at=timezone.now())
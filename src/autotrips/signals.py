@@ -1,15 +1,23 @@
 import asyncio
+import html
 import logging
 from typing import Any
 
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 from django.conf import settings
-from django.db.models.signals import post_save
+from django.db.models import Model
+from django.db.models.signals import post_delete, post_save, pre_delete
 from django.utils import timezone
 
-from autotrips.models.acceptance_report import AcceptenceReport
+from accounts.models import User
+from accounts.models.photo import BasePhoto
+from accounts.serializers.user import ClientSerializer
+from accounts.services.renditions import schedule_renditions
+from autotrips.models.acceptance_report import AcceptenceReport, CarPhoto, DocumentPhoto, KeyPhoto
 from autotrips.models.managers import vehicle_info_save
-from autotrips.models.vehicle_info import VehicleInfo
+from autotrips.models.vehicle_info import VehicleDocumentPhoto, VehicleInfo, VehicleTransporter, VehicleType
+from autotrips.services.fragments import touch_vehicles
+from project.metrics import external_call
 from services.table_service import crm_table_manager, table_manager
 
 logger = logging.getLogger(__name__)
@@ -92,11 +100,15 @@ class PostReportSaveSignalReciever:
                     )
                 )
             else:
-                loop.run_until_complete(
-                    bot.send_message(
-                        chat_id=settings.TELEGRAM_GROUP_CHAT_ID, text=message, parse_mode="HTML", reply_markup=keyboard
+                with external_call("telegram"):
+                    loop.run_until_complete(
+                        bot.send_message(
+                            chat_id=settings.TELEGRAM_GROUP_CHAT_ID,
+                            text=message,
+                            parse_mode="HTML",
+                            reply_markup=keyboard,
+                        )
                     )
-                )
             logger.info("Уведомление отправлено успешно.")
         except Exception as e:
             msg = f"Error sending notification: {e}"
@@ -120,45 +132,23 @@ class PostReportSaveSignalReciever:
 class PostVehicleSaveSignalReciever:
     WORKSHEET = settings.VEHICLES_WORKSHEET
 
-    def _build_telegram_notification(self, instances: list[VehicleInfo]) -> tuple[str, InlineKeyboardMarkup]:
-        client = instances[0].client.full_name
-        vins = "\n".join(f"{idx}. {instance.vin}" for idx, instance in enumerate(instances, 1))
-        message = f"<b>🚗 Зарегестрированы новые ТС:</b>\n👤 от {client}\n\n{vins}"
+    def _build_telegram_header(self, client: User) -> str:
+        return f"<b>🚗 Зарегестрированы новые ТС:</b>\n👤 от {html.escape(client.full_name)}"
 
+    def send_telegram_notification(self, instances: list[VehicleInfo]) -> None:
+        """Queue the VINs in the current transaction, batched per client (see telegram_bot.notifications)."""
+        from telegram_bot.notifications import vehicle_notifications
+
+        client = instances[0].client
         keyboard = InlineKeyboardMarkup(
             inline_keyboard=[[InlineKeyboardButton(text="Обработать", callback_data="process_report:")]]
         )
-
-        return message, keyboard
-
-    def send_telegram_notification(self, instances: list[VehicleInfo]) -> None:
-        from telegram_bot.bot import bot
-
-        try:
-            try:
-                loop = asyncio.get_event_loop()
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-
-            message, keyboard = self._build_telegram_notification(instances)
-
-            if loop.is_running():
-                asyncio.create_task(  # noqa: RUF006
-                    bot.send_message(
-                        chat_id=settings.TELEGRAM_GROUP_CHAT_ID, text=message, parse_mode="HTML", reply_markup=keyboard
-                    )
-                )
-            else:
-                loop.run_until_complete(
-                    bot.send_message(
-                        chat_id=settings.TELEGRAM_GROUP_CHAT_ID, text=message, parse_mode="HTML", reply_markup=keyboard
-                    )
-                )
-            logger.info("Уведомление отправлено успешно.")
-        except Exception as e:
-            msg = f"Error sending notification: {e}"
-            logger.exception(msg)
+        vehicle_notifications.add(
+            f"vehicles:{client.pk}",
+            self._build_telegram_header(client),
+            [html.escape(instance.vin) for instance in instances],
+            keyboard,
+        )
 
     def build_data_to_table(self, info: VehicleInfo) -> list[str]:
         info_time_local = timezone.localtime(info.creation_time)
@@ -201,9 +191,68 @@ class PostVehicleSaveSignalReciever:
             self.send_telegram_notification([instance])
 
 
+def generate_photo_renditions(
+    sender: type[BasePhoto],  # noqa: ARG001
+    instance: BasePhoto,
+    created: bool,  # noqa: FBT001
+    **kwargs: dict[str, Any],  # noqa: ARG001
+) -> None:
+    """Generate thumbnail and medium renditions for an uploaded photo."""
+    if created:
+        schedule_renditions([instance])
+
+
+def delete_photo_files(
+    sender: type[BasePhoto],  # noqa: ARG001
+    instance: BasePhoto,
+    **kwargs: dict[str, Any],  # noqa: ARG001
+) -> None:
+    """Queue the files of a deleted photo for removal from storage."""
+    instance.release_files()
+
+
+def touch_client_vehicles(
+    sender: type[User],  # noqa: ARG001
+    instance: User,
+    update_fields: frozenset[str] | None = None,
+    **kwargs: dict[str, Any],  # noqa: ARG001
+) -> None:
+    """Re-serialize the vehicles of a client unless the save left the fields embedded in them alone."""
+    if update_fields is None or not update_fields.isdisjoint(ClientSerializer.Meta.fields):
+        touch_vehicles(client_id=instance.pk)
+
+
+def touch_related_vehicles(
+    sender: type[Model],
+    instance: Model,
+    **kwargs: dict[str, Any],  # noqa: ARG001
+) -> None:
+    """Re-serialize the vehicles embedding a saved or deleted type, transporter, report or document photo."""
+    if sender is VehicleType:
+        touch_vehicles(v_type_id=instance.pk)
+    elif sender is VehicleTransporter:
+        touch_vehicles(vehicle_transporter_id=instance.pk)
+    else:
+        touch_vehicles(pk=instance.vehicle_id)
+
+
 report_reciever = PostReportSaveSignalReciever()
 post_save.connect(receiver=report_reciever, sender=AcceptenceReport)
 
 vehicle_reciever = PostVehicleSaveSignalReciever()
 vehicle_info_save.connect(receiver=vehicle_reciever.handle_bulk_save, sender=VehicleInfo)
 post_save.connect(receiver=vehicle_reciever.handle_single_save, sender=VehicleInfo)
+
+for photo_model in (CarPhoto, KeyPhoto, DocumentPhoto, VehicleDocumentPhoto):
+    post_save.connect(receiver=generate_photo_renditions, sender=photo_model)
+    post_delete.connect(receiver=delete_photo_files, sender=photo_model)
+
+# cached vehicle fragments (autotrips.services.fragments) embed these rows
+post_save.connect(receiver=touch_client_vehicles, sender=User)
+post_save.connect(receiver=touch_related_vehicles, sender=VehicleType)
+post_save.connect(receiver=touch_related_vehicles, sender=VehicleTransporter)
+# on_delete=SET_NULL clears the vehicles with QuerySet.update(), which leaves updated_at alone
+pre_delete.connect(receiver=touch_related_vehicles, sender=VehicleTransporter)
+for embedded_model in (AcceptenceReport, VehicleDocumentPhoto):
+    post_save.connect(receiver=touch_related_vehicles, sender=embedded_model)
+    post_delete.connect(receiver=touch_related_vehicles, sender=embedded_model)
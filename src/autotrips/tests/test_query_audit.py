@@ -0,0 +1,13 @@
+from django.test import TestCase
+
+from project.query_audit import audit_endpoints
+
+
+class QueryAuditTestCase(TestCase):
+    def test_query_counts_do_not_grow_with_rows(self) -> None:
+        growing = [
+            f"GET {audit.endpoint} [{audit.role}]: {audit.queries}"
+            for audit in audit_endpoints([5, 20])
+            if audit.grows()
+        ]
+        self.assertEqual(growing, [])
@@ -0,0 +1,37 @@
+from django.test import TestCase
+
+from autotrips.management.commands.benchmark_bid_board import BOARDS
+from autotrips.models.vehicle_info import VehicleInfo
+from autotrips.serializers.vehicle_bid import get_vehicle_bid_serializer
+from autotrips.views.vehicle_bid import VehicleBidViewSet
+from project.query_audit import build_dataset
+from project.read_plan import compile_plan
+from project.renderers import ORJSONRenderer
+
+
+class ReadPlanTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        dataset = build_dataset(2)
+        # a bid without a type, a transporter or reports, with a price and a non-ASCII comment
+        VehicleInfo._base_manager.create(  # noqa: SLF001
+            client=dataset.vehicle.client,
+            year_brand_model="2020 Read Plan",
+            vin="READPLAN00000001",
+            price=1250,
+            comment="Комментарий к заявке",
+        )
+
+    def test_read_plans_render_like_serializers(self) -> None:
+        renderer = ORJSONRenderer()
+        queryset = VehicleBidViewSet.queryset.all()
+        for role, status in BOARDS:
+            serializer_class = get_vehicle_bid_serializer(role, status)
+            with self.subTest(serializer=serializer_class.__name__):
+                plan = compile_plan(serializer_class())
+                self.assertIsNotNone(plan)
+                assert plan is not None
+                self.assertEqual(
+                    renderer.render(plan.rows(queryset.all())),
+                    renderer.render(serializer_class(queryset.all(), many=True).data),
+                )
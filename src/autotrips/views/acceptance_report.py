@@ -1,9 +1,14 @@
+import posixpath
+from collections.abc import Iterator
 from datetime import timedelta
 from typing import Any
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.files.storage import default_storage
+from django.http import StreamingHttpResponse
 from django.utils import timezone
+from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiExample, OpenApiParameter, OpenApiResponse, extend_schema
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
@@ -21,14 +26,21 @@ from autotrips.serializers.acceptance_report import (
     KeyPhotoSerializer,
 )
 from project.permissions import IsAdminOrManager, IsApproved
+from project.sparse_fields import SPARSE_FIELDSET_PARAMETERS, SparseFieldsetMixin
+from services.storage import iter_file_chunks
+from services.zip_stream import stream_zip
 
 User = get_user_model()
 
 WORKSHEET = settings.VINS_WORKSHEET
 
+ARCHIVE_CHUNK_SIZE = 256 * 1024
 
-class AcceptanceReportViewSet(viewsets.ModelViewSet):
-    queryset = AcceptenceReport.objects.all()
+
+class AcceptanceReportViewSet(SparseFieldsetMixin, viewsets.ModelViewSet):
+    queryset = AcceptenceReport.objects.select_related("vehicle", "reporter").prefetch_related(
+        "car_photos", "key_photos", "document_photos"
+    )
     serializer_class = AcceptanceReportSerializer
     permission_classes = [IsApproved]
     http_method_names = ["get", "post", "patch"]
@@ -43,6 +55,7 @@ class AcceptanceReportViewSet(viewsets.ModelViewSet):
                 location=OpenApiParameter.QUERY,
                 description="Filter reports by VIN.",
             ),
+            *SPARSE_FIELDSET_PARAMETERS,
         ],
         responses={
             200: OpenApiResponse(
@@ -99,7 +112,7 @@ class AcceptanceReportViewSet(viewsets.ModelViewSet):
     )
     def list(self, request: Request, *args: tuple[Any], **kwargs: dict[str, Any]) -> Response:
         three_months_ago = timezone.now() - timedelta(days=90)
-        queryset = self.queryset.filter(report_time__gte=three_months_ago)
+        queryset = self.get_queryset().filter(report_time__gte=three_months_ago)
         vin = request.query_params.get("vin")
         if vin:
             queryset = queryset.filter(vehicle__vin=vin)
@@ -234,12 +247,15 @@ class AcceptanceReportViewSet(viewsets.ModelViewSet):
         serializer = AcceptanceReportPartialUpdateSerializer(instance, data=request.data, partial=True)
         serializer.is_valid(raise_exception=True)
         serializer.save()
+        # photos were prefetched before the update added some
+        instance._prefetched_objects_cache = {}  # noqa: SLF001
 
         response_serializer = AcceptanceReportSerializer(instance)
         return Response(response_serializer.data, status=status.HTTP_200_OK)
 
     def perform_create(self, serializer: ModelSerializer) -> None:
-        serializer.save(reporter=self.request.user)
+        # the id only: the report notifications load the reporter in one query instead of field by field
+        serializer.save(reporter_id=self.request.user.pk)
 
     def get_serializer_context(self) -> dict[str, Any]:
         context: dict[str, Any] = super().get_serializer_context()
@@ -276,6 +292,43 @@ class AcceptanceReportViewSet(viewsets.ModelViewSet):
 
         return Response({"vins": vins_mapping})
 
+    @extend_schema(
+        summary="Download all photos of a report as a ZIP archive",
+        description="Streams a ZIP archive with the car, key and document photos of the report, "
+        "read from storage chunk by chunk. Only accessible to users with the role 'admin' or 'manager'.",
+        responses={
+            (200, "application/zip"): OpenApiResponse(response=OpenApiTypes.BINARY, description="ZIP archive"),
+            403: OpenApiResponse(description="Forbidden"),
+            404: OpenApiResponse(description="Report not found"),
+        },
+    )
+    @action(methods=["GET"], detail=True, url_path="archive", permission_classes=[IsAdminOrManager])
+    def archive(self, request: Request, pk: str | None = None) -> StreamingHttpResponse:
+        report = self.get_object()
+        filename = f"{report.vehicle.vin}_report_{report.report_number}.zip"
+
+        response = StreamingHttpResponse(self._archive_entries(report), content_type="application/zip")
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        # let nginx pass the stream through instead of buffering it into a temp file
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    def _archive_entries(self, report: AcceptenceReport) -> Iterator[bytes]:
+        photo_sets = (
+            ("car-photos", report.car_photos),
+            ("key-photos", report.key_photos),
+            ("doc-photos", report.document_photos),
+        )
+        entries = (
+            (
+                f"{folder}/{photo.pk}_{posixpath.basename(photo.image.name)}",
+                iter_file_chunks(default_storage, photo.image.name, ARCHIVE_CHUNK_SIZE),
+            )
+            for folder, photos in photo_sets
+            for photo in photos.only("pk", "image").order_by("pk")
+        )
+        return stream_zip(entries)  # type: ignore[no-any-return]
+
 
 class CarPhotoViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = CarPhotoSerializer
@@ -308,11 +361,15 @@ class CarPhotoViewSet(viewsets.ReadOnlyModelViewSet):
                             {
                                 "id": 1,
                                 "image": "http://example.com/media/cars/2023/10/01/image1.jpg",
+                                "thumbnail": "http://example.com/media/cars/2023/10/01/image1_thumbnail.webp",
+                                "medium": "http://example.com/media/cars/2023/10/01/image1_medium.webp",
                                 "created": "2023-10-01T12:34:56Z",
                             },
                             {
                                 "id": 2,
                                 "image": "http://example.com/media/cars/2023/10/01/image2.jpg",
+                                "thumbnail": "http://example.com/media/cars/2023/10/01/image2_thumbnail.webp",
+                                "medium": "http://example.com/media/cars/2023/10/01/image2_medium.webp",
                                 "created": "2023-10-01T12:35:56Z",
                             },
                         ],
@@ -358,11 +415,15 @@ class KeyPhotoViewSet(viewsets.ReadOnlyModelViewSet):
                             {
                                 "id": 1,
                                 "image": "http://example.com/media/keys/2023/10/01/image1.jpg",
+                                "thumbnail": "http://example.com/media/keys/2023/10/01/image1_thumbnail.webp",
+                                "medium": "http://example.com/media/keys/2023/10/01/image1_medium.webp",
                                 "created": "2023-10-01T12:34:56Z",
                             },
                             {
                                 "id": 2,
                                 "image": "http://example.com/media/keys/2023/10/01/image2.jpg",
+                                "thumbnail": "http://example.com/media/keys/2023/10/01/image2_thumbnail.webp",
+                                "medium": "http://example.com/media/keys/2023/10/01/image2_medium.webp",
                                 "created": "2023-10-01T12:35:56Z",
                             },
                         ],
@@ -408,11 +469,15 @@ class DocPhotoViewSet(viewsets.ReadOnlyModelViewSet):
                             {
                                 "id": 1,
                                 "image": "http://example.com/media/car-docs/2023/10/01/image1.jpg",
+                                "thumbnail": "http://example.com/media/car-docs/2023/10/01/image1_thumbnail.webp",
+                                "medium": "http://example.com/media/car-docs/2023/10/01/image1_medium.webp",
                                 "created": "2023-10-01T12:34:56Z",
                             },
                             {
                                 "id": 2,
                                 "image": "http://example.com/media/car-docs/2023/10/01/image2.jpg",
+                                "thumbnail": "http://example.com/media/car-docs/2023/10/01/image2_thumbnail.webp",
+                                "medium": "http://example.com/media/car-docs/2023/10/01/image2_medium.webp",
                                 "created": "2023-10-01T12:35:56Z",
                             },
                         ],
@@ -23,7 +23,10 @@ from autotrips.serializers.vehicle_bid import (
     VehicleTransporterSerializer,
     get_vehicle_bid_serializer,
 )
+from autotrips.services.fragments import cached_fragments, fragment_variant
 from project.permissions import AdminLogisticianVehicleBidAccessPermission, VehicleBidAccessPermission
+from project.read_plan import read_plans
+from project.sparse_fields import SPARSE_FIELDSET_PARAMETERS, SparseFieldsetMixin
 
 User = get_user_model()
 
@@ -93,6 +96,7 @@ RECEIVER_GROUPS = {
                     OpenApiExample("Approve", value="requires_approval"),
                 ],
             ),
+            *SPARSE_FIELDSET_PARAMETERS,
         ],
         responses={
             200: OpenApiResponse(
@@ -516,6 +520,7 @@ RECEIVER_GROUPS = {
                     OpenApiExample("Loading Status", value="loading"),
                 ],
             ),
+            *SPARSE_FIELDSET_PARAMETERS,
         ],
         responses={
             200: OpenApiResponse(
@@ -865,7 +870,11 @@ RECEIVER_GROUPS = {
     ),
 )
 class VehicleBidViewSet(
-    mixins.ListModelMixin, mixins.RetrieveModelMixin, mixins.UpdateModelMixin, viewsets.GenericViewSet
+    SparseFieldsetMixin,
+    mixins.ListModelMixin,
+    mixins.RetrieveModelMixin,
+    mixins.UpdateModelMixin,
+    viewsets.GenericViewSet,
 ):
     queryset = VehicleInfo.objects.select_related("client", "v_type", "vehicle_transporter").order_by("-id")
     permission_classes = (VehicleBidAccessPermission,)
@@ -954,8 +963,21 @@ class VehicleBidViewSet(
 
         return grouper()  # type: ignore[no-untyped-call]
 
+    def list_data(self, queryset: QuerySet) -> Any:  # noqa: ANN401
+        """
+        Serialize bids through the compiled read plan of the role's serializer (``project.read_plan``).
+
+        The plan reads ``.values()`` and shapes the dicts without model instances or per-field serializer
+        calls; a serializer that cannot be compiled serializes the queryset as usual. Either way, bids unchanged
+        since they were last serialized come from the fragment cache (``autotrips.services.fragments``).
+        """
+        selection = (self.get_serializer_class(), self.selected_fields())
+        plan = read_plans.get(selection, self.get_serializer)
+        serialize = plan.rows if plan is not None else lambda rows: self.get_serializer(rows, many=True).data
+        return cached_fragments(queryset, fragment_variant(*selection), serialize)
+
     def get_admin_list(self, request: Request, *args: tuple[Any], **kwargs: dict[str, Any]) -> Response:
-        return super().list(request, *args, **kwargs)
+        return Response(self.list_data(self.filter_queryset(self.get_queryset())))
 
     def get_logistician_grouped_list(self, request: Request) -> Response:
         status_param = request.query_params.get("status", "initial")
@@ -964,7 +986,7 @@ class VehicleBidViewSet(
         data = {}
         for group_name, group_filter in group_param.items():
             qs = base_qs.filter(**group_filter).distinct()
-            data[group_name] = self.get_serializer(qs, many=True).data
+            data[group_name] = self.list_data(qs)
         return Response(data)
 
     def get_manager_grouped_list(self) -> Response:
@@ -972,7 +994,7 @@ class VehicleBidViewSet(
         data = {}
         for group_name, group_filter in MANAGER_GROUPS.items():
             qs = base_qs.filter(**group_filter)
-            data[group_name] = self.get_serializer(qs, many=True).data
+            data[group_name] = self.list_data(qs)
         return Response(data)
 
     def get_title_grouped_list(self) -> Response:
@@ -980,7 +1002,7 @@ class VehicleBidViewSet(
         data = {}
         for group_name, group_filter in TITLE_GROUPS.items():
             qs = base_qs.filter(**group_filter)
-            data[group_name] = self.get_serializer(qs, many=True).data
+            data[group_name] = self.list_data(qs)
         return Response(data)
 
     def get_inspector_grouped_list(self) -> Response:
@@ -988,7 +1010,7 @@ class VehicleBidViewSet(
         data = {}
         for group_name, group_filter in INSPECTOR_GROUPS.items():
             qs = base_qs.filter(**group_filter).distinct()
-            data[group_name] = self.get_serializer(qs, many=True).data
+            data[group_name] = self.list_data(qs)
         return Response(data)
 
     def get_re_export_grouped_list(self) -> Response:
@@ -996,7 +1018,7 @@ class VehicleBidViewSet(
         data = {}
         for group_name, group_filter in RE_EXPORT_GROUPS.items():
             qs = base_qs.filter(**group_filter)
-            data[group_name] = self.get_serializer(qs, many=True).data
+            data[group_name] = self.list_data(qs)
         return Response(data)
 
     def get_receiver_grouped_list(self) -> Response:
@@ -1004,7 +1026,7 @@ class VehicleBidViewSet(
         data = {}
         for group_name, group_filter in RECEIVER_GROUPS.items():
             qs = base_qs.filter(group_filter) if isinstance(group_filter, Q) else base_qs.filter(**group_filter)
-            data[group_name] = self.get_serializer(qs, many=True).data
+            data[group_name] = self.list_data(qs)
         return Response(data)
 
     @extend_schema(
@@ -1060,7 +1082,7 @@ class VehicleBidViewSet(
 
         bid.status = VehicleInfo.Statuses.REJECTED
         bid.logistician_comment = comment
-        bid.save(update_fields=["status", "logistician_comment", "status_changed"])
+        bid.save(update_fields=["status", "logistician_comment", "status_changed", "updated_at"])
         resp_serializer = self.get_serializer(bid)
         return Response(resp_serializer.data)
 
@@ -21,13 +21,17 @@ from autotrips.serializers.vehicle_info import (
     VehicleInfoSerializer,
     VehicleTypeSerializer,
 )
+from autotrips.services.fragments import cached_fragments, fragment_variant
 from project.permissions import VehicleAccessPermission
+from project.sparse_fields import SPARSE_FIELDSET_PARAMETERS, SparseFieldsetMixin
 
 User = get_user_model()
 
 
-class VehicleInfoViewSet(viewsets.ModelViewSet):
-    queryset = VehicleInfo.objects.select_related("client", "v_type").order_by("-id")
+class VehicleInfoViewSet(SparseFieldsetMixin, viewsets.ModelViewSet):
+    queryset = (
+        VehicleInfo.objects.select_related("client", "v_type").prefetch_related("document_photos").order_by("-id")
+    )
     serializer_class = VehicleInfoSerializer
     permission_classes = (VehicleAccessPermission,)
     http_method_names = ["get", "post", "patch"]
@@ -318,6 +322,7 @@ class VehicleInfoViewSet(viewsets.ModelViewSet):
                 required=False,
                 type=int,
             ),
+            *SPARSE_FIELDSET_PARAMETERS,
         ],
         responses={
             status.HTTP_200_OK: OpenApiResponse(
@@ -327,9 +332,15 @@ class VehicleInfoViewSet(viewsets.ModelViewSet):
         },
     )
     def list(self, request: Request, *args: tuple[Any], **kwargs: dict[str, Any]) -> Response:
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        # image URLs are built for the request's host; fragments with renditions still pending are not cached
+        variant = fragment_variant(self.get_serializer_class(), self.selected_fields(), request.get_host())
+        data = cached_fragments(
+            self.get_queryset(),
+            variant,
+            lambda rows: self.get_serializer(rows, many=True).data,
+            cacheable=lambda vehicle: all(photo["thumbnail"] for photo in vehicle.get("document_photos", [])),
+        )
+        return Response(data)
 
     @extend_schema(
         summary="Update vehicle information and manage document photos",
@@ -415,6 +426,9 @@ class VehicleInfoViewSet(viewsets.ModelViewSet):
         serializer = VehicleInfoSerializer(instance, data=request.data, partial=True)
         serializer.is_valid(raise_exception=True)
         updated_instance = serializer.save()
+        if getattr(updated_instance, "_prefetched_objects_cache", None):
+            # photos were prefetched before the update added or removed some of them
+            updated_instance._prefetched_objects_cache = {}  # noqa: SLF001
 
         response_serializer = VehicleInfoSerializer(updated_instance)
         return Response(response_serializer.data, status=status.HTTP_200_OK)
@@ -0,0 +1,96 @@
+import gzip
+import hashlib
+import threading
+import zlib
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+
+import brotli
+from django.conf import settings
+
+# preferred first when the client accepts several
+ENCODINGS = ("br", "gzip")
+
+
+def accepted_encoding(header: str) -> str | None:
+    """Pick the best encoding from ``ENCODINGS`` allowed by an ``Accept-Encoding`` header."""
+    accepted = set()
+    for item in header.split(","):
+        coding, *params = (part.strip() for part in item.split(";"))
+        quality = next((param[2:] for param in params if param.startswith("q=")), "1")
+        try:
+            if float(quality) > 0:
+                accepted.add(coding.lower())
+        except ValueError:
+            continue
+    if "*" in accepted:
+        return ENCODINGS[0]
+    return next((encoding for encoding in ENCODINGS if encoding in accepted), None)
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=settings.COMPRESSION_BROTLI_QUALITY)  # type: ignore[no-any-return]
+    return gzip.compress(body, compresslevel=settings.COMPRESSION_GZIP_LEVEL, mtime=0)
+
+
+def compress_stream(chunks: Iterable[bytes], encoding: str) -> Iterator[bytes]:
+    """Compress a streaming response chunk by chunk, flushing after each one so clients get data as it comes."""
+    if encoding == "br":
+        compressor = brotli.Compressor(quality=settings.COMPRESSION_BROTLI_QUALITY)
+        for chunk in chunks:
+            if chunk:
+                yield compressor.process(chunk) + compressor.flush()
+        yield compressor.finish()
+        return
+
+    # wbits 16 + MAX_WBITS writes the gzip container
+    compressobj = zlib.compressobj(settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        if chunk:
+            yield compressobj.compress(chunk) + compressobj.flush(zlib.Z_SYNC_FLUSH)
+    yield compressobj.flush()
+
+
+class CompressedBodyCache:
+    """
+    In-process LRU of compressed response bodies, keyed by a digest of the uncompressed body.
+
+    A board that did not change between two requests produces the same JSON, so the second response reuses the
+    compressed bytes instead of compressing them again. Hashing is far cheaper than Brotli on large bodies.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple[str, bytes], bytes] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get_or_compress(self, body: bytes, encoding: str) -> bytes:
+        key = (encoding, hashlib.blake2b(body, digest_size=16).digest())
+        with self._lock:
+            compressed = self._entries.get(key)
+            if compressed is not None:
+                self._entries.move_to_end(key)
+                return compressed
+
+        compressed = compress(body, encoding)
+        if len(compressed) > self.max_bytes:
+            return compressed
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = compressed
+                self._size += len(compressed)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+        return compressed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+compressed_bodies = CompressedBodyCache(settings.COMPRESSION_CACHE_SIZE)
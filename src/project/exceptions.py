@@ -0,0 +1,18 @@
+from typing import Any
+
+from django.core.exceptions import RequestDataTooBig, TooManyFilesSent
+from rest_framework.response import Response
+from rest_framework.views import exception_handler
+
+from accounts.upload_handlers import RejectedUpload, TooManyUploadedFiles, UploadTooLarge
+
+
+def api_exception_handler(exc: Exception, context: dict[str, Any]) -> Response | None:
+    """DRF's exception handler, also answering the upload limits Django and ``StreamingLimitUploadHandler`` enforce."""
+    if isinstance(exc, RejectedUpload):
+        exc = exc.api_error(exc.detail)
+    elif isinstance(exc, RequestDataTooBig):
+        exc = UploadTooLarge()
+    elif isinstance(exc, TooManyFilesSent):
+        exc = TooManyUploadedFiles()
+    return exception_handler(exc, context)
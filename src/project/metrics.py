@@ -0,0 +1,160 @@
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from django.conf import settings
+
+# upper bounds of the request duration histogram, seconds
+DURATION_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+METRIC_PREFIX = "autotrips"
+
+
+@dataclass
+class RequestTimings:
+    """Where the time of one sampled request went, filled in while it is processed."""
+
+    queries: int = 0
+    db: float = 0.0
+    render: float = 0.0
+    external: dict[str, float] = field(default_factory=lambda: defaultdict(float))
+
+    def serialize(self, duration: float) -> float:
+        """
+        Time left of ``duration`` after the database, the external calls and rendering.
+
+        That is the view with its serializers: list rows built from read plans and the fragment cache are
+        serialization too, and they do not go through ``serializer.data``, so there is no call to time.
+        """
+        return max(0.0, duration - self.db - sum(self.external.values()) - self.render)
+
+    def db_wrapper(self, execute: Any, sql: str, params: Any, many: bool, context: dict[str, Any]) -> Any:  # noqa: ANN401, FBT001
+        """``connection.execute_wrapper`` hook counting queries and their time."""
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db += time.perf_counter() - started
+            self.queries += 1
+
+
+current_timings: ContextVar[RequestTimings | None] = ContextVar("current_timings", default=None)
+
+
+@contextmanager
+def external_call(service: str) -> Iterator[None]:
+    """Charge the enclosed call to ``service`` (sheets, telegram, s3) in the current request's timings."""
+    timings = current_timings.get()
+    if timings is None:
+        yield
+        return
+
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.external[service] += time.perf_counter() - started
+
+
+def start_s3_call(context: dict[str, Any], **kwargs: Any) -> None:  # noqa: ANN401, ARG001
+    """Start timing an S3 call: botocore ``before-call`` handler, see ``services.storage.CachedSignatureS3Storage``."""
+    if current_timings.get() is not None:
+        context["metrics_started"] = time.perf_counter()
+
+
+def finish_s3_call(context: dict[str, Any], **kwargs: Any) -> None:  # noqa: ANN401, ARG001
+    """Finish timing an S3 call: botocore ``after-call``/``after-call-error`` handler."""
+    timings = current_timings.get()
+    started = context.pop("metrics_started", None)
+    if timings is not None and started is not None:
+        timings.external["s3"] += time.perf_counter() - started
+
+
+class MetricsRegistry:
+    """
+    Per-process totals of the sampled requests, exposed in the Prometheus text format.
+
+    With ``METRICS_DIR`` set every worker also writes its totals there (at most once per
+    ``METRICS_FLUSH_INTERVAL`` seconds) and the metrics endpoint adds up the files of all workers,
+    whichever of them serves the scrape.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: dict[tuple[str, tuple[tuple[str, str], ...]], float] = defaultdict(float)
+        self._last_flush = 0.0
+
+    def record(  # noqa: PLR0913
+        self, view: str, action: str, method: str, status: int, duration: float, timings: RequestTimings
+    ) -> None:
+        labels = (("view", view), ("action", action))
+        with self._lock:
+            self._counters["requests_total", (*labels, ("method", method), ("status", str(status)))] += 1
+            self._counters["request_duration_seconds_sum", labels] += duration
+            self._counters["request_duration_seconds_count", labels] += 1
+            for bound in DURATION_BUCKETS:
+                if duration <= bound:
+                    self._counters["request_duration_seconds_bucket", (*labels, ("le", str(bound)))] += 1
+            self._counters["request_duration_seconds_bucket", (*labels, ("le", "+Inf"))] += 1
+            self._counters["db_queries_total", labels] += timings.queries
+            self._counters["db_seconds_total", labels] += timings.db
+            self._counters["render_seconds_total", labels] += timings.render
+            self._counters["serialize_seconds_total", labels] += timings.serialize(duration)
+            for service, seconds in timings.external.items():
+                self._counters["external_seconds_total", (*labels, ("service", service))] += seconds
+
+        if settings.METRICS_DIR and time.monotonic() - self._last_flush >= settings.METRICS_FLUSH_INTERVAL:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write this process's totals to ``METRICS_DIR/<pid>.json``."""
+        self._last_flush = time.monotonic()
+        directory = Path(settings.METRICS_DIR)
+        directory.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            rows = [[name, dict(labels), value] for (name, labels), value in self._counters.items()]
+        temporary = directory / f".{os.getpid()}.json.tmp"
+        temporary.write_text(json.dumps(rows))
+        temporary.replace(directory / f"{os.getpid()}.json")
+
+    def collect(self) -> dict[tuple[str, tuple[tuple[str, str], ...]], float]:
+        if not settings.METRICS_DIR:
+            with self._lock:
+                return dict(self._counters)
+
+        self.flush()
+        totals: dict[tuple[str, tuple[tuple[str, str], ...]], float] = defaultdict(float)
+        for path in Path(settings.METRICS_DIR).glob("*.json"):
+            try:
+                rows = json.loads(path.read_text())
+            except (OSError, ValueError):
+                continue
+            for name, labels, value in rows:
+                totals[name, tuple(labels.items())] += value
+        return totals
+
+    def render(self) -> str:
+        lines = [
+            f"# TYPE {METRIC_PREFIX}_sample_rate gauge",
+            f"{METRIC_PREFIX}_sample_rate {settings.METRICS_SAMPLE_RATE}",
+        ]
+        typed = set()
+        for (name, labels), value in sorted(self.collect().items()):
+            family = name.removesuffix("_bucket").removesuffix("_sum").removesuffix("_count")
+            if family not in typed:
+                typed.add(family)
+                kind = "histogram" if family == "request_duration_seconds" else "counter"
+                lines.append(f"# TYPE {METRIC_PREFIX}_{family} {kind}")
+            label_text = ",".join(f'{key}="{value}"' for key, value in labels)
+            lines.append(f"{METRIC_PREFIX}_{name}{{{label_text}}} {value:g}")
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
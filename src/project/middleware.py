@@ -0,0 +1,141 @@
+import random
+import time
+from collections.abc import Callable
+from contextlib import ExitStack
+from typing import Any
+
+from django.conf import settings
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import patch_vary_headers
+
+from project.compression import accepted_encoding, compress, compress_stream, compressed_bodies
+from project.metrics import RequestTimings, current_timings, registry
+
+
+class RequestMetricsMiddleware:
+    """
+    Measure a sample of requests: DB queries and time, external calls, serialization, rendering and the total.
+
+    The breakdown goes into a ``Server-Timing`` header and into ``project.metrics.registry`` labelled by view
+    and action. ``serialize`` is what remains of ``total`` after ``db``, the external calls and ``render``
+    (turning the serialized data into JSON), see ``RequestTimings.serialize``.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if random.random() >= settings.METRICS_SAMPLE_RATE:  # noqa: S311
+            return self.get_response(request)
+
+        timings = RequestTimings()
+        token = current_timings.set(timings)
+        started = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(timings.db_wrapper))
+                response = self.get_response(request)
+        finally:
+            current_timings.reset(token)
+        duration = time.perf_counter() - started
+
+        view, action = getattr(request, "metrics_view", ("unresolved", (request.method or "").lower()))
+        registry.record(view, action, request.method or "", response.status_code, duration, timings)
+        response["Server-Timing"] = self.server_timing(timings, duration)
+        return response
+
+    def process_view(
+        self,
+        request: HttpRequest,
+        view_func: Callable[..., Any],
+        view_args: tuple[Any, ...],
+        view_kwargs: dict[str, Any],
+    ) -> None:
+        view_class = getattr(view_func, "cls", None)
+        view = view_class.__name__ if view_class is not None else view_func.__name__
+        # viewsets map the method to an action (list, retrieve, archive, ...)
+        actions = getattr(view_func, "actions", None) or {}
+        method = (request.method or "").lower()
+        request.metrics_view = (view, actions.get(method, method))
+
+    def process_template_response(self, request: HttpRequest, response: Any) -> Any:  # noqa: ANN401
+        timings = current_timings.get()
+        if timings is None:
+            return response
+
+        started = time.perf_counter()
+
+        def rendered(_: HttpResponse) -> None:
+            timings.render += time.perf_counter() - started
+
+        response.add_post_render_callback(rendered)
+        return response
+
+    @staticmethod
+    def server_timing(timings: RequestTimings, duration: float) -> str:
+        entries = [f'db;dur={timings.db * 1000:.1f};desc="{timings.queries} queries"']
+        entries.extend(f"{service};dur={seconds * 1000:.1f}" for service, seconds in sorted(timings.external.items()))
+        entries.append(f'serialize;dur={timings.serialize(duration) * 1000:.1f};desc="view and serializers"')
+        entries.append(f"render;dur={timings.render * 1000:.1f}")
+        entries.append(f"total;dur={duration * 1000:.1f}")
+        return ", ".join(entries)
+
+
+class CompressionMiddleware:
+    """
+    Compress JSON and plain-text responses with Brotli or gzip, whichever the client prefers.
+
+    Bodies shorter than ``COMPRESSION_MIN_SIZE`` are sent as they are. So is everything under
+    ``COMPRESSION_EXCLUDED_PATHS``: the token endpoints put secrets next to the credentials the client sent,
+    which is what a BREACH attack needs. HTML (the admin and the browsable API, with their CSRF tokens) is left
+    out for the same reason. Bodies of ``COMPRESSION_CACHE_MIN_SIZE`` and more are looked up in
+    ``compressed_bodies`` first, so an unchanged board is compressed once, not on every request.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        response = self.get_response(request)
+        if not self.compressible(request, response):
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        encoding = accepted_encoding(request.headers.get("Accept-Encoding", ""))
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            response.streaming_content = compress_stream(response.streaming_content, encoding)
+            del response.headers["Content-Length"]
+        else:
+            body = response.content
+            if len(body) < settings.COMPRESSION_MIN_SIZE:
+                return response
+            if len(body) >= settings.COMPRESSION_CACHE_MIN_SIZE:
+                compressed = compressed_bodies.get_or_compress(body, encoding)
+            else:
+                compressed = compress(body, encoding)
+            if len(compressed) >= len(body):
+                return response
+            response.content = compressed
+            response.headers["Content-Length"] = str(len(compressed))
+
+        # the compressed body is not byte-for-byte what a strong ETag promises
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = f"W/{etag}"
+        response.headers["Content-Encoding"] = encoding
+        return response
+
+    @staticmethod
+    def compressible(request: HttpRequest, response: HttpResponse) -> bool:
+        content_type = response.get("Content-Type", "").partition(";")[0].strip()
+        return (
+            not response.has_header("Content-Encoding")
+            and not getattr(response, "is_async", False)
+            and content_type in settings.COMPRESSION_CONTENT_TYPES
+            and not request.path.startswith(settings.COMPRESSION_EXCLUDED_PATHS)
+        )
@@ -0,0 +1,23 @@
+from typing import IO, Any
+
+import orjson
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+UTF8 = {"utf-8", "utf8"}
+
+
+class ORJSONParser(JSONParser):
+    """``JSONParser`` on top of orjson, which reads UTF-8 bytes without decoding them first."""
+
+    def parse(
+        self, stream: IO[bytes], media_type: str | None = None, parser_context: dict[str, Any] | None = None
+    ) -> Any:  # noqa: ANN401
+        encoding = (parser_context or {}).get("encoding", settings.DEFAULT_CHARSET)
+        try:
+            content = stream.read()
+            return orjson.loads(content if encoding.lower() in UTF8 else content.decode(encoding))
+        except (ValueError, UnicodeDecodeError) as e:
+            msg = f"JSON parse error - {e}"
+            raise ParseError(msg) from e
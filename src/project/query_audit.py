@@ -0,0 +1,229 @@
+import logging
+import re
+import uuid
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connections, transaction
+from django.test import Client, override_settings
+
+from accounts.models.user import DocumentImage, User
+from accounts.serializers.custom_token import CustomTokenSerializer
+from autotrips.models.acceptance_report import AcceptenceReport, CarPhoto, DocumentPhoto, KeyPhoto
+from autotrips.models.vehicle_info import VehicleDocumentPhoto, VehicleInfo, VehicleTransporter, VehicleType
+
+# GET endpoints checked for every role; {vehicle}, {report} and {user} are ids from the generated dataset
+ENDPOINTS = (
+    "/api/v1/autotrips/bids/",
+    "/api/v1/autotrips/bids/?status=loading",
+    "/api/v1/autotrips/bids/{vehicle}/",
+    "/api/v1/autotrips/transporters/",
+    "/api/v1/autotrips/vehicles/",
+    "/api/v1/autotrips/vehicles/{vehicle}/",
+    "/api/v1/autotrips/vehicles-types/",
+    "/api/v1/autotrips/reports/",
+    "/api/v1/autotrips/reports/cars/",
+    "/api/v1/autotrips/reports/{report}/",
+    "/api/v1/autotrips/reports/{report}/car-photos/",
+    "/api/v1/autotrips/reports/{report}/doc-photos/",
+    "/api/v1/autotrips/reports/{report}/key-photos/",
+    "/api/v1/accounts/users/",
+    "/api/v1/accounts/users/clients/",
+    "/api/v1/accounts/users/{user}/",
+    "/api/v1/accounts/users/{user}/documents/",
+    "/api/v1/accounts/users/current-user/",
+)
+
+# every dataset has ``size`` vehicles in each of these states, so that every role's bid groups get rows at any size
+VEHICLE_STATES: tuple[dict[str, Any], ...] = (
+    {},
+    {"approved_by_logistician": True, "transit_method": VehicleInfo.TransitMethod.T1, "requested_title": True},
+    {
+        "approved_by_logistician": True,
+        "approved_by_manager": True,
+        "transit_method": VehicleInfo.TransitMethod.RE_EXPORT,
+        "requested_title": True,
+    },
+    {
+        "approved_by_logistician": True,
+        "transit_method": VehicleInfo.TransitMethod.WITHOUT_OPENNING,
+        "acceptance_type": VehicleInfo.AcceptanceType.WITH_RE_EXPORT,
+        "requested_title": True,
+    },
+    {"status": VehicleInfo.Statuses.LOADING, "transit_method": VehicleInfo.TransitMethod.RE_EXPORT},
+    {
+        "status": VehicleInfo.Statuses.LOADING,
+        "ready_for_receiver": True,
+        "transit_method": VehicleInfo.TransitMethod.T1,
+    },
+)
+
+IN_LIST = re.compile(r"IN \((?:%s, )*%s\)")
+WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(sql: str) -> str:
+    """Drop the length of ``IN (...)`` lists, so that queries differing only by their parameters compare equal."""
+    return WHITESPACE.sub(" ", IN_LIST.sub("IN (...)", sql)).strip()
+
+
+@dataclass
+class QueryLog:
+    """``connection.execute_wrapper`` hook collecting the normalized SQL of every executed query."""
+
+    statements: list[str] = field(default_factory=list)
+
+    def __call__(self, execute: Any, sql: str, params: Any, many: bool, context: dict[str, Any]) -> Any:  # noqa: ANN401, FBT001
+        self.statements.append(normalize_sql(sql))
+        return execute(sql, params, many, context)
+
+    def __len__(self) -> int:
+        return len(self.statements)
+
+    def repeated(self, min_count: int = 2) -> list[tuple[str, int]]:
+        """Patterns executed at least ``min_count`` times, the usual shape of an N+1."""
+        return [(sql, count) for sql, count in Counter(self.statements).most_common() if count >= min_count]
+
+
+@contextmanager
+def record_queries() -> Iterator[QueryLog]:
+    log = QueryLog()
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(log))
+        yield log
+
+
+@contextmanager
+def quiet_request_log() -> Iterator[None]:
+    """Mute the 403/404 warnings of ``django.request``: roles are expected to be refused most endpoints."""
+    logger = logging.getLogger("django.request")
+    level = logger.level
+    logger.setLevel(logging.ERROR)
+    try:
+        yield
+    finally:
+        logger.setLevel(level)
+
+
+@dataclass
+class Dataset:
+    users: dict[str, User]
+    vehicle: VehicleInfo
+    report: AcceptenceReport
+    user: User
+
+    def path(self, endpoint: str) -> str:
+        return endpoint.format(vehicle=self.vehicle.pk, report=self.report.pk, user=self.user.pk)
+
+
+def build_dataset(size: int) -> Dataset:
+    """
+    Create ``size`` rows of every kind the endpoints list, and an approved user for every role.
+
+    Rows are created with ``bulk_create()`` on the base managers, so no registration, table or Telegram
+    signals fire; run it inside a transaction that is rolled back.
+    """
+    token = uuid.uuid4().hex[:8]
+
+    def new_user(role: str, name: str) -> User:
+        return User(
+            full_name=name, phone=f"+0{token}{name[-4:]}", username=f"audit-{token}-{name}", role=role, is_approved=True
+        )
+
+    roles = User.Roles.values
+    role_users = User._base_manager.bulk_create(  # noqa: SLF001
+        new_user(role, f"{index:04d}") for index, role in enumerate(roles)
+    )
+    users = dict(zip(roles, role_users, strict=True))
+    # employees and clients listed by the users endpoints
+    listed = User._base_manager.bulk_create(  # noqa: SLF001
+        new_user(User.Roles.CLIENT if index % 2 else User.Roles.USER, f"{1000 + index:04d}") for index in range(size)
+    )
+    DocumentImage.objects.bulk_create(
+        DocumentImage(user=user, image=f"documents/audit/{token}/{user.pk}.jpg") for user in listed
+    )
+
+    v_types = VehicleType.objects.bulk_create(VehicleType(v_type=f"audit-{token}-{index}") for index in range(size))
+    transporters = VehicleTransporter.objects.bulk_create(
+        VehicleTransporter(number=f"{token[:4]}{index}") for index in range(size)
+    )
+    vehicles = VehicleInfo._base_manager.bulk_create(  # noqa: SLF001
+        VehicleInfo(
+            client=users[User.Roles.CLIENT],
+            year_brand_model="Audit",
+            vin=f"AUDIT{token}{index:06d}",
+            v_type=v_types[index % size],
+            vehicle_transporter=transporters[index % size],
+            **VEHICLE_STATES[index % len(VEHICLE_STATES)],
+        )
+        for index in range(size * len(VEHICLE_STATES))
+    )
+    VehicleDocumentPhoto.objects.bulk_create(
+        VehicleDocumentPhoto(vehicle=vehicle, image=f"info-docs/audit/{token}/{vehicle.pk}.jpg") for vehicle in vehicles
+    )
+
+    reports = AcceptenceReport.objects.bulk_create(
+        AcceptenceReport(reporter=users[User.Roles.USER], vehicle=vehicle) for vehicle in vehicles
+    )
+    for model, folder in ((CarPhoto, "cars"), (KeyPhoto, "keys"), (DocumentPhoto, "car-docs")):
+        model.objects.bulk_create(
+            model(report=report, image=f"{folder}/audit/{token}/{report.pk}.jpg") for report in reports
+        )
+
+    return Dataset(users=users, vehicle=vehicles[0], report=reports[0], user=listed[0])
+
+
+@dataclass
+class EndpointAudit:
+    endpoint: str
+    role: str
+    status: dict[int, int] = field(default_factory=dict)
+    queries: dict[int, int] = field(default_factory=dict)
+    repeated: list[tuple[str, int]] = field(default_factory=list)
+
+    def grows(self, tolerance: int = 0) -> bool:
+        """Whether the query count went up by more than ``tolerance`` from the smallest dataset to the largest."""
+        counts = [self.queries[size] for size in sorted(self.queries)]
+        return counts[-1] - counts[0] > tolerance
+
+
+def audit_endpoints(
+    sizes: Iterable[int], roles: Iterable[str] | None = None, endpoints: Iterable[str] = ENDPOINTS
+) -> list[EndpointAudit]:
+    """
+    Request every endpoint as every role against datasets of each of ``sizes`` and count the queries.
+
+    Each dataset is created in a transaction that is rolled back. Every request is made twice and the second one is
+    measured, so that per-process caches (signed URLs) are warm as in a running server. The vehicle fragment cache
+    is emptied before it: served from there, a list would hide what its serializers query.
+    """
+    roles = list(roles or User.Roles.values)
+    endpoints = list(endpoints)
+    audits = {(endpoint, role): EndpointAudit(endpoint, role) for endpoint in endpoints for role in roles}
+
+    with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]), quiet_request_log():
+        for size in sorted(set(sizes)):
+            with transaction.atomic():
+                dataset = build_dataset(size)
+                for role in roles:
+                    access = CustomTokenSerializer.get_token(dataset.users[role]).access_token
+                    client = Client(HTTP_AUTHORIZATION=f"Bearer {access}")
+                    for endpoint in endpoints:
+                        path = dataset.path(endpoint)
+                        client.get(path)
+                        caches["vehicle_fragments"].clear()
+                        with record_queries() as log:
+                            response = client.get(path)
+                        audit = audits[endpoint, role]
+                        audit.status[size] = response.status_code
+                        audit.queries[size] = len(log)
+                        audit.repeated = log.repeated()
+                transaction.set_rollback(True)
+
+    return list(audits.values())
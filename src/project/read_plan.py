@@ -0,0 +1,192 @@
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import cached_property
+from typing import Any
+
+from django.conf import settings
+from django.db.models import Expression
+from django.db.models.query import QuerySet
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
+
+# fields whose to_representation() returns a value read from the database as it is
+IDENTITY_REPRESENTATIONS = {
+    serializers.BooleanField.to_representation,
+    serializers.CharField.to_representation,
+    serializers.ChoiceField.to_representation,
+    serializers.IntegerField.to_representation,
+}
+# fields whose to_representation() only needs the value, not the instance or the request
+VALUE_FIELDS = (
+    serializers.DateField,
+    serializers.DateTimeField,
+    serializers.DecimalField,
+    serializers.FloatField,
+    # BigIntegerField of newer DRF versions may render as a string (COERCE_BIGINT_TO_STRING)
+    serializers.IntegerField,
+)
+
+
+@dataclass
+class ReadPlan:
+    """
+    A serializer compiled into ``.values()`` columns and the steps turning one row into its representation.
+
+    Each step is ``(key, column, convert, nested)``: ``None`` in ``column`` gives ``None`` as DRF does, a
+    ``nested`` plan shapes its dict from the same row, ``convert`` is the field's ``to_representation`` where
+    that does more than return the value. Keys come in the serializer's field order, so the rendered JSON is
+    byte-for-byte what the serializer renders.
+    """
+
+    steps: list["Step"] = field(default_factory=list)
+    annotations: dict[str, Expression] = field(default_factory=dict)
+
+    def columns(self) -> list[str]:
+        columns = []
+        for _, column, _, nested in self.steps:
+            columns.append(column)
+            if nested is not None:
+                columns.extend(nested.columns())
+        return columns
+
+    @cached_property
+    def transforms(self) -> list["Step"]:
+        return [step for step in self.steps if step[2] is not None or step[3] is not None]
+
+    def shape(self, row: dict[str, Any]) -> dict[str, Any]:
+        # copy every column in field order first; replacing a value later keeps the key where it is
+        data = {key: row[column] for key, column, _, _ in self.steps}
+        for key, _, convert, nested in self.transforms:
+            value = data[key]
+            if value is None:
+                continue
+            data[key] = nested.shape(row) if nested is not None else convert(value)  # type: ignore[misc]
+        return data
+
+    def rows(self, queryset: QuerySet) -> list[dict[str, Any]]:
+        # prefetches do not apply to .values(); select_related joins are replaced by the lookups' own
+        rows = queryset.prefetch_related(None).annotate(**self.annotations).values(*self.columns())
+        return [self.shape(row) for row in rows]
+
+
+Step = tuple[str, str, Callable[[Any], Any] | None, "ReadPlan | None"]
+
+
+def compile_plan(serializer: serializers.Serializer, prefix: str = "") -> ReadPlan | None:
+    """
+    Compile the readable fields of ``serializer`` into a ``ReadPlan``, ``None`` when it cannot be compiled.
+
+    Serializers describe what DRF cannot see with two class attributes: ``read_plan_annotations`` maps
+    method fields to the queryset expression computing the same value, ``read_plan_nested`` maps fields that
+    ``to_representation`` replaces with a nested serializer to that serializer's class. A serializer
+    overriding ``to_representation`` without ``read_plan_nested`` is not compiled.
+    """
+    annotations: dict[str, Expression] = getattr(serializer, "read_plan_annotations", {})
+    nested_classes: dict[str, type[serializers.Serializer]] = getattr(serializer, "read_plan_nested", {})
+    if type(serializer).to_representation is not serializers.Serializer.to_representation and not nested_classes:
+        return None
+
+    plan = ReadPlan()
+    for name, serializer_field in serializer.fields.items():
+        if serializer_field.write_only:
+            continue
+        if isinstance(serializer_field, serializers.SerializerMethodField):
+            if prefix or name not in annotations:
+                return None
+            plan.annotations[name] = annotations[name]
+            plan.steps.append((name, name, None, None))
+            continue
+
+        column = prefix + "__".join(serializer_field.source_attrs)
+        if name in nested_classes:
+            serializer_field = nested_classes[name]()  # noqa: PLW2901
+        step = compile_step(name, serializer_field, column)
+        if step is None:
+            return None
+        plan.steps.append(step)
+    return plan
+
+
+def compile_step(name: str, serializer_field: serializers.Field, column: str) -> Step | None:
+    if isinstance(serializer_field, serializers.ListSerializer):
+        return None
+    if isinstance(serializer_field, serializers.Serializer):
+        nested = compile_plan(serializer_field, f"{column}__")
+        return None if nested is None or nested.annotations else (name, column, None, nested)
+    # the column of a foreign key holds the primary key already
+    primary_key = isinstance(serializer_field, serializers.PrimaryKeyRelatedField) and serializer_field.pk_field is None
+    if primary_key or type(serializer_field).to_representation in IDENTITY_REPRESENTATIONS:
+        return (name, column, None, None)
+    convert = value_representation(serializer_field)
+    return None if convert is None else (name, column, convert, None)
+
+
+def value_representation(serializer_field: serializers.Field) -> Callable[[Any], Any] | None:
+    if isinstance(serializer_field, serializers.DateTimeField):
+        return datetime_representation(serializer_field)
+    if isinstance(serializer_field, VALUE_FIELDS):
+        to_representation: Callable[[Any], Any] = serializer_field.to_representation
+        return to_representation
+    return None
+
+
+def datetime_representation(serializer_field: serializers.DateTimeField) -> Callable[[Any], Any]:
+    """
+    ``DateTimeField.to_representation`` with the field's timezone looked up once, not for every value.
+
+    The plan renders datetimes in the timezone active when it was compiled, see ``ReadPlanCache``.
+    """
+    output_format = getattr(serializer_field, "format", api_settings.DATETIME_FORMAT)
+    field_timezone = (
+        serializer_field.timezone if hasattr(serializer_field, "timezone") else serializer_field.default_timezone()
+    )
+    to_representation: Callable[[Any], Any] = serializer_field.to_representation
+    if output_format is None or output_format.lower() != ISO_8601 or field_timezone is None:
+        return to_representation
+
+    def represent(value: Any) -> Any:  # noqa: ANN401
+        if not isinstance(value, datetime) or value.utcoffset() is None:
+            return to_representation(value)
+        text = value.astimezone(field_timezone).isoformat()
+        return text[:-6] + "Z" if text.endswith("+00:00") else text
+
+    return represent
+
+
+class ReadPlanCache:
+    """
+    LRU of compiled plans by key, so a serializer is instantiated and compiled once per field selection.
+
+    Keys come from request parameters, hence the ``max_size`` bound. The active timezone is part of every key:
+    compiled plans render datetimes in it.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._plans: OrderedDict[Hashable, ReadPlan | None] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, serializer: Callable[[], serializers.Serializer]) -> ReadPlan | None:
+        key = (key, timezone.get_current_timezone_name())
+        with self._lock:
+            if key in self._plans:
+                self._plans.move_to_end(key)
+                return self._plans[key]
+
+        plan = compile_plan(serializer())
+        with self._lock:
+            self._plans[key] = plan
+            while len(self._plans) > self.max_size:
+                self._plans.popitem(last=False)
+        return plan
+
+    def clear(self) -> None:
+        with self._lock:
+            self._plans.clear()
+
+
+read_plans = ReadPlanCache(settings.READ_PLAN_CACHE_SIZE)
@@ -0,0 +1,37 @@
+from typing import Any
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# datetimes in UTC end with "Z" and dict keys may be ints (list serializer errors), as with DRF's encoder
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    ``JSONRenderer`` on top of orjson.
+
+    orjson writes str, numbers, dicts, lists, dates, datetimes and UUIDs itself and hands anything else
+    (``Decimal``, lazy translations, querysets, ...) to DRF's encoder. U+2028 and U+2029, which orjson leaves
+    raw, are escaped afterwards as DRF does, so the output matches the default renderer. The browsable API
+    asks for indentation, which orjson only knows as two spaces.
+    """
+
+    encoder = JSONEncoder()
+
+    def render(
+        self,
+        data: Any,  # noqa: ANN401
+        accepted_media_type: str | None = None,
+        renderer_context: dict[str, Any] | None = None,
+    ) -> bytes:
+        if data is None:
+            return b""
+
+        options = ORJSON_OPTIONS
+        if self.get_indent(accepted_media_type or "", renderer_context or {}):
+            options |= orjson.OPT_INDENT_2
+        ret = orjson.dumps(data, default=self.encoder.default, option=options)
+        # valid JSON but not valid JavaScript, so DRF's renderer escapes them too
+        return ret.replace("\u2028".encode(), b"\\u2028").replace("\u2029".encode(), b"\\u2029")
@@ -49,6 +49,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "project.middleware.RequestMetricsMiddleware",
+    "project.middleware.CompressionMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
@@ -101,6 +103,10 @@ DATABASES = {
         "PASSWORD": os.getenv("DATABASE_PASSWORD"),
         "HOST": os.getenv("DATABASE_HOST", "localhost"),
         "PORT": os.getenv("DATABASE_PORT", "5432"),
+        # keep connections open between requests instead of reconnecting for each one;
+        # the pool size is bounded by gunicorn workers x threads (see production/gunicorn_conf.py)
+        "CONN_MAX_AGE": int(os.getenv("DATABASE_CONN_MAX_AGE", "60")),
+        "CONN_HEALTH_CHECKS": True,
     }
 }
 
@@ -115,7 +121,18 @@ AUTH_USER_MODEL = "accounts.User"
 
 REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
-    "DEFAULT_AUTHENTICATION_CLASSES": ("rest_framework_simplejwt.authentication.JWTAuthentication",),
+    "DEFAULT_AUTHENTICATION_CLASSES": ("accounts.authentication.ClaimsJWTAuthentication",),
+    "DEFAULT_RENDERER_CLASSES": (
+        "project.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "project.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
+    # answers the upload limits (accounts.upload_handlers) with their API errors
+    "EXCEPTION_HANDLER": "project.exceptions.api_exception_handler",
 }
 
 LANGUAGE_CODE = "ru"
@@ -149,7 +166,7 @@ else:
 
 STORAGES = {
     "default": {
-        "BACKEND": "storages.backends.s3boto3.S3Boto3Storage"
+        "BACKEND": "services.storage.CachedSignatureS3Storage"
         if S3_SETTINGS_CONFIGURED
         else "django.core.files.storage.FileSystemStorage",
         "OPTIONS": {
@@ -163,6 +180,10 @@ STORAGES = {
                     "signature_version": "s3v4",
                     "default_acl": "private",
                     "querystring_auth": True,
+                    "querystring_expire": int(os.getenv("S3_URL_EXPIRE", "3600")),
+                    # presigned URLs are reused for this many seconds instead of being signed per request
+                    "url_cache_window": int(os.getenv("S3_URL_CACHE_WINDOW", "1800")),
+                    "url_cache_alias": "presigned_urls",
                     "file_overwrite": False,
                     "location": "media",
                 }
@@ -174,8 +195,55 @@ STORAGES = {
     "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage", "OPTIONS": {}},
 }
 
+CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "presigned_urls": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "presigned-urls",
+        "OPTIONS": {"MAX_ENTRIES": int(os.getenv("S3_URL_CACHE_SIZE", "50000"))},
+    },
+    # one entry per vehicle and serializer variant (autotrips.services.fragments)
+    "vehicle_fragments": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "vehicle-fragments",
+        "OPTIONS": {"MAX_ENTRIES": int(os.getenv("VEHICLE_FRAGMENT_CACHE_SIZE", "100000"))},
+    },
+    # the current version of every user's token claims (accounts.services.claims), shared by the web workers
+    # and the bot: a table created by `manage.py createcachetable` unless pointed at Redis or Memcached
+    "user_versions": {
+        "BACKEND": os.getenv("USER_VERSION_CACHE_BACKEND", "django.core.cache.backends.db.DatabaseCache"),
+        "LOCATION": os.getenv("USER_VERSION_CACHE_LOCATION", "user_versions"),
+        "TIMEOUT": int(os.getenv("USER_VERSION_CACHE_TIMEOUT", str(24 * 60 * 60))),
+        "OPTIONS": {"MAX_ENTRIES": int(os.getenv("USER_VERSION_CACHE_SIZE", "100000"))},
+    },
+}
+
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 MAX_UPLOAD_SIZE = 5242880  # 5 MB
+MAX_UPLOAD_REQUEST_SIZE = int(os.getenv("MAX_UPLOAD_REQUEST_SIZE", str(150 * 1024 * 1024)))  # 150 MB
+MAX_UPLOAD_FILES = int(os.getenv("MAX_UPLOAD_FILES", "100"))
+DATA_UPLOAD_MAX_NUMBER_FILES = MAX_UPLOAD_FILES
+
+# Size and type limits are enforced while the body streams in, before anything is spooled to memory or disk
+FILE_UPLOAD_HANDLERS = [
+    "accounts.upload_handlers.StreamingLimitUploadHandler",
+    "django.core.files.uploadhandler.MemoryFileUploadHandler",
+    "django.core.files.uploadhandler.TemporaryFileUploadHandler",
+]
+
+# Uploaded photos are downscaled to this max side in pixels, re-encoded JPEGs use this quality
+PHOTO_INGEST_MAX_SIZE = int(os.getenv("PHOTO_INGEST_MAX_SIZE", "3000"))
+PHOTO_INGEST_QUALITY = int(os.getenv("PHOTO_INGEST_QUALITY", "85"))
+
+BACKGROUND_WORKERS = int(os.getenv("BACKGROUND_WORKERS", "2"))
+
+# Max side in pixels of every rendition generated for uploaded photos
+PHOTO_RENDITIONS = {
+    "thumbnail": int(os.getenv("PHOTO_THUMBNAIL_SIZE", "320")),
+    "medium": int(os.getenv("PHOTO_MEDIUM_SIZE", "1280")),
+}
+PHOTO_RENDITION_FORMAT = os.getenv("PHOTO_RENDITION_FORMAT", "WEBP")  # WEBP or JPEG
+PHOTO_RENDITION_QUALITY = int(os.getenv("PHOTO_RENDITION_QUALITY", "80"))
 
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=55),
@@ -196,6 +264,34 @@ SIMPLE_JWT = {
     "SLIDING_TOKEN_REFRESH_LIFETIME": timedelta(hours=1),
 }
 
+# request metrics (project.middleware.RequestMetricsMiddleware): share of requests measured, and where workers
+# write their totals so that /internal/metrics/ reports all of them (empty: this process only)
+METRICS_SAMPLE_RATE = float(os.getenv("METRICS_SAMPLE_RATE", "0.1"))
+METRICS_DIR = os.getenv("METRICS_DIR", "")
+METRICS_FLUSH_INTERVAL = int(os.getenv("METRICS_FLUSH_INTERVAL", "10"))
+# addresses allowed to read /internal/metrics/
+INTERNAL_IPS = os.getenv("INTERNAL_IPS", "127.0.0.1").split(",")
+
+# response compression, see project.middleware.CompressionMiddleware
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "5"))
+COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+COMPRESSION_CONTENT_TYPES = ("application/json", "text/plain")
+COMPRESSION_EXCLUDED_PATHS = ("/api/v1/accounts/token/",)
+# compressed bodies of at least COMPRESSION_CACHE_MIN_SIZE bytes are kept per process, up to COMPRESSION_CACHE_SIZE
+COMPRESSION_CACHE_MIN_SIZE = int(os.getenv("COMPRESSION_CACHE_MIN_SIZE", str(64 * 1024)))
+COMPRESSION_CACHE_SIZE = int(os.getenv("COMPRESSION_CACHE_SIZE", str(32 * 1024 * 1024)))
+
+# compiled read plans kept per process (project.read_plan), one per role serializer and field selection
+READ_PLAN_CACHE_SIZE = int(os.getenv("READ_PLAN_CACHE_SIZE", "256"))
+
+# claims put into refreshed access tokens are cached per user for this many seconds
+USER_CLAIMS_CACHE_TIMEOUT = int(os.getenv("USER_CLAIMS_CACHE_TIMEOUT", "300"))
+# the cached current-user payload holds presigned document URLs: keep it well below S3_URL_EXPIRE - S3_URL_CACHE_WINDOW
+CURRENT_USER_CACHE_TIMEOUT = int(os.getenv("CURRENT_USER_CACHE_TIMEOUT", "300"))
+# cached vehicle and bid list rows hold presigned document URLs too, the same bound applies
+VEHICLE_FRAGMENT_CACHE_TIMEOUT = int(os.getenv("VEHICLE_FRAGMENT_CACHE_TIMEOUT", "300"))
+
 SPECTACULAR_SETTINGS = {
     "TITLE": "Autotrips",
     "DESCRIPTION": "API documentation for Autotrips",
@@ -205,6 +301,26 @@ SPECTACULAR_SETTINGS = {
 
 TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
 TELEGRAM_GROUP_CHAT_ID = os.getenv("TELEGRAM_GROUP_CHAT_ID")
+# threads for the bot's blocking calls that have no async variant (password hashing, Google Sheets)
+TELEGRAM_BOT_WORKERS = int(os.getenv("TELEGRAM_BOT_WORKERS", "4"))
+# Telegram user -> account lookups cached per process, seconds to live and number of entries
+TELEGRAM_USER_CACHE_TTL = int(os.getenv("TELEGRAM_USER_CACHE_TTL", "300"))
+TELEGRAM_USER_CACHE_SIZE = int(os.getenv("TELEGRAM_USER_CACHE_SIZE", "1024"))
+# how often cached accounts are checked against the database: the longest a role or activity change made by
+# another process goes unnoticed by the bot's permission checks
+TELEGRAM_USER_CACHE_SYNC_INTERVAL = float(os.getenv("TELEGRAM_USER_CACHE_SYNC_INTERVAL", "5"))
+# vehicle registrations of one client within this many seconds go out as one notification;
+# the group chat gets at most one bot message per TELEGRAM_SEND_INTERVAL seconds (Telegram allows ~20 a minute)
+TELEGRAM_NOTIFY_WINDOW = float(os.getenv("TELEGRAM_NOTIFY_WINDOW", "5"))
+TELEGRAM_SEND_INTERVAL = float(os.getenv("TELEGRAM_SEND_INTERVAL", "3"))
+# FSM storage of the bot conversations (aiogram.fsm.storage.memory.MemoryStorage keeps them per process)
+# and how long an untouched conversation is kept, seconds
+TELEGRAM_FSM_STORAGE = os.getenv("TELEGRAM_FSM_STORAGE", "telegram_bot.storage.DatabaseStorage")
+TELEGRAM_FSM_TTL = int(os.getenv("TELEGRAM_FSM_TTL", "3600"))
+# webhook mode: public URL of telegram_bot.views.telegram_webhook and the secret Telegram sends back with each update;
+# leave empty to keep long polling
+TELEGRAM_WEBHOOK_URL = os.getenv("TELEGRAM_WEBHOOK_URL", "")
+TELEGRAM_WEBHOOK_SECRET = os.getenv("TELEGRAM_WEBHOOK_SECRET", "")
 
 TABLE_ID = os.getenv("TABLE_ID", "")
 CRM_TABLE_ID = os.getenv("CRM_TABLE_ID", "")
@@ -0,0 +1,145 @@
+from typing import Any
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Model, Prefetch
+from django.db.models.query import QuerySet
+from drf_spectacular.utils import OpenApiParameter
+from rest_framework import serializers, viewsets
+
+# fields kept whatever ?fields= and ?omit= say: clients key rows and groups by them
+ALWAYS_INCLUDED = ("id",)
+
+SPARSE_FIELDSET_PARAMETERS = [
+    OpenApiParameter(
+        name="fields",
+        type=str,
+        location=OpenApiParameter.QUERY,
+        required=False,
+        description="Comma-separated fields to return, e.g. fields=vin,client,status. 'id' is always returned.",
+    ),
+    OpenApiParameter(
+        name="omit",
+        type=str,
+        location=OpenApiParameter.QUERY,
+        required=False,
+        description="Comma-separated fields to leave out of the response.",
+    ),
+]
+
+
+def split_param(value: str) -> tuple[str, ...]:
+    return tuple(name.strip() for name in value.split(",") if name.strip())
+
+
+def readable_fields(serializer: serializers.BaseSerializer) -> dict[str, serializers.Field]:
+    child = serializer.child if isinstance(serializer, serializers.ListSerializer) else serializer
+    return {name: field for name, field in child.fields.items() if not field.write_only}
+
+
+def sparse_columns(model: type[Model], fields: dict[str, serializers.Field]) -> set[str] | None:
+    """
+    Model fields to load for ``fields``, as ``only()`` takes them.
+
+    A dotted source (``vehicle.vin``) loads its relation and the one column of it, unless another field uses
+    the whole relation. Method fields (``source="*"``) and reverse relations add nothing: they read the primary
+    key or a prefetch. ``None`` when a source is not a model field (a property may read any column).
+    """
+    columns = {model._meta.pk.name}  # noqa: SLF001
+    related_columns = set()
+    for field in fields.values():
+        if field.source == "*":
+            continue
+        name, _, rest = field.source.partition(".")
+        try:
+            model_field = model._meta.get_field(name)  # noqa: SLF001
+        except FieldDoesNotExist:
+            return None
+        if not model_field.concrete:
+            continue
+        columns.add(name)
+        if rest:
+            related_columns.add((name, rest.replace(".", "__")))
+    whole = {field.source for field in fields.values()}
+    return columns | {f"{name}__{rest}" for name, rest in related_columns if name not in whole}
+
+
+def prefetch_root(lookup: str | Prefetch) -> str:
+    path = lookup.prefetch_through if isinstance(lookup, Prefetch) else lookup
+    return path.split("__", 1)[0]
+
+
+def sparse_queryset(queryset: QuerySet, fields: dict[str, serializers.Field]) -> QuerySet:
+    """Load only the columns, joins and prefetches ``fields`` need."""
+    columns = sparse_columns(queryset.model, fields)
+    if columns is None:
+        return queryset
+
+    # a relation must not be deferred and joined at once
+    select_related = queryset.query.select_related
+    if isinstance(select_related, dict):
+        joined = [name for name in select_related if name in columns]
+        queryset = queryset.select_related(None)
+        if joined:
+            queryset = queryset.select_related(*joined)
+    sources = {field.source.split(".", 1)[0] for field in fields.values()}
+    lookups = queryset._prefetch_related_lookups  # noqa: SLF001
+    if lookups:
+        queryset = queryset.prefetch_related(None).prefetch_related(
+            *(lookup for lookup in lookups if prefetch_root(lookup) in sources)
+        )
+    return queryset.only(*columns)
+
+
+class SparseFieldsetMixin(viewsets.GenericViewSet):
+    """
+    ``?fields=`` and ``?omit=`` for GET requests.
+
+    The serializer drops the fields left out, and the queryset loads only the columns, joins and prefetches
+    the remaining ones need, so a list showing 8 of 50 columns reads, serializes and sends 8.
+    Serializers that add keys in ``to_representation`` must skip them when the backing field was dropped.
+    """
+
+    def sparse_selection(self) -> tuple[tuple[str, ...], tuple[str, ...]] | None:
+        if self.request.method != "GET":
+            return None
+        fields = split_param(self.request.query_params.get("fields", ""))
+        omit = split_param(self.request.query_params.get("omit", ""))
+        if not fields and not omit:
+            return None
+        return fields, omit
+
+    def selected_fields(self) -> tuple[str, ...]:
+        """
+        List the readable fields a response carries, in serializer order.
+
+        Unlike the raw query parameters this is a bounded, canonical key: unknown, repeated and reordered names
+        select the same fields.
+        """
+        return tuple(readable_fields(self.get_serializer()))
+
+    def sparse_fields(self, serializer: serializers.BaseSerializer) -> dict[str, serializers.Field] | None:
+        """Pick the readable fields of ``serializer`` the query parameters keep, ``None`` when there are none."""
+        selection = self.sparse_selection()
+        if selection is None:
+            return None
+
+        # names unknown to this serializer are ignored: the fields of a bid depend on the role and the status
+        fields, omit = selection
+        readable = readable_fields(serializer)
+        kept = set(fields or readable) - set(omit)
+        return {name: field for name, field in readable.items() if name in kept or name in ALWAYS_INCLUDED}
+
+    def get_queryset(self) -> QuerySet:
+        queryset = super().get_queryset()
+        fields = self.sparse_fields(self.get_serializer())
+        return queryset if fields is None else sparse_queryset(queryset, fields)
+
+    def get_serializer(self, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        serializer = super().get_serializer(*args, **kwargs)
+        fields = self.sparse_fields(serializer)
+        if fields is not None:
+            child = serializer.child if isinstance(serializer, serializers.ListSerializer) else serializer
+            for name in list(child.fields):
+                if name not in fields and not child.fields[name].write_only:
+                    child.fields.pop(name)
+        return serializer
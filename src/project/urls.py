@@ -23,12 +23,15 @@ from django.contrib import admin
 from django.urls import include, path
 from drf_spectacular.views import SpectacularAPIView, SpectacularRedocView, SpectacularSwaggerView
 
+from project.views import metrics
+
 # ЗДЕСЬ БУДУТ ТОЛЬКО ИНКЛЮДЫ и всякие готовые маршруты библиотек
 
 sub_urls = [
     # apps
     path("accounts/", include("accounts.urls")),
     path("autotrips/", include("autotrips.urls")),
+    path("telegram/", include("telegram_bot.urls")),
     # Swagger schema endpoints
     path("schema/", SpectacularAPIView.as_view(), name="schema"),
     path("schema/redoc/", SpectacularRedocView.as_view(url_name="schema"), name="redoc"),
@@ -39,6 +42,7 @@ sub_urls = [
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/v1/", include(sub_urls)),
+    path("internal/metrics/", metrics, name="metrics"),
 ]
 
 
@@ -0,0 +1,17 @@
+from django.conf import settings
+from django.http import Http404, HttpRequest, HttpResponse
+from django.views.decorators.http import require_GET
+
+from project.metrics import registry
+
+
+@require_GET
+def metrics(request: HttpRequest) -> HttpResponse:
+    """
+    Request metrics in the Prometheus text format.
+
+    Served outside ``/api/`` so nginx does not proxy it; only ``INTERNAL_IPS`` may read it.
+    """
+    if request.META.get("REMOTE_ADDR") not in settings.INTERNAL_IPS:
+        raise Http404
+    return HttpResponse(registry.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
@@ -0,0 +1,26 @@
+import logging
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from django.conf import settings
+from django.db import connections, transaction
+
+logger = logging.getLogger(__name__)
+
+_executor = ThreadPoolExecutor(max_workers=settings.BACKGROUND_WORKERS, thread_name_prefix="background")
+
+
+def _run(func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+    try:
+        func(*args, **kwargs)
+    except Exception:
+        msg = f"Background task {func.__qualname__} failed"
+        logger.exception(msg)
+    finally:
+        connections.close_all()
+
+
+def run_in_background(func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+    """Run ``func`` in a worker thread once the current transaction (if any) has been committed."""
+    transaction.on_commit(lambda: _executor.submit(_run, func, *args, **kwargs))
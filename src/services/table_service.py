@@ -6,6 +6,8 @@ from django.conf import settings
 from gspread import Client, Spreadsheet, Worksheet, exceptions, service_account
 from gspread.utils import ValueInputOption
 
+from project.metrics import external_call
+
 logger = logging.getLogger(__name__)
 
 
@@ -31,6 +33,7 @@ class TableManager:
     def delete_worksheet(self, title: str) -> None:
         self.table.del_worksheet(self.get_worksheet(title))
 
+    @external_call("sheets")
     def insert_header(self, title: str, headers: list[str], rows: int, index: int = 1) -> None:
         cols_count = len(headers)
         try:
@@ -42,14 +45,17 @@ class TableManager:
         if len(header_values) == 0:
             worksheet.insert_row(headers, index=index)
 
+    @external_call("sheets")
     def append_row(self, title: str, data: list[Any]) -> None:
         worksheet = self.get_worksheet(title)
         worksheet.append_row(data, value_input_option=ValueInputOption.user_entered)
 
+    @external_call("sheets")
     def get_data_from_worksheet(self, title: str) -> list[dict[str, Any]]:
         worksheet = self.get_worksheet(title)
         return worksheet.get_all_records()
 
+    @external_call("sheets")
     def get_col_data_from_worksheet(self, title: str, col: int) -> list[Any]:
         worksheet = self.get_worksheet(title)
         return worksheet.col_values(col)
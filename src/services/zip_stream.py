@@ -0,0 +1,64 @@
+import logging
+import zipfile
+from collections.abc import Iterable, Iterator
+
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+class _StreamBuffer:
+    """Write-only, unseekable file object: ``zipfile`` then emits data descriptors instead of seeking back."""
+
+    def __init__(self) -> None:
+        self.chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def pop(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+def stream_zip(entries: Iterable[tuple[str, Iterable[bytes]]]) -> Iterator[bytes]:
+    """
+    Build a ZIP archive on the fly from ``(archive name, chunks)`` pairs and yield it piece by piece.
+
+    Members are stored uncompressed (photos are compressed already) with zip64 headers, so neither
+    member nor archive size is limited and at most one source chunk is held in memory at a time.
+    An entry whose first chunk cannot be read is logged and left out of the archive.
+    """
+    buffer = _StreamBuffer()
+    date_time = timezone.localtime().timetuple()[:6]
+
+    with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_STORED) as archive:
+        for name, chunks in entries:
+            iterator = iter(chunks)
+            try:
+                first_chunk = next(iterator, b"")
+            except Exception:
+                msg = f"Skipping {name}: the file could not be read"
+                logger.exception(msg)
+                continue
+
+            info = zipfile.ZipInfo(name, date_time=date_time)
+            with archive.open(info, mode="w", force_zip64=True) as member:
+                member.write(first_chunk)
+                for chunk in iterator:
+                    member.write(chunk)
+                    if data := buffer.pop():
+                        yield data
+            if data := buffer.pop():
+                yield data
+
+    # central directory
+    yield buffer.pop()
@@ -1 +1,25 @@
-# Register your models here.
+from django.contrib import admin
+
+from .models import BotState, PendingNotification
+
+
+class BotStateAdmin(admin.ModelAdmin):
+    list_display = ("key", "state", "expires_at")
+
+    search_fields = ("key",)
+
+    ordering = ("-expires_at",)
+
+
+admin.site.register(BotState, BotStateAdmin)
+
+
+class PendingNotificationAdmin(admin.ModelAdmin):
+    list_display = ("key", "chat_id", "created", "claimed_at", "attempts")
+
+    search_fields = ("key",)
+
+    ordering = ("created",)
+
+
+admin.site.register(PendingNotification, PendingNotificationAdmin)
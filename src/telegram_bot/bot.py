@@ -1,5 +1,6 @@
-import asyncio
 import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
 
 from aiogram import Bot, Dispatcher, F
 from aiogram.enums import ParseMode
@@ -8,15 +9,19 @@ from aiogram.filters import CommandStart
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
 from aiogram.types import CallbackQuery as CallbackQueryType
-from aiogram.types import KeyboardButton, Message, ReplyKeyboardMarkup
+from aiogram.types import KeyboardButton, Message, ReplyKeyboardMarkup, TelegramObject
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError
-from django.db import IntegrityError
+from django.db import IntegrityError, close_old_connections
 from django.utils import timezone
+from django.utils.module_loading import import_string
 
 from accounts.models import User
 from services.table_service import table_manager
+from telegram_bot.executor import run_blocking
+from telegram_bot.user_cache import TelegramAccount, user_cache
 
 URL = settings.FRONTEND_URL
 WORKSHEET = settings.CHECKER_WORKSHEET
@@ -29,7 +34,20 @@ except Exception as e:  # noqa: BLE001
     msg = f"Bot is disabled. Telegram bot configuration error: {e}"
     logger.warning(msg)
 
-dp = Dispatcher()
+dp = Dispatcher(storage=import_string(settings.TELEGRAM_FSM_STORAGE)())
+
+
+async def database_connection_middleware(
+    handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+    event: TelegramObject,
+    data: dict[str, Any],
+) -> Any:  # noqa: ANN401
+    """Drop stale or expired DB connections before each update, as Django does at the start of a request."""
+    await sync_to_async(close_old_connections)()
+    return await handler(event, data)
+
+
+dp.update.outer_middleware.register(database_connection_middleware)
 
 
 class PasswordResetStates(StatesGroup):
@@ -37,8 +55,8 @@ class PasswordResetStates(StatesGroup):
     enter_new_password = State()
 
 
-def check_user_permission(user: User) -> None:
-    if user.role not in [User.Roles.ADMIN, User.Roles.MANAGER]:
+def check_user_permission(user: User | TelegramAccount) -> None:
+    if not user.is_active or user.role not in [User.Roles.ADMIN, User.Roles.MANAGER]:
         raise PermissionError
 
 
@@ -50,7 +68,7 @@ def get_password_reset_keyboard() -> ReplyKeyboardMarkup:
     )
 
 
-def get_main_keyboard(user: User) -> ReplyKeyboardMarkup:
+def get_main_keyboard(user: User | TelegramAccount) -> ReplyKeyboardMarkup:
     """Генерирует клавиатуру на основе роли и статуса пользователя."""
     buttons = []
 
@@ -79,29 +97,32 @@ def get_unauthorized_keyboard() -> ReplyKeyboardMarkup:
 @dp.message(CommandStart())
 async def start_command(message: Message) -> None:
     """Обработчик команды /start с динамической клавиатурой."""
-    try:
-        # Пытаемся найти пользователя по привязанному ID
-        user = await asyncio.to_thread(User.objects.get, tg_user_id=message.from_user.id)  # type: ignore[union-attr]
-        keyboard = get_main_keyboard(user)
-        await message.answer("Выберите действие:", reply_markup=keyboard)
-    except User.DoesNotExist:
+    # Пытаемся найти пользователя по привязанному ID
+    user = await user_cache.by_tg_user_id(message.from_user.id)  # type: ignore[union-attr]
+    if user is None:
         # Пользователь не привязан - минимальная клавиатура
         keyboard = get_unauthorized_keyboard()
         await message.answer("🔑 Для начала работы привяжите свой Telegram ID:", reply_markup=keyboard)
+        return
+
+    keyboard = get_main_keyboard(user)
+    await message.answer("Выберите действие:", reply_markup=keyboard)
 
 
 @dp.message(F.text == "Отправить тестовое сообщение в группу")
-async def send_test_message(message: Message) -> None:
+async def send_test_message(message: Message, bot: Bot) -> None:
     """Обработчик тестового сообщения с проверкой прав."""
+    user = await user_cache.by_tg_user_id(message.from_user.id)  # type: ignore[union-attr]
+    if user is None:
+        await message.answer("❌ Аккаунт не привязан!")
+        return
+
     try:
-        user = await asyncio.to_thread(User.objects.get, tg_user_id=message.from_user.id)  # type: ignore[union-attr]
         check_user_permission(user)
 
         await bot.send_message(chat_id=settings.TELEGRAM_GROUP_CHAT_ID, text="Бот работает! Это тестовое сообщение.")
         await message.answer("✅ Сообщение отправлено в группу!")
 
-    except User.DoesNotExist:
-        await message.answer("❌ Аккаунт не привязан!")
     except PermissionError:
         await message.answer("⛔ У вас недостаточно прав для этого действия!")
 
@@ -111,14 +132,14 @@ async def bind_tg_user_id(message: Message) -> None:
     """Обработчик привязки Telegram ID."""
     try:
         # Ищем пользователя по telegram username
-        user = await asyncio.to_thread(User.objects.get, telegram=message.from_user.username)  # type: ignore[union-attr]
+        user = await User.objects.aget(telegram=message.from_user.username)  # type: ignore[union-attr]
 
         if user.tg_user_id:
             await message.answer("✅ Ваш аккаунт уже привязан!")
             return
 
         user.tg_user_id = message.from_user.id  # type: ignore[union-attr]
-        await asyncio.to_thread(user.save)
+        await user.asave(update_fields=["tg_user_id", "updated_at"])
 
         # Показываем обновленную клавиатуру
         await message.answer("✅ Аккаунт успешно привязан!", reply_markup=get_main_keyboard(user))
@@ -131,29 +152,28 @@ async def bind_tg_user_id(message: Message) -> None:
 
 @dp.message(F.text == "Сбросить пароль")
 async def start_password_reset(message: Message, state: FSMContext) -> None:
-    try:
-        user = await asyncio.to_thread(User.objects.get, tg_user_id=message.from_user.id)  # type: ignore[union-attr]
-
-        # Добавляем проверку привязки аккаунта через клавиатуру
-        if not user.tg_user_id:
-            await message.answer("❌ Сначала привяжите Telegram ID", reply_markup=get_main_keyboard(user))
-            return
+    user = await user_cache.by_tg_user_id(message.from_user.id)  # type: ignore[union-attr]
+    if user is None:
+        await message.answer("❌ Аккаунт не привязан!", reply_markup=get_unauthorized_keyboard())
+        return
 
-        await message.answer(
-            "⚠️ Вы уверены, что хотите сбросить пароль?",
-            reply_markup=ReplyKeyboardMarkup(
-                keyboard=[[KeyboardButton(text="Да"), KeyboardButton(text="Нет")]], resize_keyboard=True
-            ),
-        )
-        await state.set_state(PasswordResetStates.confirm_reset)
+    # Добавляем проверку привязки аккаунта через клавиатуру
+    if not user.tg_user_id:
+        await message.answer("❌ Сначала привяжите Telegram ID", reply_markup=get_main_keyboard(user))
+        return
 
-    except User.DoesNotExist:
-        await message.answer("❌ Аккаунт не привязан!", reply_markup=get_unauthorized_keyboard())
+    await message.answer(
+        "⚠️ Вы уверены, что хотите сбросить пароль?",
+        reply_markup=ReplyKeyboardMarkup(
+            keyboard=[[KeyboardButton(text="Да"), KeyboardButton(text="Нет")]], resize_keyboard=True
+        ),
+    )
+    await state.set_state(PasswordResetStates.confirm_reset)
 
 
 @dp.message(PasswordResetStates.confirm_reset, F.text.in_(["Да", "Нет"]))
 async def handle_reset_confirmation(message: Message, state: FSMContext) -> None:
-    user = await asyncio.to_thread(User.objects.get, tg_user_id=message.from_user.id)  # type: ignore[union-attr]
+    user = await user_cache.by_tg_user_id(message.from_user.id)  # type: ignore[union-attr]
 
     if message.text == "Нет":
         await message.answer(
@@ -172,7 +192,7 @@ async def handle_reset_confirmation(message: Message, state: FSMContext) -> None
 # Обработчик ввода нового пароля
 @dp.message(PasswordResetStates.enter_new_password)
 async def process_new_password(message: Message, state: FSMContext) -> None:
-    user = await asyncio.to_thread(User.objects.get, tg_user_id=message.from_user.id)  # type: ignore[union-attr]
+    user = await User.objects.aget(tg_user_id=message.from_user.id)  # type: ignore[union-attr]
 
     if message.text == "Отменить сброс пароля":
         await message.answer(
@@ -186,7 +206,7 @@ async def process_new_password(message: Message, state: FSMContext) -> None:
 
     try:
         # Стандартная валидация пароля Django
-        await asyncio.to_thread(validate_password, new_password, user=user)
+        await run_blocking(validate_password, new_password, user=user)
     except ValidationError as e:
         # Преобразование стандартных ошибок в русские сообщения
         error_messages = []
@@ -206,8 +226,8 @@ async def process_new_password(message: Message, state: FSMContext) -> None:
         return
 
     try:
-        await asyncio.to_thread(user.set_password, new_password)
-        await asyncio.to_thread(user.save)
+        await run_blocking(user.set_password, new_password)
+        await user.asave(update_fields=["password", "updated_at"])
 
         await message.answer("✅ Пароль успешно изменен!", reply_markup=get_main_keyboard(user))
 
@@ -226,24 +246,22 @@ async def process_new_password(message: Message, state: FSMContext) -> None:
 async def accept_callback(callback_query: CallbackQueryType) -> None:
     try:
         user_id = int(callback_query.data.split(":")[1])  # type: ignore[union-attr]
-        user = await asyncio.to_thread(User.objects.get, id=user_id)
+        user = await User.objects.aget(id=user_id)
         if not user.is_approved:
-            clicker_telegram = callback_query.from_user.username
-            try:
-                clicker_user = await asyncio.to_thread(User.objects.get, telegram=clicker_telegram)
-                if clicker_user.role in ["admin", "manager"]:
-                    user.is_approved = True
-                    accept_datetime = timezone.now().strftime("%Y-%m-%d %H:%M")
-                    documents_url = f"Ссылка на документы: {URL}docs/{user.id}"
-                    data = [accept_datetime, user.full_name, user.phone, user.telegram, documents_url]
-                    table_manager.append_row(WORKSHEET, data)
-                    await asyncio.to_thread(user.save)
-                    await callback_query.answer()
-                    await callback_query.message.edit_text(text="Пользователь принят")  # type: ignore[union-attr]
-                else:
-                    await callback_query.answer("У вас нет прав для выполнения этого действия")
-            except User.DoesNotExist:
+            clicker_user = await user_cache.by_username(callback_query.from_user.username)
+            if clicker_user is None:
                 await callback_query.answer("Вы не авторизованы для выполнения этого действия")
+            elif clicker_user.is_active and clicker_user.role in ["admin", "manager"]:
+                user.is_approved = True
+                accept_datetime = timezone.now().strftime("%Y-%m-%d %H:%M")
+                documents_url = f"Ссылка на документы: {URL}docs/{user.id}"
+                data = [accept_datetime, user.full_name, user.phone, user.telegram, documents_url]
+                await run_blocking(table_manager.append_row, WORKSHEET, data)
+                await user.asave(update_fields=["is_approved", "updated_at"])
+                await callback_query.answer()
+                await callback_query.message.edit_text(text="Пользователь принят")  # type: ignore[union-attr]
+            else:
+                await callback_query.answer("У вас нет прав для выполнения этого действия")
         else:
             await callback_query.answer("Пользователь уже принят")
     except Exception as e:  # noqa: BLE001
@@ -254,20 +272,18 @@ async def accept_callback(callback_query: CallbackQueryType) -> None:
 async def reject_callback(callback_query: CallbackQueryType) -> None:
     try:
         user_id = int(callback_query.data.split(":")[1])  # type: ignore[union-attr]
-        user = await asyncio.to_thread(User.objects.get, id=user_id)
+        user = await User.objects.aget(id=user_id)
         if user.is_active:
-            clicker_telegram = callback_query.from_user.username
-            try:
-                clicker_user = await asyncio.to_thread(User.objects.get, telegram=clicker_telegram)
-                if clicker_user.role in ["admin", "manager"]:
-                    user.is_active = False
-                    await asyncio.to_thread(user.save)
-                    await callback_query.answer()
-                    await callback_query.message.edit_text(text="Пользователь отклонен")  # type: ignore[union-attr]
-                else:
-                    await callback_query.answer("У вас нет прав для выполнения этого действия")
-            except User.DoesNotExist:
+            clicker_user = await user_cache.by_username(callback_query.from_user.username)
+            if clicker_user is None:
                 await callback_query.answer("Вы не авторизованы для выполнения этого действия")
+            elif clicker_user.is_active and clicker_user.role in ["admin", "manager"]:
+                user.is_active = False
+                await user.asave(update_fields=["is_active", "updated_at"])
+                await callback_query.answer()
+                await callback_query.message.edit_text(text="Пользователь отклонен")  # type: ignore[union-attr]
+            else:
+                await callback_query.answer("У вас нет прав для выполнения этого действия")
         else:
             await callback_query.answer("Пользователь уже отклонен или неактивен")
     except Exception:  # noqa: BLE001
@@ -282,7 +298,10 @@ async def process_report_callback(callback: CallbackQueryType) -> None:
             await callback.answer("❌ Сообщение не найдено")
             return
 
-        user = await asyncio.to_thread(User.objects.get, tg_user_id=callback.from_user.id)
+        user = await user_cache.by_tg_user_id(callback.from_user.id)
+        if user is None:
+            await callback.answer("❌ Аккаунт не привязан!")
+            return
 
         try:
             check_user_permission(user)
@@ -0,0 +1,17 @@
+import asyncio
+import functools
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from django.conf import settings
+
+# Bounded pool for the blocking calls that have no async variant (password hashing, Google Sheets).
+# ORM access goes through Django's async ORM instead, so these threads never hold database connections.
+_executor = ThreadPoolExecutor(max_workers=settings.TELEGRAM_BOT_WORKERS, thread_name_prefix="bot")
+
+
+async def run_blocking(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+    """Run a blocking call on the bot's bounded executor without stalling the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, functools.partial(func, *args, **kwargs))
@@ -0,0 +1,60 @@
+import asyncio
+import logging
+import threading
+from collections.abc import Callable, Coroutine
+from concurrent.futures import Future
+from typing import Any, TypeVar
+
+from aiogram import Bot
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class BotLoop:
+    """
+    Event loop thread that talks to Telegram on behalf of the web process.
+
+    Django serves requests from sync threads (and under ASGI from a loop it may replace per request), while a
+    bot's aiohttp session must stay on one loop to keep its connections to the Bot API alive. Every process
+    therefore starts one such thread, with its own ``Bot``, the first time it receives or sends something.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._bot: Bot | None = None
+
+    @property
+    def started(self) -> bool:
+        return self._loop is not None
+
+    def submit(self, func: Callable[[Bot], Coroutine[Any, Any, T]]) -> Future[T]:
+        """Run ``func(bot)`` on the loop; failures are logged."""
+        loop, bot = self._start()
+        future = asyncio.run_coroutine_threadsafe(func(bot), loop)
+        future.add_done_callback(self._log_failure)
+        return future
+
+    def call_soon(self, func: Callable[..., object], *args: Any) -> None:  # noqa: ANN401
+        """Run a plain callback on the loop thread, so it may share state with coroutines without locking."""
+        loop, _ = self._start()
+        loop.call_soon_threadsafe(func, *args)
+
+    def _start(self) -> tuple[asyncio.AbstractEventLoop, Bot]:
+        with self._lock:
+            if self._loop is None or self._bot is None:
+                self._bot = Bot(token=settings.TELEGRAM_BOT_TOKEN)
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name="telegram-bot", daemon=True).start()
+            return self._loop, self._bot
+
+    @staticmethod
+    def _log_failure(future: Future[Any]) -> None:
+        if not future.cancelled() and (error := future.exception()) is not None:
+            logger.error("Telegram call failed", exc_info=error)
+
+
+bot_loop = BotLoop()
@@ -1,17 +1,55 @@
-from typing import Any
+import asyncio
+from typing import Any, cast
 
-from django.core.management.base import BaseCommand
+from aiogram.exceptions import AiogramError
+from django.conf import settings
+from django.core.management.base import ArgumentParser, BaseCommand
 
 from telegram_bot.bot import bot, dp
+from telegram_bot.notifications import vehicle_notifications
 
 
 class Command(BaseCommand):
-    help = "Start the Telegram Bot"
+    help = (
+        "Start the Telegram Bot and the sender of queued notifications. With TELEGRAM_WEBHOOK_URL set, register the "
+        "webhook served by the web app and keep only sending; fall back to long polling if that is not possible. "
+        "Run exactly one such process, in webhook mode too: it is the only one sending to the group chat"
+    )
 
-    async def start_bot(self) -> None:
-        await dp.start_polling(bot)
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument("--polling", action="store_true", help="Remove the webhook and use long polling")
 
-    def handle(self, *args: tuple[Any], **options: dict[str, Any]) -> None:
-        import asyncio
+    async def start_bot(self, *, polling: bool) -> None:
+        # web workers only queue notifications (telegram_bot.notifications), this process sends them
+        sender = asyncio.create_task(vehicle_notifications.run(bot))
+        try:
+            if settings.TELEGRAM_WEBHOOK_URL and not polling and await self.set_webhook():
+                await sender
+                return
+
+            # getUpdates is rejected while a webhook is set
+            await bot.delete_webhook()
+            await dp.start_polling(bot)
+        finally:
+            sender.cancel()
+
+    async def set_webhook(self) -> bool:
+        if not settings.TELEGRAM_WEBHOOK_SECRET:
+            self.stderr.write("TELEGRAM_WEBHOOK_SECRET is not set, falling back to long polling")
+            return False
 
-        asyncio.run(self.start_bot())
+        try:
+            await bot.set_webhook(
+                url=settings.TELEGRAM_WEBHOOK_URL,
+                secret_token=settings.TELEGRAM_WEBHOOK_SECRET,
+                allowed_updates=dp.resolve_used_update_types(),
+            )
+        except AiogramError as e:
+            self.stderr.write(f"Failed to set the webhook, falling back to long polling: {e}")
+            return False
+
+        self.stdout.write(self.style.SUCCESS(f"Webhook set to {settings.TELEGRAM_WEBHOOK_URL}"))
+        return True
+
+    def handle(self, *args: tuple[Any], **options: dict[str, Any]) -> None:
+        asyncio.run(self.start_bot(polling=cast(bool, options["polling"])))
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BotState',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=255, unique=True, verbose_name='Key')),
+                ('state', models.CharField(blank=True, default='', max_length=255, verbose_name='State')),
+                ('data', models.JSONField(blank=True, default=dict, verbose_name='Data')),
+                ('expires_at', models.DateTimeField(db_index=True, verbose_name='Expires at')),
+            ],
+            options={
+                'verbose_name': 'Bot state',
+                'verbose_name_plural': 'Bot states',
+            },
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:13
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('telegram_bot', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PendingNotification',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(db_index=True, max_length=255, verbose_name='Key')),
+                ('chat_id', models.CharField(max_length=64, verbose_name='Chat ID')),
+                ('header', models.TextField(verbose_name='Header')),
+                ('lines', models.JSONField(default=list, verbose_name='Lines')),
+                ('reply_markup', models.JSONField(blank=True, null=True, verbose_name='Reply markup')),
+                ('created', models.DateTimeField(db_index=True, default=django.utils.timezone.now, verbose_name='Created')),
+            ],
+            options={
+                'verbose_name': 'Pending notification',
+                'verbose_name_plural': 'Pending notifications',
+            },
+        ),
+    ]
@@ -1 +1,40 @@
-# Create your models here.
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+
+class BotState(models.Model):
+    """FSM state and data of one bot conversation, shared by every process that handles updates."""
+
+    key = models.CharField(_("Key"), max_length=255, unique=True)
+    state = models.CharField(_("State"), max_length=255, blank=True, default="")
+    data = models.JSONField(_("Data"), default=dict, blank=True)
+    expires_at = models.DateTimeField(_("Expires at"), db_index=True)
+
+    class Meta:
+        verbose_name = _("Bot state")
+        verbose_name_plural = _("Bot states")
+
+    def __str__(self) -> str:
+        return str(self.key)
+
+
+class PendingNotification(models.Model):
+    """Lines waiting to be sent to a chat; rows with the same key go out together as one notification."""
+
+    key = models.CharField(_("Key"), max_length=255, db_index=True)
+    chat_id = models.CharField(_("Chat ID"), max_length=64)
+    header = models.TextField(_("Header"))
+    lines = models.JSONField(_("Lines"), default=list)
+    reply_markup = models.JSONField(_("Reply markup"), null=True, blank=True)
+    created = models.DateTimeField(_("Created"), default=timezone.now, db_index=True)
+    # set while a sender works on the row, which is deleted once sent (telegram_bot.notifications)
+    claimed_at = models.DateTimeField(_("Claimed at"), null=True, blank=True)
+    attempts = models.PositiveSmallIntegerField(_("Attempts"), default=0)
+
+    class Meta:
+        verbose_name = _("Pending notification")
+        verbose_name_plural = _("Pending notifications")
+
+    def __str__(self) -> str:
+        return str(self.key)
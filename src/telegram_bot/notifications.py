@@ -0,0 +1,193 @@
+import asyncio
+import logging
+from collections.abc import Hashable
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Any
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.types import InlineKeyboardMarkup
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from telegram_bot.models import PendingNotification
+
+logger = logging.getLogger(__name__)
+
+TELEGRAM_MESSAGE_LIMIT = 4096
+# room for the "processed by" line process_report_callback appends when it edits a message
+EDIT_RESERVE = 100
+SEND_ATTEMPTS = 3
+# seconds between two looks at the pending notifications
+POLL_INTERVAL = 1.0
+# a batch neither sent nor dropped this many seconds after it was claimed is claimed again
+CLAIM_TIMEOUT = 60
+# a batch that failed to go out this many times is logged and dropped instead of retried forever
+CLAIM_ATTEMPTS = 5
+
+
+def telegram_length(text: str) -> int:
+    """Message length as Telegram counts it, in UTF-16 code units."""
+    return len(text.encode("utf-16-le")) // 2
+
+
+def split_message(header: str, lines: list[str], limit: int = TELEGRAM_MESSAGE_LIMIT - EDIT_RESERVE) -> list[str]:
+    """
+    Lay numbered lines out under the header in as few messages as fit into ``limit``.
+
+    Messages break only between lines, so HTML inside a line is never cut; every part repeats the header
+    and is marked "Часть i/n" when there is more than one.
+    """
+    # "Часть NNN/NNN" and the blank line around it
+    budget = limit - telegram_length(header) - 20
+    parts: list[list[str]] = [[]]
+    size = 0
+    for number, line in enumerate(lines, 1):
+        entry = f"{number}. {line}"
+        length = telegram_length(entry) + 1
+        if parts[-1] and size + length > budget:
+            parts.append([])
+            size = 0
+        parts[-1].append(entry)
+        size += length
+
+    if len(parts) == 1:
+        return [f"{header}\n\n" + "\n".join(parts[0])]
+    return [f"{header}\nЧасть {index}/{len(parts)}\n\n" + "\n".join(part) for index, part in enumerate(parts, 1)]
+
+
+class NotificationQueue:
+    """
+    Send messages one at a time, at most one per ``interval`` seconds, waiting out Telegram's flood control.
+
+    A group chat accepts about 20 bot messages a minute; going faster gets 429 responses instead of messages.
+    """
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._turn = asyncio.Lock()
+        self._next_send = 0.0
+
+    async def send(self, bot: Bot, chat_id: int | str, text: str, reply_markup: InlineKeyboardMarkup | None) -> None:
+        async with self._turn:
+            loop = asyncio.get_running_loop()
+            await asyncio.sleep(max(0.0, self._next_send - loop.time()))
+            try:
+                await self._send_with_retries(bot, chat_id, text, reply_markup)
+            finally:
+                self._next_send = loop.time() + self.interval
+
+    async def _send_with_retries(
+        self, bot: Bot, chat_id: int | str, text: str, reply_markup: InlineKeyboardMarkup | None
+    ) -> None:
+        for _ in range(SEND_ATTEMPTS - 1):
+            try:
+                await bot.send_message(chat_id=chat_id, text=text, parse_mode="HTML", reply_markup=reply_markup)
+            except TelegramRetryAfter as e:
+                await asyncio.sleep(e.retry_after)
+            else:
+                return
+        await bot.send_message(chat_id=chat_id, text=text, parse_mode="HTML", reply_markup=reply_markup)
+
+
+@dataclass
+class _Batch:
+    key: str
+    chat_id: str
+    header: str
+    reply_markup: InlineKeyboardMarkup | None
+    lines: list[str] = field(default_factory=list)
+    pks: list[int] = field(default_factory=list)
+
+
+class MessageAggregator:
+    """
+    Collect lines reported under the same key for ``window`` seconds and send them as one notification.
+
+    Any process adds lines. Each call writes a ``PendingNotification`` row in the caller's transaction, so a
+    rolled back registration reports nothing. Only the bot process sends (``run``, started by ``start_bot``). It
+    claims the batches whose first line is ``window`` seconds old, with ``select_for_update(skip_locked=True)``
+    so that no batch goes out twice, and passes them through one rate-limited queue. Every gunicorn worker
+    therefore feeds the same batches and the same send rate. The rows of a batch are deleted once it is sent;
+    a batch that failed, or whose sender died, is claimed again after ``CLAIM_TIMEOUT`` seconds (a notification
+    split into parts may then repeat the parts that went out).
+    """
+
+    def __init__(self, queue: NotificationQueue, chat_id: int | str, window: float) -> None:
+        self.queue = queue
+        self.chat_id = chat_id
+        self.window = window
+
+    def add(self, key: Hashable, header: str, lines: list[str], reply_markup: InlineKeyboardMarkup | None) -> None:
+        PendingNotification.objects.create(
+            key=str(key),
+            chat_id=str(self.chat_id),
+            header=header,
+            lines=lines,
+            reply_markup=reply_markup.model_dump(mode="json", exclude_none=True) if reply_markup else None,
+        )
+
+    async def run(self, bot: Bot) -> None:
+        """Send due batches until cancelled."""
+        while True:
+            try:
+                await self.send_due(bot)
+            except Exception:
+                logger.exception("Sending pending notifications failed")
+            await asyncio.sleep(POLL_INTERVAL)
+
+    async def send_due(self, bot: Bot) -> None:
+        for batch in await sync_to_async(self._claim_due)():
+            try:
+                for text in split_message(batch.header, batch.lines):
+                    await self.queue.send(bot, batch.chat_id, text, batch.reply_markup)
+            except Exception:
+                logger.exception("Sending notification %s failed, retrying in %s s", batch.key, CLAIM_TIMEOUT)
+                continue
+            await PendingNotification.objects.filter(pk__in=batch.pks).adelete()
+
+    def _claim_due(self) -> list[_Batch]:
+        """Claim the rows of every batch whose first line waited ``window`` seconds and that nobody works on."""
+        now = timezone.now()
+        due_keys = PendingNotification.objects.filter(created__lte=now - timedelta(seconds=self.window)).values("key")
+        free = Q(claimed_at__isnull=True) | Q(claimed_at__lte=now - timedelta(seconds=CLAIM_TIMEOUT))
+        with transaction.atomic():
+            rows = list(
+                PendingNotification.objects.select_for_update(skip_locked=True)
+                .filter(free, key__in=due_keys)
+                .order_by("created", "pk")
+            )
+            failed = [row for row in rows if row.attempts >= CLAIM_ATTEMPTS]
+            if failed:
+                keys = sorted({row.key for row in failed})
+                logger.error("Dropping notifications %s after %s failed attempts", keys, CLAIM_ATTEMPTS)
+                PendingNotification.objects.filter(pk__in=[row.pk for row in failed]).delete()
+            rows = [row for row in rows if row.attempts < CLAIM_ATTEMPTS]
+            PendingNotification.objects.filter(pk__in=[row.pk for row in rows]).update(
+                claimed_at=now, attempts=F("attempts") + 1
+            )
+
+        batches: dict[str, _Batch] = {}
+        for row in rows:
+            batch = batches.get(row.key)
+            if batch is None:
+                batch = batches[row.key] = _Batch(
+                    row.key, row.chat_id, row.header, self._reply_markup(row.reply_markup)
+                )
+            batch.lines.extend(row.lines)
+            batch.pks.append(row.pk)
+        return list(batches.values())
+
+    @staticmethod
+    def _reply_markup(data: dict[str, Any] | None) -> InlineKeyboardMarkup | None:
+        return InlineKeyboardMarkup.model_validate(data) if data is not None else None
+
+
+notification_queue = NotificationQueue(interval=settings.TELEGRAM_SEND_INTERVAL)
+vehicle_notifications = MessageAggregator(
+    notification_queue, chat_id=settings.TELEGRAM_GROUP_CHAT_ID, window=settings.TELEGRAM_NOTIFY_WINDOW
+)
@@ -0,0 +1,13 @@
+from typing import Any
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from accounts.models import User
+from telegram_bot.user_cache import user_cache
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_telegram_user(sender: type[User], instance: User, **kwargs: dict[str, Any]) -> None:  # noqa: ARG001
+    user_cache.invalidate(instance)
@@ -0,0 +1,55 @@
+from collections.abc import Mapping
+from datetime import timedelta
+from typing import Any
+
+from aiogram.fsm.state import State
+from aiogram.fsm.storage.base import BaseStorage, DefaultKeyBuilder, KeyBuilder, StateType, StorageKey
+from django.conf import settings
+from django.utils import timezone
+
+from telegram_bot.models import BotState
+
+
+class DatabaseStorage(BaseStorage):
+    """
+    FSM storage kept in the ``BotState`` table.
+
+    Any bot process (polling or a web worker in webhook mode) can continue a conversation another one started,
+    and a restart does not drop users out of the password reset flow. A conversation nobody touches for
+    ``TELEGRAM_FSM_TTL`` seconds is forgotten; expired rows are deleted on the next write.
+    """
+
+    def __init__(self, ttl: int | None = None, key_builder: KeyBuilder | None = None) -> None:
+        self.ttl = timedelta(seconds=ttl if ttl is not None else settings.TELEGRAM_FSM_TTL)
+        self.key_builder = key_builder or DefaultKeyBuilder()
+
+    async def set_state(self, key: StorageKey, state: StateType = None) -> None:
+        await self._write(key, state=(state.state if isinstance(state, State) else state) or "")
+
+    async def get_state(self, key: StorageKey) -> str | None:
+        record = await self._read(key)
+        return record.state or None if record is not None else None
+
+    async def set_data(self, key: StorageKey, data: Mapping[str, Any]) -> None:
+        await self._write(key, data=dict(data))
+
+    async def get_data(self, key: StorageKey) -> dict[str, Any]:
+        record = await self._read(key)
+        return dict(record.data) if record is not None else {}
+
+    async def close(self) -> None:
+        """Do nothing: the connections belong to Django."""
+
+    async def _read(self, key: StorageKey) -> BotState | None:
+        return await BotState.objects.filter(key=self.key_builder.build(key), expires_at__gt=timezone.now()).afirst()
+
+    async def _write(self, key: StorageKey, **fields: Any) -> None:  # noqa: ANN401
+        now = timezone.now()
+        # an expired conversation must not lend its leftovers to a new one
+        await BotState.objects.filter(expires_at__lte=now).adelete()
+
+        record, _ = await BotState.objects.aupdate_or_create(
+            key=self.key_builder.build(key), defaults={**fields, "expires_at": now + self.ttl}
+        )
+        if not record.state and not record.data:
+            await record.adelete()
@@ -0,0 +1,147 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from django.conf import settings
+
+from accounts.models import User
+
+# a missing account is usually a stranger pressing buttons in the group; remember that only briefly
+NEGATIVE_TTL = 30
+
+_MISSING = object()
+
+
+@dataclass(frozen=True, slots=True)
+class TelegramAccount:
+    """The part of a ``User`` the bot needs to answer a button press."""
+
+    id: int
+    role: str
+    is_approved: bool
+    is_active: bool
+    tg_user_id: int | None
+    telegram: str | None
+    updated_at: datetime
+
+
+class TelegramUserCache:
+    """
+    In-process TTL/LRU cache of Telegram user → account lookups, including lookups that found nobody.
+
+    Entries are dropped from ``User`` post_save/post_delete in this process (see ``telegram_bot.signals``). Saves
+    and deletions made elsewhere (the web workers, the bot process, ``touch_profile``) are caught by comparing the
+    cached ``updated_at`` of every account with the database, in one query at most every ``sync_interval``
+    seconds and only when a lookup is made: a revoked manager keeps bot permissions for at most that long.
+    Accounts that found nobody are remembered for ``negative_ttl`` seconds.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, sync_interval: float, negative_ttl: float = NEGATIVE_TTL) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.sync_interval = sync_interval
+        self.negative_ttl = min(negative_ttl, ttl)
+        self._next_sync = 0.0
+        self._entries: OrderedDict[tuple[str, Any], tuple[float, TelegramAccount | None]] = OrderedDict()
+        self._lock = threading.Lock()
+        # bumped on invalidation so a lookup that raced with a save does not store what it read before it
+        self._generation = 0
+
+    async def by_tg_user_id(self, tg_user_id: int) -> TelegramAccount | None:
+        return await self._lookup("tg_user_id", tg_user_id)
+
+    async def by_username(self, username: str | None) -> TelegramAccount | None:
+        if not username:
+            return None
+        return await self._lookup("telegram", username)
+
+    def invalidate(self, user: User) -> None:
+        with self._lock:
+            self._generation += 1
+            stale = [
+                key
+                for key, (_, account) in self._entries.items()
+                if key in {("tg_user_id", user.tg_user_id), ("telegram", user.telegram)}
+                or (account is not None and account.id == user.pk)
+            ]
+            for key in stale:
+                del self._entries[key]
+
+    async def sync(self) -> None:
+        """Drop the accounts saved or deleted since they were cached, at most once per ``sync_interval``."""
+        with self._lock:
+            now = time.monotonic()
+            if now < self._next_sync:
+                return
+            self._next_sync = now + self.sync_interval
+            # one account may be cached under both its Telegram id and username, read at different times
+            cached = {(account.id, account.updated_at) for _, account in self._entries.values() if account is not None}
+        if not cached:
+            return
+
+        rows = User.objects.filter(pk__in={pk for pk, _ in cached}).values_list("id", "updated_at")
+        current = {pk: updated_at async for pk, updated_at in rows}
+        changed = {pk for pk, updated_at in cached if current.get(pk) != updated_at}
+        if not changed:
+            return
+        with self._lock:
+            self._generation += 1
+            stale = [
+                key for key, (_, account) in self._entries.items() if account is not None and account.id in changed
+            ]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    async def _lookup(self, field: str, value: Any) -> TelegramAccount | None:  # noqa: ANN401
+        await self.sync()
+        key = (field, value)
+        with self._lock:
+            cached = self._get(key)
+            generation = self._generation
+        if cached is not _MISSING:
+            return cached  # type: ignore[return-value]
+
+        row = (
+            await User.objects.filter(**{field: value})
+            .values("id", "role", "is_approved", "is_active", "tg_user_id", "telegram", "updated_at")
+            .afirst()
+        )
+        account = TelegramAccount(**row) if row is not None else None
+
+        with self._lock:
+            if generation == self._generation:
+                self._set(key, account)
+        return account
+
+    def _get(self, key: tuple[str, Any]) -> TelegramAccount | None | object:
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        expires, account = entry
+        if expires <= time.monotonic():
+            del self._entries[key]
+            return _MISSING
+        self._entries.move_to_end(key)
+        return account
+
+    def _set(self, key: tuple[str, Any], account: TelegramAccount | None) -> None:
+        ttl = self.ttl if account is not None else self.negative_ttl
+        self._entries[key] = (time.monotonic() + ttl, account)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+user_cache = TelegramUserCache(
+    maxsize=settings.TELEGRAM_USER_CACHE_SIZE,
+    ttl=settings.TELEGRAM_USER_CACHE_TTL,
+    sync_interval=settings.TELEGRAM_USER_CACHE_SYNC_INTERVAL,
+)
@@ -1 +1,40 @@
-# Create your views here.
+import hmac
+import json
+
+from django.conf import settings
+from django.http import Http404, HttpRequest, HttpResponse, HttpResponseBadRequest, HttpResponseForbidden
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
+
+from telegram_bot.bot import dp
+from telegram_bot.loop import bot_loop
+
+SECRET_TOKEN_HEADER = "X-Telegram-Bot-Api-Secret-Token"  # noqa: S105
+
+
+@csrf_exempt
+@require_POST
+def telegram_webhook(request: HttpRequest) -> HttpResponse:
+    """
+    Accept an update pushed by Telegram and hand it to the bot.
+
+    The response is sent as soon as the update is queued, so Telegram does not hold the next update back while
+    a handler waits on the database or Google Sheets. As with polling, a failed handler is logged, not redelivered.
+    """
+    secret = settings.TELEGRAM_WEBHOOK_SECRET
+    if not secret or not settings.TELEGRAM_BOT_TOKEN:
+        raise Http404
+
+    received = request.headers.get(SECRET_TOKEN_HEADER, "")
+    if not hmac.compare_digest(received.encode(), secret.encode()):
+        return HttpResponseForbidden()
+
+    try:
+        update = json.loads(request.body)
+    except ValueError:
+        return HttpResponseBadRequest()
+    if not isinstance(update, dict):
+        return HttpResponseBadRequest()
+
+    bot_loop.submit(lambda bot: dp.feed_raw_update(bot, update))
+    return HttpResponse()